@@ -220,7 +220,7 @@ def get_agent_for_task(task: dict, config: dict):
     # 1. Direct department → agent routing (primary path for all known departments)
     if department in AGENT_MAP:
         agent_cls = AGENT_MAP[department]
-        logger.debug(f"AgentRegistry: department routing → {agent_cls.__name__} (dept={department!r})")
+        logger.debug("AgentRegistry: department routing → %s (dept=%r)", agent_cls.__name__, department)
         return agent_cls(config)
 
     # 2. Unknown department: check if user has cross-department access
@@ -252,12 +252,12 @@ class SalesAgent(BaseAgent):
         except ValueError as e:
             return self._err(str(e))
 
-        sent = 0
+        # Compose every follow-up first, then send them in one Graph $batch
+        outbox = []   # (lead, message)
         for lead in leads[:20]:
             lead_email = lead.get("email", "")
             if not lead_email:
                 continue
-            lead_id = lead.get("id", "")
             compose = await email_skill.compose_email(
                 template="followup",
                 recipient_name=str(lead.get("name", "there")),
@@ -266,24 +266,25 @@ class SalesAgent(BaseAgent):
             )
             if compose.get("success"):
                 c = compose["output"]
-                subject = c["subject"]
-                send = await email_skill.send_email(
-                    to=str(lead_email),
-                    subject=subject,
-                    body_html=c["body_html"],
-                )
-                if send.get("success"):
-                    sent += 1
-                    await crm.execute("update_lead", lead_id=lead_id, status="contacted")
-                    if lead_id:
-                        await crm.execute(
-                            "log_lead_activity",
-                            lead_id=lead_id,
-                            type="email_sent",
-                            title="Follow-up email sent",
-                            actor_name="Sam (AI)",
-                            meta={"to": lead_email, "subject": subject},
-                        )
+                outbox.append((lead, {"to": str(lead_email), "subject": c["subject"], "body_html": c["body_html"]}))
+
+        send_results = await email_skill.send_batch([message for _, message in outbox]) if outbox else []
+
+        sent = 0
+        for (lead, message), send in zip(outbox, send_results):
+            if send.get("success"):
+                sent += 1
+                lead_id = lead.get("id", "")
+                await crm.execute("update_lead", lead_id=lead_id, status="contacted")
+                if lead_id:
+                    await crm.execute(
+                        "log_lead_activity",
+                        lead_id=lead_id,
+                        type="email_sent",
+                        title="Follow-up email sent",
+                        actor_name="Sam (AI)",
+                        meta={"to": message["to"], "subject": message["subject"]},
+                    )
         tools_called.extend(["compose_email", "send_email", "update_lead"])
 
         summary = f"Daily follow-up: sent {sent} emails to {len(leads)} stale leads."
@@ -14,7 +14,6 @@ Access: All endpoints require role=admin or role=executive (via require_role).
 
 import asyncio
 import logging
-import os
 import time
 from datetime import datetime, timezone
 from typing import Literal, Optional
@@ -298,23 +297,11 @@ async def system_health(
     System health dashboard.
     Checks DB, Redis, Celery connectivity, and LLM manager status.
     """
-    import redis.asyncio as aioredis
-
     from app.core.database import check_db_connection
+    from app.core.redis_client import ping_redis
 
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-
-    # DB
-    db_ok = await check_db_connection()
-
-    # Redis
-    redis_ok = False
-    try:
-        async with aioredis.from_url(redis_url, decode_responses=True) as r:
-            await r.ping()
-        redis_ok = True
-    except Exception:
-        pass
+    # DB + Redis (independent — probed concurrently)
+    db_ok, redis_ok = await asyncio.gather(check_db_connection(), ping_redis())
 
     # LLM manager — check that Claude client is initialized with a non-empty API key
     llm_ok = False
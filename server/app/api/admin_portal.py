@@ -223,10 +223,8 @@ async def get_system_vitals(
     # Redis check
     redis_ok = False
     try:
-        import redis.asyncio as aioredis
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        async with aioredis.from_url(redis_url, decode_responses=True) as r:
-            await r.ping()
+        from app.core.redis_client import get_redis
+        await get_redis().ping()
         redis_ok = True
     except Exception:
         pass
@@ -44,6 +44,7 @@ from app.core.config import get_config
 from app.core.database import get_db
 from app.core.auth import decode_access_token
 from app.agents.legal_agent import LEGAL_TRIGGERS
+from app.input.enriched import EnrichedInput
 from app.input.input_router import process_input
 from app.context.session_manager import (
     get_or_create_session,
@@ -578,11 +579,14 @@ async def send_artifact(body: SendArtifactRequest, request: Request):
     # Use cached Anthropic file_id for PDFs to skip re-upload on repeat requests
     cached_file_id = getattr(artifact, "anthropic_file_id", None)
     if cached_file_id and file_ext == ".pdf":
-        task["anthropic_file_id"] = cached_file_id
-        task["anthropic_file_name"] = artifact.filename
-        task["extracted_text"] = body.message or "Please analyze this document."
-        task["media_content"] = {"filename": artifact.filename, "extension": file_ext}
-        task["input_summary"] = f"File: {artifact.filename} (cached Files API)"
+        EnrichedInput(
+            input_type="file",
+            extracted_text=body.message or "Please analyze this document.",
+            media_content={"filename": artifact.filename, "extension": file_ext},
+            input_summary=f"File: {artifact.filename} (cached Files API)",
+            anthropic_file_id=cached_file_id,
+            anthropic_file_name=artifact.filename,
+        ).apply_to(task)
     else:
         task = await process_input(task, file_bytes=file_bytes, filename=artifact.filename)
         # Persist a newly obtained file_id so subsequent calls can skip re-upload
@@ -760,22 +764,40 @@ async def websocket_endpoint(websocket: WebSocket):
 
     config = get_config()
 
-    # Register connection
+    # Register connection (also subscribes user:{user_id}:notifications, so
+    # task_complete pushes from Celery reach this socket)
     await ws_manager.connect(websocket, user_id)
 
-    # Initialize speech session for this connection
+    # Initialize speech session for this connection; confirmed words are
+    # pushed as partial transcripts while the user is still speaking
     from app.input.speech_handler import SpeechSession
-    speech_session = SpeechSession(config)
-
-    # Subscribe to Redis notifications channel for this user
-    import redis.asyncio as aioredis
-    _redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    _redis_client = aioredis.from_url(_redis_url)
-    _pubsub = _redis_client.pubsub()
-    await _pubsub.subscribe(f"user:{user_id}:notifications")
-    _redis_task = asyncio.create_task(
-        _listen_redis_notifications(_pubsub, websocket, user_id)
-    )
+
+    async def _send_partial_transcript(text: str) -> None:
+        await ws_manager.send(
+            user_id, format_ws_message("transcript", text=text, is_final=False)
+        )
+
+    speech_session = SpeechSession(config, on_partial=_send_partial_transcript)
+
+    # Camera frames are analysed off the receive loop so a slow vision call
+    # doesn't hold up speech chunks or text; at most one analysis is in flight
+    # and frames arriving meanwhile are dropped (the next one is fresher anyway)
+    camera_task: Optional[asyncio.Task] = None
+
+    async def _analyze_camera_frame(frame_b64: str) -> None:
+        # Nothing awaits this task — log failures here or they vanish
+        try:
+            from app.input.camera_handler import handle_camera_frame
+            result = await handle_camera_frame(frame_b64, config)
+            await ws_manager.send(
+                user_id,
+                format_ws_message(
+                    "camera_analysis",
+                    description=result.get("description", ""),
+                ),
+            )
+        except Exception:
+            logger.exception(f"Camera frame analysis failed: user={user_id}")
 
     try:
         while True:
@@ -818,15 +840,12 @@ async def websocket_endpoint(websocket: WebSocket):
 
             # ── Camera ───────────────────────────────────────────────────────
             if msg_type == "camera_frame":
-                from app.input.camera_handler import handle_camera_frame
-                result = await handle_camera_frame(msg.get("data", ""), config)
-                await ws_manager.send(
-                    user_id,
-                    format_ws_message(
-                        "camera_analysis",
-                        description=result.get("description", ""),
-                    ),
-                )
+                if camera_task is None or camera_task.done():
+                    camera_task = asyncio.create_task(
+                        _analyze_camera_frame(msg.get("data", ""))
+                    )
+                else:
+                    logger.debug("Camera frame dropped (analysis in flight): user=%s", user_id)
                 continue
 
             # ── Text ─────────────────────────────────────────────────────────
@@ -854,30 +873,9 @@ async def websocket_endpoint(websocket: WebSocket):
         except Exception:
             pass
     finally:
-        _redis_task.cancel()
-        try:
-            await _pubsub.unsubscribe(f"user:{user_id}:notifications")
-            await _redis_client.aclose()
-        except Exception:
-            pass
-        await ws_manager.disconnect(user_id)
-
-
-async def _listen_redis_notifications(
-    pubsub,
-    websocket: WebSocket,
-    user_id: str,
-) -> None:
-    """
-    Async task that forwards Redis pub/sub messages to the WebSocket client.
-    Used to deliver task_complete notifications when the Celery task finishes.
-    """
-    async for message in pubsub.listen():
-        if message.get("type") == "message":
-            try:
-                await websocket.send_text(message["data"].decode())
-            except Exception:
-                break
+        if camera_task is not None:
+            camera_task.cancel()
+        await ws_manager.disconnect(user_id, websocket)
 
 
 async def _handle_ws_text(
@@ -216,7 +216,7 @@ async def upload_file(
             config = get_config()
             _task = {"_config": config, "message": ""}
             result = await handle_image(_task, file_bytes, safe_filename)
-            mc = result.get("media_content", {})
+            mc = result.media_content or {}
             image_analysis = {
                 "ocr_text": mc.get("ocr_text", ""),
                 "description": mc.get("description", ""),
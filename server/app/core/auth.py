@@ -15,7 +15,8 @@ from typing import Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-import redis.asyncio as aioredis
+
+from app.core.redis_client import shared_redis
 
 # ── Config ───────────────────────────────────────────────────────────────────
 
@@ -119,7 +120,7 @@ def decode_refresh_token(token: str) -> dict:
 # ── Refresh token blacklist (Redis) ───────────────────────────────────────────
 
 def _get_redis_client():
-    return aioredis.from_url(CONFIG["redis_url"], decode_responses=True)
+    return shared_redis(CONFIG["redis_url"])
 
 
 async def blacklist_refresh_token(jti: str, expires_in_seconds: int) -> None:
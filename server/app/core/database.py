@@ -1,13 +1,17 @@
 """
 Database — SQLAlchemy async engine, session factory, and declarative Base.
 All repositories use get_db() as a FastAPI dependency.
+
+SyncSessionLocal is a small psycopg2-backed session factory for code that
+runs outside any event loop (Celery Beat's DatabaseScheduler).
 """
 
 import os
 import yaml
 from pathlib import Path
+from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 
 def _load_database_url() -> str:
@@ -42,6 +46,7 @@ def _load_pool_config() -> dict:
 
 
 DATABASE_URL = _load_database_url()
+DATABASE_URL_SYNC = DATABASE_URL.replace("postgresql+asyncpg://", "postgresql+psycopg2://")
 _pool_cfg = _load_pool_config()
 
 engine = create_async_engine(
@@ -60,6 +65,17 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
 )
 
+# Sync engine — connects lazily, so processes that never use it open nothing.
+# Beat runs one query per reload interval; a single pooled connection suffices.
+sync_engine = create_engine(
+    DATABASE_URL_SYNC,
+    pool_size=1,
+    max_overflow=0,
+    pool_pre_ping=True,
+)
+
+SyncSessionLocal = sessionmaker(sync_engine, expire_on_commit=False, autoflush=False)
+
 
 class Base(DeclarativeBase):
     """Declarative base for all SQLAlchemy ORM models."""
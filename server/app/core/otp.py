@@ -17,13 +17,13 @@ import json
 import os
 import secrets
 
-import redis.asyncio as aioredis
+from app.core.redis_client import shared_redis
 
 _REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
 
 def _get_redis():
-    return aioredis.from_url(_REDIS_URL, decode_responses=True)
+    return shared_redis(_REDIS_URL)
 
 
 # ── Code generation ───────────────────────────────────────────────────────────
@@ -5,6 +5,9 @@ Limits:
   - General endpoints:  30 req/min per authenticated user ID
   - Auth endpoints:     10 req/min per client IP (prevents brute-force)
 
+If Redis is unreachable the same limits are enforced by a process-local
+sliding window (per worker), so an outage never removes rate limiting.
+
 Usage:
     # In endpoint — raises 429 if over limit
     await check_rate_limit(request, user_id="user-uuid")
@@ -16,13 +19,20 @@ Usage:
         ...
 """
 
+import logging
 import os
+import time
 import uuid
+from collections import deque
 from datetime import datetime, timezone
 
-import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 from fastapi import Depends, HTTPException, Request, status
 
+from app.core.redis_client import shared_redis
+
+logger = logging.getLogger("mezzofy.core.rate_limiter")
+
 # ── Config ────────────────────────────────────────────────────────────────────
 
 _REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -36,55 +46,101 @@ WINDOW_SECONDS = 60   # sliding window duration
 # ── Redis client ──────────────────────────────────────────────────────────────
 
 def _get_redis():
-    return aioredis.from_url(_REDIS_URL, decode_responses=True)
+    return shared_redis(_REDIS_URL)
 
 
 # ── Sliding window algorithm ──────────────────────────────────────────────────
 
-async def _check_limit(key: str, limit: int, window: int = WINDOW_SECONDS) -> tuple[bool, int]:
+async def _check_limit(key: str, limit: int, window: int = WINDOW_SECONDS) -> tuple[bool, int, bool]:
     """
     Redis sliding window rate limiter.
 
     Uses a sorted set with request timestamps as scores.
-    Returns (is_allowed, current_count).
+    Falls back to the process-local window when Redis is unreachable.
+    Returns (is_allowed, current_count, degraded).
     """
     now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
     window_start_ms = now_ms - (window * 1000)
 
-    async with _get_redis() as r:
-        pipe = r.pipeline()
-        # Remove expired entries outside window
-        pipe.zremrangebyscore(key, "-inf", window_start_ms)
-        # Count current requests in window
-        pipe.zcard(key)
-        # Add current request with unique member to prevent collision when
-        # multiple requests arrive within the same millisecond
-        pipe.zadd(key, {f"{now_ms}:{uuid.uuid4().hex[:8]}": now_ms})
-        # Set expiry on the key (auto-cleanup)
-        pipe.expire(key, window + 1)
-        results = await pipe.execute()
+    try:
+        async with _get_redis() as r:
+            pipe = r.pipeline()
+            # Remove expired entries outside window
+            pipe.zremrangebyscore(key, "-inf", window_start_ms)
+            # Count current requests in window
+            pipe.zcard(key)
+            # Add current request with unique member to prevent collision when
+            # multiple requests arrive within the same millisecond
+            pipe.zadd(key, {f"{now_ms}:{uuid.uuid4().hex[:8]}": now_ms})
+            # Set expiry on the key (auto-cleanup)
+            pipe.expire(key, window + 1)
+            results = await pipe.execute()
+    except (RedisError, OSError) as e:
+        logger.warning(f"Redis rate limit check failed for {key}: {e} — using local fallback")
+        allowed, count = _check_local_limit(key, limit, window)
+        return allowed, count, True
 
     current_count = results[1]  # count before adding current request
     is_allowed = current_count < limit
-    return is_allowed, current_count
+    return is_allowed, current_count, False
+
+
+# ── Process-local fallback ────────────────────────────────────────────────────
+
+# key → timestamps (time.monotonic) of allowed requests inside the window.
+# Only consulted while Redis is down; limits are per worker process.
+_local_windows: dict[str, deque] = {}
+_local_last_sweep = 0.0
+
+
+def _check_local_limit(key: str, limit: int, window: int = WINDOW_SECONDS) -> tuple[bool, int]:
+    """In-memory sliding window. Returns (is_allowed, current_count)."""
+    now = time.monotonic()
+    cutoff = now - window
+    _sweep_local_windows(now, cutoff)
+
+    stamps = _local_windows.get(key)
+    if stamps is None:
+        stamps = _local_windows[key] = deque(maxlen=limit)
+    while stamps and stamps[0] <= cutoff:
+        stamps.popleft()
+
+    current_count = len(stamps)
+    if current_count >= limit:
+        return False, current_count
+    stamps.append(now)
+    return True, current_count
+
+
+def _sweep_local_windows(now: float, cutoff: float) -> None:
+    """Drop idle keys at most once per window so the dict cannot grow unbounded."""
+    global _local_last_sweep
+    if now - _local_last_sweep < WINDOW_SECONDS:
+        return
+    _local_last_sweep = now
+    for key in [k for k, stamps in _local_windows.items() if not stamps or stamps[-1] <= cutoff]:
+        del _local_windows[key]
 
 
 # ── Public rate limit checks ──────────────────────────────────────────────────
 
-async def check_rate_limit(request: Request, user_id: str) -> None:
+async def check_rate_limit(request: Request, user_id: str) -> bool:
     """
     Check per-user rate limit (30 req/min).
     Raises HTTP 429 if exceeded.
     Call this in endpoints that have an authenticated user.
+
+    Returns True if the check ran against the local fallback (Redis down).
     """
     key = f"rl:user:{user_id}"
-    allowed, count = await _check_limit(key, USER_LIMIT)
+    allowed, count, degraded = await _check_limit(key, USER_LIMIT)
     if not allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=f"Rate limit exceeded. Max {USER_LIMIT} requests per minute.",
             headers={"Retry-After": str(WINDOW_SECONDS)},
         )
+    return degraded
 
 
 async def check_auth_rate_limit(request: Request) -> None:
@@ -95,7 +151,7 @@ async def check_auth_rate_limit(request: Request) -> None:
     """
     client_ip = _get_client_ip(request)
     key = f"rl:ip:{client_ip}"
-    allowed, count = await _check_limit(key, AUTH_LIMIT)
+    allowed, count, _ = await _check_limit(key, AUTH_LIMIT)
     if not allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -35,6 +35,12 @@ def get_role_permissions(role: str) -> list[str]:
     return role_def.get("permissions", [])
 
 
+@lru_cache(maxsize=None)
+def get_role_permission_set(role: str) -> frozenset[str]:
+    """Frozenset view of get_role_permissions() — cached per role for O(1) checks."""
+    return frozenset(get_role_permissions(role))
+
+
 def get_role_department(role: str) -> Optional[str]:
     """Return the department a role belongs to."""
     roles = _load_roles()
@@ -49,10 +55,8 @@ def has_permission(role: str, permission: str) -> bool:
     Check if a role has a specific permission.
     Admin role ("*") always returns True.
     """
-    permissions = get_role_permissions(role)
-    if "*" in permissions:
-        return True
-    return permission in permissions
+    permissions = get_role_permission_set(role)
+    return "*" in permissions or permission in permissions
 
 
 def has_any_permission(role: str, permissions: list[str]) -> bool:
@@ -0,0 +1,75 @@
+"""
+Shared async Redis client.
+
+The rate limiter, OTP store, token blacklist and /health used to build a new
+client — and with it a new connection pool — on every call. get_redis() hands
+out one pooled client per Redis URL instead, so request-path lookups reuse
+idle connections rather than reconnecting each time.
+
+Connections belong to the event loop that opened them, and the API and each
+Celery worker process (app/tasks/worker_loop.py) run their own loops — so
+clients are kept per loop and dropped with it, as with the LLM HTTP pools
+(app/llm/http_client.py).
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import redis.asyncio as aioredis
+
+logger = logging.getLogger("mezzofy.core.redis")
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# event loop → {redis url → client}
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, aioredis.Redis]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_redis(url: Optional[str] = None) -> aioredis.Redis:
+    """
+    Return the pooled client for `url` (default REDIS_URL) on the running
+    event loop, creating it on first use.
+
+    Callers must not close it — use it directly, or via shared_redis().
+    """
+    url = url or REDIS_URL
+    loop_clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = loop_clients.get(url)
+    if client is None:
+        client = loop_clients[url] = aioredis.from_url(url, decode_responses=True)
+        logger.debug("Shared Redis client created")
+    return client
+
+
+@asynccontextmanager
+async def shared_redis(url: Optional[str] = None) -> AsyncIterator[aioredis.Redis]:
+    """
+    `async with shared_redis() as r:` — borrows the pooled client without
+    closing it on exit (unlike `async with aioredis.from_url(...)`).
+    """
+    yield get_redis(url)
+
+
+async def ping_redis() -> bool:
+    """True if Redis answers PING on the pooled client (health checks)."""
+    try:
+        await get_redis().ping()
+        return True
+    except Exception:
+        return False
+
+
+async def close_redis_clients() -> None:
+    """Close the running loop's pooled clients (called on app shutdown)."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    for client in (_clients.pop(loop, None) or {}).values():
+        await client.aclose()
@@ -4,7 +4,8 @@ Gateway Middleware — runs on every /chat/* request.
 Responsibilities (in order):
     1. Extract JWT from Authorization: Bearer header
     2. Validate token (decode + type check)
-    3. Check rate limit (30 req/min per user via Redis)
+    3. Check rate limit (30 req/min per user via Redis; process-local fallback
+       when Redis is down, advertised with X-RateLimit-Degraded: true)
     4. Write audit log entry (non-blocking)
     5. Attach decoded user payload to request.state.user
 
@@ -101,8 +102,9 @@ class ChatGatewayMiddleware(BaseHTTPMiddleware):
             return _json_401("Token payload missing user_id")
 
         # ── Step 3: Rate limit ───────────────────────────────────────────────
+        rate_limit_degraded = False
         try:
-            await check_rate_limit(request, user_id=user_id)
+            rate_limit_degraded = await check_rate_limit(request, user_id=user_id)
         except Exception as exc:
             # check_rate_limit raises HTTPException for 429 — re-wrap as JSONResponse
             if hasattr(exc, "status_code") and exc.status_code == 429:
@@ -119,6 +121,8 @@ class ChatGatewayMiddleware(BaseHTTPMiddleware):
 
         # ── Step 5: Forward to endpoint ──────────────────────────────────────
         response = await call_next(request)
+        if rate_limit_degraded:
+            response.headers["X-RateLimit-Degraded"] = "true"
 
         # ── Step 6: Audit log (non-blocking, best-effort) ────────────────────
         duration_ms = int((time.monotonic() - start_time) * 1000)
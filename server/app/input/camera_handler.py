@@ -4,18 +4,27 @@ Camera Handler — processes live camera frames from the mobile app.
 Called from the WebSocket handler in chat.py at ~1 fps.
 Each call analyzes a single base64-encoded JPEG frame via ImageOps.
 
+Frames are passed to ImageOps as base64 (image_bytes), the same contract
+image_handler.handle_image uses — no temp file is written per frame.
+
 This is NOT routed through input_router.py — it is called directly
 from the WebSocket loop on every camera_frame message.
 """
 
-import base64
 import logging
-import os
-import tempfile
-from typing import Optional
+
+# pybase64 (optional) is a SIMD drop-in for the stdlib base64 module
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+from app.tools.media import image_ops as _image_ops_module
 
 logger = logging.getLogger("mezzofy.input.camera")
 
+_FRAME_PROMPT = "Describe what you see in this camera frame."
+
 
 async def handle_camera_frame(frame_b64: str, config: dict) -> dict:
     """
@@ -31,23 +40,19 @@ async def handle_camera_frame(frame_b64: str, config: dict) -> dict:
             "description": str,  — vision analysis of the frame
         }
     """
-    # Decode base64
+    # Decode once to reject malformed frames before they reach the vision API
     try:
-        frame_bytes = base64.b64decode(frame_b64)
+        _b64.b64decode(frame_b64)
     except Exception as e:
         logger.warning(f"Failed to decode camera frame: {e}")
         return {"success": False, "description": "Invalid frame data"}
 
-    tmp_path: Optional[str] = None
     try:
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
-            tmp.write(frame_bytes)
-            tmp_path = tmp.name
-
-        from app.tools.media.image_ops import ImageOps
-        image_ops = ImageOps(config)
+        image_ops = _image_ops_module.ImageOps(config)
 
-        result = await image_ops.execute("analyze_image", image_path=tmp_path)
+        result = await image_ops.execute(
+            "analyze_image", image_bytes=frame_b64, prompt=_FRAME_PROMPT
+        )
         if result.get("success"):
             return {"success": True, "description": result.get("output", "")}
         return {"success": False, "description": "Frame analysis failed"}
@@ -55,10 +60,3 @@ async def handle_camera_frame(frame_b64: str, config: dict) -> dict:
     except Exception as e:
         logger.warning(f"Camera frame analysis error: {e}")
         return {"success": False, "description": str(e)}
-
-    finally:
-        if tmp_path:
-            try:
-                os.unlink(tmp_path)
-            except Exception:
-                pass
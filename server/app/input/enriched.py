@@ -0,0 +1,32 @@
+"""
+EnrichedInput — the fields an input handler adds to a task.
+
+Handlers return one of these instead of a dict; process_input() writes it
+into the task dict with apply_to(). The task itself stays a plain dict —
+it is JSON-serialised into Celery and read with task.get() by every agent —
+so only the handler → router hop is typed.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class EnrichedInput:
+    input_type: str
+    extracted_text: str                      # text representation for the LLM
+    media_content: Optional[dict]            # structured metadata from media processing
+    input_summary: str                       # human-readable description of the input
+    anthropic_file_id: Optional[str] = None  # set when the upload went to the Files API
+    anthropic_file_name: Optional[str] = None
+
+    def apply_to(self, task: dict) -> dict:
+        """Write these fields into task (in place) and return it."""
+        task["input_type"] = self.input_type
+        task["extracted_text"] = self.extracted_text
+        task["media_content"] = self.media_content
+        task["input_summary"] = self.input_summary
+        if self.anthropic_file_id is not None:
+            task["anthropic_file_id"] = self.anthropic_file_id
+            task["anthropic_file_name"] = self.anthropic_file_name
+        return task
@@ -9,14 +9,16 @@ Supported formats and extraction libraries:
   XLSX  → pandas
   DOC   → python-docx (legacy Word 97-2003, best-effort)
   PPT   → python-pptx (legacy PowerPoint 97-2003, best-effort)
-  TXT   → plain UTF-8 read
+  TXT   → UTF-8 decode of the uploaded bytes (no temp file)
 """
 
 import asyncio
 import logging
 import os
 import tempfile
-from typing import Optional
+from typing import Awaitable, Callable, Optional
+
+from app.input.enriched import EnrichedInput
 
 logger = logging.getLogger("mezzofy.input.file")
 
@@ -58,7 +60,7 @@ async def handle_file(
     task: dict,
     file_bytes: bytes,
     filename: str,
-) -> dict:
+) -> EnrichedInput:
     """
     Extract text from an uploaded document file.
 
@@ -68,7 +70,7 @@ async def handle_file(
         filename:   Original filename (used for extension detection).
 
     Returns:
-        Task dict enriched with extracted_text from the document content.
+        EnrichedInput — extracted_text from the document content.
     """
     config = task.get("_config", {})
     ext = os.path.splitext(filename)[1].lower()
@@ -83,55 +85,63 @@ async def handle_file(
         )
         if file_id:
             user_msg = (task.get("message") or "").strip()
-            return {
-                **task,
-                "input_type": "file",
-                "anthropic_file_id": file_id,
-                "anthropic_file_name": filename,
-                "extracted_text": user_msg or "Please analyze this document.",
-                "media_content": {"filename": filename, "extension": ".pdf"},
-                "input_summary": f"File: {filename} (uploaded via Files API)",
-            }
+            return EnrichedInput(
+                input_type="file",
+                anthropic_file_id=file_id,
+                anthropic_file_name=filename,
+                extracted_text=user_msg or "Please analyze this document.",
+                media_content={"filename": filename, "extension": ".pdf"},
+                input_summary=f"File: {filename} (uploaded via Files API)",
+            )
         logger.warning(
             f"handle_file: Files API upload failed for {filename!r} — falling back to pypdf"
         )
     # ── End Files API path ────────────────────────────────────────────────────
 
+    bytes_extractor = _BYTES_EXTRACTORS.get(ext)
+    if bytes_extractor is not None:
+        # Already in memory — no temp file round-trip needed
+        extracted = bytes_extractor(file_bytes)
+    else:
+        extracted = await _extract_via_tempfile(ext, file_bytes, config)
+    extracted = extracted[:_MAX_EXTRACTED_CHARS]
+
+    parts = []
+    if extracted:
+        parts.append(
+            f"[Document content from '{filename}':\n{extracted}]"
+        )
+    user_msg = (task.get("message") or "").strip()
+    if user_msg:
+        parts.append(user_msg)
+
+    return EnrichedInput(
+        input_type="file",
+        extracted_text=(
+            "\n\n".join(parts)
+            if parts
+            else f"[File '{filename}' uploaded — no text extracted]"
+        ),
+        media_content={
+            "filename": filename,
+            "extension": ext,
+            "extracted_chars": len(extracted),
+        },
+        input_summary=(
+            f"File: {filename} ({len(extracted):,} chars extracted)"
+        ),
+    )
+
+
+async def _extract_via_tempfile(ext: str, file_bytes: bytes, config: dict) -> str:
+    """Write bytes to a temp file for path-based parsers, extract, then clean up."""
     tmp_path: Optional[str] = None
     try:
         with tempfile.NamedTemporaryFile(suffix=ext or ".bin", delete=False) as tmp:
             tmp.write(file_bytes)
             tmp_path = tmp.name
 
-        extracted = await _extract_by_extension(ext, tmp_path, config)
-        extracted = extracted[:_MAX_EXTRACTED_CHARS]
-
-        parts = []
-        if extracted:
-            parts.append(
-                f"[Document content from '{filename}':\n{extracted}]"
-            )
-        user_msg = (task.get("message") or "").strip()
-        if user_msg:
-            parts.append(user_msg)
-
-        return {
-            **task,
-            "input_type": "file",
-            "extracted_text": (
-                "\n\n".join(parts)
-                if parts
-                else f"[File '{filename}' uploaded — no text extracted]"
-            ),
-            "media_content": {
-                "filename": filename,
-                "extension": ext,
-                "extracted_chars": len(extracted),
-            },
-            "input_summary": (
-                f"File: {filename} ({len(extracted):,} chars extracted)"
-            ),
-        }
+        return await _extract_by_extension(ext, tmp_path, config)
 
     finally:
         if tmp_path:
@@ -143,110 +153,159 @@ async def handle_file(
 
 async def _extract_by_extension(ext: str, file_path: str, config: dict) -> str:
     """Route to the correct extraction method by file extension."""
+    extractor = _EXTRACTORS.get(ext)
+    if extractor is None:
+        logger.warning(f"No extractor for extension: {ext!r}")
+        return ""
+    return await extractor(file_path, config)
 
-    if ext == ".pdf":
-        try:
-            from app.tools.document.pdf_ops import PDFOps
-            ops = PDFOps(config)
-            result = await ops.execute("read_pdf", file_path=file_path)
-            if not result.get("success"):
-                return ""
-            data = result.get("output", {})
-            pages = data.get("pages", []) if isinstance(data, dict) else []
-            return "\n\n".join(p.get("text", "") for p in pages if p.get("text"))
-        except Exception as e:
-            logger.warning(f"PDF extraction failed: {e}")
-            return ""
 
-    if ext == ".docx":
-        try:
-            from app.tools.document.docx_ops import DocxOps
-            result = await DocxOps(config).execute("read_docx", file_path=file_path)
-            data = result.get("output", {}) if result.get("success") else {}
-            parts = [p["text"] for p in data.get("paragraphs", []) if p.get("text")]
-            for table in data.get("tables", []):
-                for row in table.get("rows", []):
-                    parts.append("  |  ".join(cell for cell in row if cell))
-            return "\n".join(parts)
-        except Exception as e:
-            logger.warning(f"DOCX extraction failed: {e}")
-            return ""
+# ── Per-format extractors ─────────────────────────────────────────────────────
 
-    if ext == ".pptx":
-        try:
-            from app.tools.document.pptx_ops import PPTXOps
-            result = await PPTXOps(config).execute("read_pptx", file_path=file_path)
-            data = result.get("output", {}) if result.get("success") else {}
-            parts = []
-            for slide in data.get("slides", []):
-                parts.extend(slide.get("text", []))
-                if slide.get("notes"):
-                    parts.append(f"[Notes: {slide['notes']}]")
-            return "\n".join(parts)
-        except Exception as e:
-            logger.warning(f"PPTX extraction failed: {e}")
+async def _extract_pdf(file_path: str, config: dict) -> str:
+    try:
+        from app.tools.document.pdf_ops import PDFOps
+        ops = PDFOps(config)
+        result = await ops.execute("read_pdf", file_path=file_path)
+        if not result.get("success"):
             return ""
+        data = result.get("output", {})
+        pages = data.get("pages", []) if isinstance(data, dict) else []
+        return "\n\n".join(p.get("text", "") for p in pages if p.get("text"))
+    except Exception as e:
+        logger.warning(f"PDF extraction failed: {e}")
+        return ""
 
-    if ext == ".csv":
-        try:
-            from app.tools.document.csv_ops import CSVOps
-            result = await CSVOps(config).execute("read_csv", file_path=file_path, max_rows=500)
-            data = result.get("output", {}) if result.get("success") else {}
-            headers = data.get("headers", [])
-            rows = data.get("rows", [])
-            lines = ["  |  ".join(str(h) for h in headers)] if headers else []
-            for row in rows:
-                lines.append("  |  ".join(str(v) for v in row))
-            summary = data.get("numeric_summary", {})
-            if summary:
-                lines.append("\n[Column Summary]")
-                for col, stats in summary.items():
-                    lines.append(f"  {col}: min={stats.get('min')}, max={stats.get('max')}, mean={stats.get('mean'):.2f}")
-            return "\n".join(lines)
-        except Exception as e:
-            logger.warning(f"CSV extraction failed: {e}")
-            return ""
 
-    if ext == ".doc":
-        try:
-            import docx as python_docx
-            doc = python_docx.Document(file_path)
-            return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
-        except Exception:
-            return (
-                "[Note: This file is in legacy Word 97-2003 (.doc) format which could not be "
-                "fully parsed. For best results, please re-save as .docx and re-upload.]"
-            )
+async def _extract_docx(file_path: str, config: dict) -> str:
+    try:
+        from app.tools.document.docx_ops import DocxOps
+        result = await DocxOps(config).execute("read_docx", file_path=file_path)
+        data = result.get("output", {}) if result.get("success") else {}
+        parts = [p["text"] for p in data.get("paragraphs", []) if p.get("text")]
+        for table in data.get("tables", []):
+            for row in table.get("rows", []):
+                parts.append("  |  ".join(cell for cell in row if cell))
+        return "\n".join(parts)
+    except Exception as e:
+        logger.warning(f"DOCX extraction failed: {e}")
+        return ""
 
-    if ext == ".ppt":
-        try:
-            from pptx import Presentation
-            prs = Presentation(file_path)
-            texts = [shape.text.strip() for slide in prs.slides
-                     for shape in slide.shapes if hasattr(shape, "text") and shape.text.strip()]
-            return "\n".join(texts)
-        except Exception:
-            return (
-                "[Note: This file is in legacy PowerPoint 97-2003 (.ppt) format which could not be "
-                "fully parsed. For best results, please re-save as .pptx and re-upload.]"
-            )
 
-    if ext in (".xlsx", ".xls"):
-        try:
-            import pandas as pd
-            df = pd.read_excel(file_path, nrows=100)
-            return df.to_string(index=False)
-        except Exception as e:
-            logger.warning(f"Excel extraction failed: {e}")
-            return ""
+async def _extract_pptx(file_path: str, config: dict) -> str:
+    try:
+        from app.tools.document.pptx_ops import PPTXOps
+        result = await PPTXOps(config).execute("read_pptx", file_path=file_path)
+        data = result.get("output", {}) if result.get("success") else {}
+        parts = []
+        for slide in data.get("slides", []):
+            parts.extend(slide.get("text", []))
+            if slide.get("notes"):
+                parts.append(f"[Notes: {slide['notes']}]")
+        return "\n".join(parts)
+    except Exception as e:
+        logger.warning(f"PPTX extraction failed: {e}")
+        return ""
+
+
+async def _extract_csv(file_path: str, config: dict) -> str:
+    try:
+        from app.tools.document.csv_ops import CSVOps
+        result = await CSVOps(config).execute("read_csv", file_path=file_path, max_rows=500)
+        data = result.get("output", {}) if result.get("success") else {}
+        headers = data.get("headers", [])
+        rows = data.get("rows", [])
+        lines = ["  |  ".join(str(h) for h in headers)] if headers else []
+        for row in rows:
+            lines.append("  |  ".join(str(v) for v in row))
+        summary = data.get("numeric_summary", {})
+        if summary:
+            lines.append("\n[Column Summary]")
+            for col, stats in summary.items():
+                lines.append(f"  {col}: min={stats.get('min')}, max={stats.get('max')}, mean={stats.get('mean'):.2f}")
+        return "\n".join(lines)
+    except Exception as e:
+        logger.warning(f"CSV extraction failed: {e}")
+        return ""
+
+
+# The extractors below call synchronous parsers directly — run them in the
+# default executor so a multi-MB upload doesn't stall the event loop.
+
+async def _extract_doc(file_path: str, config: dict) -> str:
+    try:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _read_legacy_doc, file_path)
+    except Exception:
+        return (
+            "[Note: This file is in legacy Word 97-2003 (.doc) format which could not be "
+            "fully parsed. For best results, please re-save as .docx and re-upload.]"
+        )
+
+
+async def _extract_ppt(file_path: str, config: dict) -> str:
+    try:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _read_legacy_ppt, file_path)
+    except Exception:
+        return (
+            "[Note: This file is in legacy PowerPoint 97-2003 (.ppt) format which could not be "
+            "fully parsed. For best results, please re-save as .pptx and re-upload.]"
+        )
+
+
+async def _extract_excel(file_path: str, config: dict) -> str:
+    try:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _read_excel, file_path)
+    except Exception as e:
+        logger.warning(f"Excel extraction failed: {e}")
+        return ""
+
+
+_EXTRACTORS: dict[str, Callable[[str, dict], Awaitable[str]]] = {
+    ".pdf": _extract_pdf,
+    ".docx": _extract_docx,
+    ".pptx": _extract_pptx,
+    ".csv": _extract_csv,
+    ".doc": _extract_doc,
+    ".ppt": _extract_ppt,
+    ".xlsx": _extract_excel,
+    ".xls": _extract_excel,
+}
+
+
+# ── In-memory extractors (no temp file) ───────────────────────────────────────
+
+def _decode_text(file_bytes: bytes) -> str:
+    # UTF-8 is at most 4 bytes per char — never decode more than can survive truncation
+    return file_bytes[:_MAX_EXTRACTED_CHARS * 4].decode("utf-8", errors="replace")
+
+
+_BYTES_EXTRACTORS: dict[str, Callable[[bytes], str]] = {
+    ".txt": _decode_text,
+    ".md": _decode_text,
+    ".rst": _decode_text,
+}
+
+
+# ── Synchronous parsers (run via run_in_executor) ─────────────────────────────
+
+def _read_legacy_doc(file_path: str) -> str:
+    import docx as python_docx
+    doc = python_docx.Document(file_path)
+    return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
+
+
+def _read_legacy_ppt(file_path: str) -> str:
+    from pptx import Presentation
+    prs = Presentation(file_path)
+    texts = [shape.text.strip() for slide in prs.slides
+             for shape in slide.shapes if hasattr(shape, "text") and shape.text.strip()]
+    return "\n".join(texts)
 
-    if ext in (".txt", ".md", ".rst"):
-        try:
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                return f.read()
-        except Exception as e:
-            logger.warning(f"Text read failed: {e}")
-            return ""
 
-    logger.warning(f"No extractor for extension: {ext!r}")
-    return ""
+def _read_excel(file_path: str) -> str:
+    import pandas as pd
+    df = pd.read_excel(file_path, nrows=100)
+    return df.to_string(index=False)
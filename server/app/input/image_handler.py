@@ -8,17 +8,28 @@ Processing pipeline (primary):
 
 Fallback (if Files API upload fails):
   1. Base64-encode image bytes
-  2. Vision analysis via ImageOps.analyze_image (Claude Vision inline)
-  3. OCR text extraction via ImageOps.ocr_image (Tesseract — optional)
+  2. Vision analysis via ImageOps.analyze_image (Claude Vision inline) and
+  3. OCR text extraction via ImageOps.ocr_image (Tesseract — optional), run concurrently
   4. Combine results into extracted_text for the LLM
 """
 
 import asyncio
-import base64
 import logging
 import os
 from typing import Optional
 
+# SIMD base64 codec when available; stdlib-compatible API either way
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+from app.input.enriched import EnrichedInput
+
+# Media ops are bound as modules (not classes) at import time across the input
+# handlers: no per-request import lookup, and ImageOps is still resolved per call.
+from app.tools.media import image_ops as _image_ops_module
+
 logger = logging.getLogger("mezzofy.input.image")
 
 _IMAGE_MIME_TYPES = {
@@ -68,7 +79,7 @@ async def handle_image(
     task: dict,
     file_bytes: bytes,
     filename: str,
-) -> dict:
+) -> EnrichedInput:
     """
     Process an uploaded image via Anthropic Files API (primary) or inline base64 (fallback).
 
@@ -78,7 +89,7 @@ async def handle_image(
         filename:   Original filename for extension and MIME type detection.
 
     Returns:
-        Task dict enriched with anthropic_file_id (Files API path) or
+        EnrichedInput with anthropic_file_id (Files API path) or
         extracted_text (fallback path), plus media_content metadata.
     """
     config = task.get("_config", {})
@@ -92,43 +103,43 @@ async def handle_image(
         None, _upload_image_to_files_api_sync, file_bytes, filename, mime_type, config
     )
     if file_id:
-        return {
-            **task,
-            "input_type": "image",
-            "anthropic_file_id": file_id,
-            "anthropic_file_name": filename,
-            "extracted_text": user_msg or "Please analyze this image.",
-            "media_content": {"filename": filename, "extension": ext, "mime_type": mime_type},
-            "input_summary": f"Image: {filename} (uploaded via Files API)",
-        }
+        return EnrichedInput(
+            input_type="image",
+            anthropic_file_id=file_id,
+            anthropic_file_name=filename,
+            extracted_text=user_msg or "Please analyze this image.",
+            media_content={"filename": filename, "extension": ext, "mime_type": mime_type},
+            input_summary=f"Image: {filename} (uploaded via Files API)",
+        )
     # ── End Files API path ────────────────────────────────────────────────────
 
     logger.warning(f"handle_image: Files API upload failed for {filename!r} — falling back to inline vision")
 
     # ── Fallback: inline base64 vision analysis ────────────────────────────────
-    image_b64 = base64.b64encode(file_bytes).decode()
+    image_b64 = _b64.b64encode(file_bytes).decode()
+
+    image_ops = _image_ops_module.ImageOps(config)
 
-    from app.tools.media.image_ops import ImageOps
-    image_ops = ImageOps(config)
+    # OCR (optional — Tesseract may not be installed) and vision analysis hit
+    # independent backends, so run them concurrently: latency = max, not sum.
+    vision_prompt = user_msg or "Describe what you see in this image in detail."
+    ocr_result, analyze_result = await asyncio.gather(
+        image_ops.execute("ocr_image", image_bytes=image_b64),
+        image_ops.execute("analyze_image", image_bytes=image_b64, prompt=vision_prompt),
+        return_exceptions=True,
+    )
 
-    # OCR (optional — Tesseract may not be installed)
     ocr_text = ""
-    try:
-        ocr_result = await image_ops.execute("ocr_image", image_bytes=image_b64)
-        if ocr_result.get("success"):
-            ocr_text = (ocr_result.get("output") or "").strip()
-    except Exception as e:
-        logger.warning(f"OCR failed for {filename}: {e}")
+    if isinstance(ocr_result, BaseException):
+        logger.warning(f"OCR failed for {filename}: {ocr_result}")
+    elif ocr_result.get("success"):
+        ocr_text = (ocr_result.get("output") or "").strip()
 
-    # Vision analysis via inline base64
     description = ""
-    try:
-        vision_prompt = user_msg or "Describe what you see in this image in detail."
-        analyze_result = await image_ops.execute("analyze_image", image_bytes=image_b64, prompt=vision_prompt)
-        if analyze_result.get("success"):
-            description = (analyze_result.get("output") or "").strip()
-    except Exception as e:
-        logger.warning(f"Vision analysis failed for {filename}: {e}")
+    if isinstance(analyze_result, BaseException):
+        logger.warning(f"Vision analysis failed for {filename}: {analyze_result}")
+    elif analyze_result.get("success"):
+        description = (analyze_result.get("output") or "").strip()
 
     # Build extracted_text for LLM
     parts = []
@@ -143,18 +154,17 @@ async def handle_image(
         "\n".join(parts) if parts else "[Image uploaded — no content extracted]"
     )
 
-    return {
-        **task,
-        "input_type": "image",
-        "extracted_text": extracted_text,
-        "media_content": {
+    return EnrichedInput(
+        input_type="image",
+        extracted_text=extracted_text,
+        media_content={
             "filename": filename,
             "ocr_text": ocr_text,
             "description": description,
         },
-        "input_summary": (
+        input_summary=(
             f"Image: {filename} — {description[:100]}"
             if description
             else f"Image: {filename}"
         ),
-    }
+    )
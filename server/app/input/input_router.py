@@ -1,7 +1,10 @@
 """
 Input Router — detects input type and dispatches to the correct handler.
 
-All handlers return a copy of the task dict enriched with:
+All handlers return an EnrichedInput (app/input/enriched.py) holding only the
+fields they add — process_input writes them into the task dict in place (no
+copy of the task, which carries _config):
+  input_type      — the handler's input type
   extracted_text  — text representation for the LLM (text + media context)
   media_content   — structured metadata from the media processing
   input_summary   — human-readable description of what was processed
@@ -13,11 +16,43 @@ speech and camera inputs are NOT routed here — they are handled directly
 inside the WebSocket handler in chat.py (streaming, real-time).
 """
 
+import asyncio
+import importlib
 import logging
+from types import ModuleType
 from typing import Optional
 
 logger = logging.getLogger("mezzofy.input.router")
 
+# input_type → (handler module, handler function, default filename).
+# A default filename marks handlers that take (task, file_bytes, filename);
+# None marks handlers that take only the task.
+_HANDLER_SPECS: dict[str, tuple[str, str, Optional[str]]] = {
+    "text":  ("app.input.text_handler", "handle_text", None),
+    "url":   ("app.input.url_handler", "handle_url", None),
+    "image": ("app.input.image_handler", "handle_image", "image.jpg"),
+    "video": ("app.input.video_handler", "handle_video", "video.mp4"),
+    "audio": ("app.input.audio_handler", "handle_audio", "audio.mp3"),
+    "file":  ("app.input.file_handler", "handle_file", "document"),
+}
+
+# Upper bound on handler calls doing I/O or media work (scrape, OCR, Whisper,
+# document parsing) in flight per process; text passthrough is not counted
+_MAX_CONCURRENT_HANDLERS = 32
+_INPUT_SEM = asyncio.Semaphore(_MAX_CONCURRENT_HANDLERS)
+
+# Handler modules imported on first use (keeps server boot free of media deps).
+# The module is cached rather than the function so the handler attribute is
+# still resolved per call.
+_HANDLER_MODULES: dict[str, ModuleType] = {}
+
+
+def _get_module(input_type: str, module_name: str) -> ModuleType:
+    module = _HANDLER_MODULES.get(input_type)
+    if module is None:
+        module = _HANDLER_MODULES[input_type] = importlib.import_module(module_name)
+    return module
+
 
 async def process_input(
     task: dict,
@@ -33,47 +68,32 @@ async def process_input(
         filename:   Original filename for type detection.
 
     Returns:
-        Task dict with extracted_text, media_content, input_summary populated.
+        The same task dict, updated with extracted_text, media_content and
+        input_summary (callers keep their own copy if they need the original).
     """
     input_type = task.get("input_type", "text")
 
-    if input_type == "text":
-        from app.input.text_handler import handle_text
-        return await handle_text(task)
-
-    if input_type == "image":
-        from app.input.image_handler import handle_image
-        return await handle_image(task, file_bytes or b"", filename or "image.jpg")
-
-    if input_type == "video":
-        from app.input.video_handler import handle_video
-        return await handle_video(task, file_bytes or b"", filename or "video.mp4")
-
-    if input_type == "audio":
-        from app.input.audio_handler import handle_audio
-        return await handle_audio(task, file_bytes or b"", filename or "audio.mp3")
-
-    if input_type == "file":
-        from app.input.file_handler import handle_file
-        return await handle_file(task, file_bytes or b"", filename or "document")
-
-    if input_type == "url":
-        from app.input.url_handler import handle_url
-        return await handle_url(task)
+    spec = _HANDLER_SPECS.get(input_type)
+    if spec is not None:
+        module_name, func_name, default_filename = spec
+        handler = getattr(_get_module(input_type, module_name), func_name)
+        if input_type == "text":
+            return (await handler(task)).apply_to(task)
+        async with _INPUT_SEM:
+            if default_filename is None:
+                enriched = await handler(task)
+            else:
+                enriched = await handler(task, file_bytes or b"", filename or default_filename)
+        return enriched.apply_to(task)
 
     # speech and camera handled by WebSocket — passthrough here
     if input_type in ("speech", "camera"):
-        return {
-            **task,
-            "extracted_text": task.get("message", ""),
-            "media_content": None,
-            "input_summary": f"{input_type} input (processed by WebSocket handler)",
-        }
-
-    logger.warning(f"Unknown input_type={input_type!r} — treating as text")
-    return {
-        **task,
-        "extracted_text": task.get("message", ""),
-        "media_content": None,
-        "input_summary": f"Unknown input type: {input_type}",
-    }
+        summary = f"{input_type} input (processed by WebSocket handler)"
+    else:
+        logger.warning(f"Unknown input_type={input_type!r} — treating as text")
+        summary = f"Unknown input type: {input_type}"
+
+    task["extracted_text"] = task.get("message", "")
+    task["media_content"] = None
+    task["input_summary"] = summary
+    return task
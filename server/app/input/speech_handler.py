@@ -6,41 +6,213 @@ The mobile app sends audio in chunks:
   {"type": "speech_audio", "data": "<base64 chunk>"}  (repeated)
   {"type": "speech_end"}
 
-SpeechSession accumulates chunks and transcribes on end via AudioOps.
-One SpeechSession instance per WebSocket connection (per user session).
+Chunks are raw 16 kHz mono 16-bit little-endian PCM, or 16-bit PCM WAV at any
+rate / channel count (the RIFF header is stripped — from every chunk that
+carries one — and the samples are downmixed and resampled to 16 kHz mono with
+NumPy on ingest). SpeechSession transcribes them incrementally while the user
+is still speaking (LocalAgreement-2 policy):
+  - every _MIN_CHUNK_SECONDS of new audio, the buffered window is re-transcribed
+    with word timestamps via AudioOps.transcribe_pcm (no temp file)
+  - words that two consecutive hypotheses agree on are committed and pushed to
+    the client as a partial transcript (on_partial callback)
+  - the audio buffer is trimmed behind the last committed word, so each update
+    only reprocesses the unconfirmed tail
+On speech_end only that tail is left to transcribe.
+
+If the first chunk is a compressed container (M4A, OGG, WebM, non-16-bit WAV,
+...) the session falls back to buffering the whole utterance and transcribing it once.
 
+One SpeechSession instance per WebSocket connection (per user session).
 The final transcript is returned and treated as a normal text message.
 """
 
-import base64
+import asyncio
 import logging
-import os
-import tempfile
-from typing import Optional
+import struct
+from typing import Awaitable, Callable, Optional
+
+# pybase64 (optional) is a SIMD drop-in for stdlib base64 — ~50 chunks/s land here
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+from app.tools.media import audio_ops as _audio_ops_module
 
 logger = logging.getLogger("mezzofy.input.speech")
 
+_PCM = "pcm"
+_SAMPLE_RATE = 16000
+_BYTES_PER_SECOND = _SAMPLE_RATE * 2          # int16 mono
+
+# Re-transcribe once at least this much new audio has arrived
+_MIN_CHUNK_SECONDS = 1.0
+_MIN_CHUNK_BYTES = int(_BYTES_PER_SECOND * _MIN_CHUNK_SECONDS)
+
+# Initial capacity of the session's int16 PCM buffer (grown by doubling if an
+# utterance goes this long without a committed word)
+_PCM_CAPACITY_SECONDS = 30
+
+# Committed text passed back to Whisper as context (initial_prompt)
+_PROMPT_CHARS = 200
+
+# Leading-byte signatures of container formats the streaming path can't decode
+_CONTAINER_SIGNATURES = (
+    (b"RIFF", "wav"),
+    (b"OggS", "ogg"),
+    (b"fLaC", "flac"),
+    (b"ID3", "mp3"),
+    (b"\xff\xfb", "mp3"),
+    (b"\xff\xf3", "mp3"),
+    (b"\xff\xf2", "mp3"),
+    (b"\x1a\x45\xdf\xa3", "webm"),
+    (b"#!AMR", "amr"),
+)
+
+Word = tuple[float, float, str]   # (start_s, end_s, text) on the session timeline
+
+
+def _sniff_container(chunk: bytes) -> Optional[str]:
+    """Return a file extension if the chunk starts a known container, else None."""
+    if chunk[4:8] == b"ftyp":
+        return "m4a"
+    for signature, ext in _CONTAINER_SIGNATURES:
+        if chunk.startswith(signature):
+            return ext
+    return None
+
+
+def _parse_wav_header(chunk: bytes) -> Optional[tuple[int, int, int]]:
+    """
+    Parse a RIFF/WAVE header at the start of chunk.
+
+    Returns (sample_rate, channels, data_offset) for 16-bit integer PCM, or
+    None if the chunk has no complete header or holds another sample format.
+    """
+    if len(chunk) < 12 or chunk[:4] != b"RIFF" or chunk[8:12] != b"WAVE":
+        return None
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(chunk):
+        chunk_id = chunk[pos:pos + 4]
+        size = int.from_bytes(chunk[pos + 4:pos + 8], "little")
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            if size < 16 or body + 16 > len(chunk):
+                return None
+            audio_format, channels, sample_rate = struct.unpack_from("<HHI", chunk, body)
+            (bits,) = struct.unpack_from("<H", chunk, body + 14)
+            fmt = (audio_format, channels, sample_rate, bits)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            audio_format, channels, sample_rate, bits = fmt
+            # 1 = PCM, 0xFFFE = WAVE_FORMAT_EXTENSIBLE (PCM sub-format at 16 bits)
+            if audio_format not in (1, 0xFFFE) or bits != 16 or not channels or not sample_rate:
+                return None
+            return sample_rate, channels, body
+        pos = body + size + (size & 1)
+    return None
+
+
+class _PcmConverter:
+    """
+    Downmix interleaved int16 PCM to mono and resample it to _SAMPLE_RATE,
+    one chunk at a time. Linear interpolation; the read position and last
+    sample carry over between chunks so chunk boundaries add no drift or clicks.
+    """
+
+    __slots__ = ("_channels", "_step", "_pos", "_last", "_partial")
+
+    def __init__(self, sample_rate: int, channels: int):
+        self._channels = channels
+        self._step = sample_rate / _SAMPLE_RATE     # input samples per output sample
+        self._pos = 0.0                             # next output position, input-sample units
+        self._last = None                           # last input sample of the previous chunk
+        self._partial = b""                         # trailing bytes of an incomplete frame
+
+    def convert(self, chunk: bytes) -> bytes:
+        import numpy as np
+
+        data = self._partial + chunk
+        usable = len(data) - len(data) % (2 * self._channels)
+        self._partial = data[usable:]
+        if not usable:
+            return b""
+
+        x = np.frombuffer(data, dtype="<i2", count=usable // 2).astype(np.float32)
+        if self._channels > 1:
+            x = x.reshape(-1, self._channels).mean(axis=1)
+
+        if self._step != 1.0:
+            if self._last is not None:
+                x = np.concatenate((np.array([self._last], dtype=np.float32), x))
+            end = len(x) - 1
+            n_out = int((end - self._pos) // self._step) + 1 if self._pos <= end else 0
+            positions = self._pos + self._step * np.arange(n_out)
+            self._pos = self._pos + self._step * n_out - end
+            self._last = x[-1]
+            x = np.interp(positions, np.arange(len(x)), x)
+
+        return np.clip(np.rint(x), -32768, 32767).astype("<i2").tobytes()
+
+
+def _norm(word: str) -> str:
+    return word.strip()
+
 
 class SpeechSession:
     """
     Manages a single live speech capture session for one WebSocket connection.
 
     Lifecycle:
-      1. start()          — begins accumulation, clears previous chunks
-      2. add_chunk(b64)   — appends decoded audio bytes
-      3. end_and_transcribe() → str — concatenates + transcribes, returns text
+      1. start()          — begins accumulation, clears previous state
+      2. add_chunk(b64)   — appends decoded audio; schedules an incremental
+                            transcription update every _MIN_CHUNK_SECONDS
+      3. end_and_transcribe() → str — transcribes the unconfirmed tail,
+                            returns the full text
     """
 
-    __slots__ = ("_config", "_chunks", "_active")
+    __slots__ = (
+        "_config", "_chunks", "_active", "_format", "_on_partial",
+        "_pcm", "_pcm_start", "_pcm_end", "_odd_byte",
+        "_buffer_offset", "_pending_bytes",
+        "_confirmed_words", "_last_confirmed_ts", "_prev_hypothesis",
+        "_lock", "_update_task", "_converter",
+    )
 
-    def __init__(self, config: dict):
+    def __init__(
+        self,
+        config: dict,
+        on_partial: Optional[Callable[[str], Awaitable[None]]] = None,
+    ):
         self._config = config
-        self._chunks: list[bytes] = []
+        self._on_partial = on_partial
         self._active = False
+        self._lock = asyncio.Lock()
+        self._update_task: Optional[asyncio.Task] = None
+        self._pcm = None                             # np.int16 buffer, kept across utterances
+        self._reset()
+
+    def _reset(self) -> None:
+        self._chunks = bytearray()                   # container fallback only
+        self._format: Optional[str] = None           # None until the first chunk
+        self._converter: Optional[_PcmConverter] = None   # WAV input not already 16 kHz mono
+        self._pcm_start = 0                          # unconfirmed window is _pcm[start:end]
+        self._pcm_end = 0
+        self._odd_byte = b""                         # half a sample left over from a chunk
+        self._buffer_offset = 0.0                    # seconds trimmed from the front
+        self._pending_bytes = 0                      # bytes since the last scheduled update
+        self._confirmed_words: list[str] = []
+        self._last_confirmed_ts = 0.0
+        self._prev_hypothesis: list[Word] = []
 
     def start(self) -> None:
         """Begin a new speech capture session."""
-        self._chunks = []
+        if self._update_task is not None and not self._update_task.done():
+            self._update_task.cancel()
+        self._update_task = None
+        self._reset()
         self._active = True
         logger.debug("Speech session started")
 
@@ -50,37 +222,212 @@ class SpeechSession:
             logger.warning("Received audio chunk outside active speech session")
             return
         try:
-            chunk = base64.b64decode(audio_b64)
-            self._chunks.append(chunk)
+            chunk = _b64.b64decode(audio_b64)
         except Exception as e:
             logger.warning(f"Failed to decode audio chunk: {e}")
+            return
+        if not chunk:
+            return
+
+        if self._format is None:
+            wav = _parse_wav_header(chunk)
+            if wav is not None:
+                sample_rate, channels, chunk = wav[0], wav[1], chunk[wav[2]:]
+                self._format = _PCM
+                if sample_rate != _SAMPLE_RATE or channels != 1:
+                    self._converter = _PcmConverter(sample_rate, channels)
+            else:
+                self._format = _sniff_container(chunk) or _PCM
+        elif self._format == _PCM and chunk[:4] == b"RIFF":
+            # Some clients wrap every chunk in its own WAV header
+            wav = _parse_wav_header(chunk)
+            if wav is not None:
+                chunk = chunk[wav[2]:]
+        if self._format != _PCM:
+            self._chunks.extend(chunk)
+            return
+
+        if self._converter is not None:
+            chunk = self._converter.convert(chunk)
+
+        self._append_pcm(chunk)
+        self._pending_bytes += len(chunk)
+        if self._pending_bytes >= _MIN_CHUNK_BYTES and (
+            self._update_task is None or self._update_task.done()
+        ):
+            try:
+                self._update_task = asyncio.get_running_loop().create_task(self._update())
+            except RuntimeError:
+                return  # no running loop — the tail is handled by end_and_transcribe
+            self._pending_bytes = 0
+
+    def _append_pcm(self, chunk: bytes) -> None:
+        """Copy int16 PCM bytes into the preallocated sample buffer."""
+        import numpy as np
+
+        if self._odd_byte:
+            chunk = self._odd_byte + chunk
+            self._odd_byte = b""
+        if len(chunk) & 1:
+            chunk, self._odd_byte = chunk[:-1], chunk[-1:]
+        samples = np.frombuffer(chunk, dtype="<i2")   # view — no copy
+        n = len(samples)
+        if not n:
+            return
+
+        if self._pcm is None:
+            self._pcm = np.empty(_PCM_CAPACITY_SECONDS * _SAMPLE_RATE, dtype="<i2")
+        if self._pcm_end + n > len(self._pcm):
+            # Slide the unconfirmed window back to the front, growing if it won't fit
+            live = self._pcm_end - self._pcm_start
+            target = self._pcm
+            if live + n > len(target):
+                target = np.empty(max(2 * len(target), live + n), dtype="<i2")
+            target[:live] = self._pcm[self._pcm_start:self._pcm_end]
+            self._pcm = target
+            self._pcm_start, self._pcm_end = 0, live
+
+        self._pcm[self._pcm_end:self._pcm_end + n] = samples
+        self._pcm_end += n
+
+    def _buffered_samples(self):
+        """View of the unconfirmed int16 window (None before the first PCM chunk)."""
+        if self._pcm is None:
+            return None
+        return self._pcm[self._pcm_start:self._pcm_end]
+
+    @property
+    def confirmed_text(self) -> str:
+        """Text committed so far (stable — will not change in later updates)."""
+        return "".join(self._confirmed_words).strip()
+
+    # ── Incremental transcription ─────────────────────────────────────────────
+
+    async def _update(self) -> None:
+        """Re-transcribe the buffered window and commit the agreed prefix."""
+        async with self._lock:
+            if not self._active:
+                return  # end_and_transcribe owns the final pass
+            words = await self._transcribe_buffer()
+            committed = self._commit(words, final=False)
+
+        if committed and self._on_partial is not None:
+            try:
+                await self._on_partial(self.confirmed_text)
+            except Exception as e:
+                logger.debug(f"Partial transcript delivery failed: {e}")
+
+    async def _transcribe_buffer(self) -> list[Word]:
+        """Transcribe the current buffer; returns words on the session timeline."""
+        if self._pcm_end == self._pcm_start:
+            return []
+        import numpy as np
+
+        # astype copies, so chunks arriving during the await can't alter this window
+        samples = self._buffered_samples().astype(np.float32) / 32768.0
+        offset = self._buffer_offset
+        prompt = self.confirmed_text[-_PROMPT_CHARS:] or None
+
+        audio_ops = _audio_ops_module.AudioOps(self._config)
+        result = await audio_ops.transcribe_pcm(samples, prompt=prompt)
+        if not result.get("success"):
+            logger.debug("Incremental transcription failed: %s", result.get("error"))
+            return []
+        return [
+            (w["start"] + offset, w["end"] + offset, w["word"])
+            for w in result["output"].get("words", [])
+        ]
+
+    def _commit(self, words: list[Word], final: bool) -> list[Word]:
+        """
+        LocalAgreement-2: commit the longest prefix shared by this hypothesis and
+        the previous one. With final=True every new word is committed.
+        """
+        # Drop words already behind the commit point
+        new = [w for w in words if w[0] > self._last_confirmed_ts - 0.1]
+
+        # Whisper often re-emits the last committed words at the head of the new
+        # hypothesis — strip the longest 1..5-gram that repeats the committed tail
+        if new and self._confirmed_words and abs(new[0][0] - self._last_confirmed_ts) < 1.0:
+            max_n = min(len(self._confirmed_words), len(new), 5)
+            for n in range(max_n, 0, -1):
+                tail = [_norm(w) for w in self._confirmed_words[-n:]]
+                head = [_norm(w[2]) for w in new[:n]]
+                if tail == head:
+                    new = new[n:]
+                    break
+
+        if final:
+            committed = new
+            self._prev_hypothesis = []
+        else:
+            committed = []
+            for current, previous in zip(new, self._prev_hypothesis):
+                if _norm(current[2]) != _norm(previous[2]):
+                    break
+                committed.append(current)
+            self._prev_hypothesis = new[len(committed):]
+
+        if committed:
+            self._confirmed_words.extend(w[2] for w in committed)
+            self._last_confirmed_ts = committed[-1][1]
+            self._trim_buffer(self._last_confirmed_ts)
+        return committed
+
+    def _trim_buffer(self, timestamp: float) -> None:
+        """Drop buffered audio before `timestamp` (seconds on the session timeline)."""
+        cut = int((timestamp - self._buffer_offset) * _SAMPLE_RATE)
+        if cut <= 0:
+            return
+        cut = min(cut, self._pcm_end - self._pcm_start)
+        self._pcm_start += cut
+        self._buffer_offset += cut / _SAMPLE_RATE
+
+    # ── Finalisation ──────────────────────────────────────────────────────────
 
     async def end_and_transcribe(self) -> str:
         """
-        Finalize and transcribe all accumulated audio chunks.
+        Finalize the session and return the full transcript.
 
-        Concatenates raw bytes → writes to temp WAV → calls AudioOps.transcribe_audio.
+        Raw PCM: waits for any in-flight update, transcribes the unconfirmed
+        tail and appends it to the committed text.
+        Container audio: transcribes the whole buffered utterance once.
         Returns the transcript string (empty string on failure).
         """
         self._active = False
+
+        if self._format is not None and self._format != _PCM:
+            return await self._transcribe_container()
+
+        try:
+            async with self._lock:
+                words = await self._transcribe_buffer()
+                self._commit(words, final=True)
+                transcript = self.confirmed_text
+            logger.debug(f"Speech transcription complete: {len(transcript)} chars")
+            return transcript
+        except Exception as e:
+            logger.error(f"Speech transcription failed: {e}")
+            return self.confirmed_text
+        finally:
+            self._reset()
+
+    async def _transcribe_container(self) -> str:
+        """Transcribe a buffered compressed utterance in one shot."""
         if not self._chunks:
             logger.debug("Speech session ended with no audio chunks")
             return ""
 
-        combined = b"".join(self._chunks)
-        self._chunks = []
+        combined = self._chunks      # _reset() below swaps in a fresh bytearray
+        file_extension = self._format
+        self._reset()
 
-        tmp_path: Optional[str] = None
         try:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                tmp.write(combined)
-                tmp_path = tmp.name
-
-            from app.tools.media.audio_ops import AudioOps
-            audio_ops = AudioOps(self._config)
-
-            result = await audio_ops.execute("transcribe_audio", audio_path=tmp_path)
-            transcript = result.get("output", "") if result.get("success") else ""
+            audio_ops = _audio_ops_module.AudioOps(self._config)
+            result = await audio_ops.execute(
+                "transcribe_audio", audio_bytes=combined, file_extension=file_extension
+            )
+            transcript = (result.get("output") or {}).get("text", "") if result.get("success") else ""
             logger.debug(
                 f"Speech transcription complete: {len(transcript)} chars"
             )
@@ -90,13 +437,6 @@ class SpeechSession:
             logger.error(f"Speech transcription failed: {e}")
             return ""
 
-        finally:
-            if tmp_path:
-                try:
-                    os.unlink(tmp_path)
-                except Exception:
-                    pass
-
     @property
     def is_active(self) -> bool:
         return self._active
@@ -8,23 +8,24 @@ consistent interface regardless of input type.
 
 import logging
 
+from app.input.enriched import EnrichedInput
+
 logger = logging.getLogger("mezzofy.input.text")
 
 
-async def handle_text(task: dict) -> dict:
+async def handle_text(task: dict) -> EnrichedInput:
     """
     Passthrough handler for plain text messages.
 
-    Returns task enriched with:
+    Returns an EnrichedInput with:
         extracted_text  — the raw message string
         media_content   — None
         input_summary   — brief character count summary
     """
     message = task.get("message", "")
-    return {
-        **task,
-        "input_type": "text",
-        "extracted_text": message,
-        "media_content": None,
-        "input_summary": f"Text message ({len(message)} chars)",
-    }
+    return EnrichedInput(
+        input_type="text",
+        extracted_text=message,
+        media_content=None,
+        input_summary=f"Text message ({len(message)} chars)",
+    )
@@ -5,23 +5,49 @@ Uses ScrapingOps (Phase 3) for text extraction.
 Validates URL format and blocks internal/loopback addresses before fetching.
 """
 
+import ipaddress
 import logging
+import socket
+from functools import lru_cache
+from typing import Optional, Union
 from urllib.parse import urlparse
 
+from app.input.enriched import EnrichedInput
+
 logger = logging.getLogger("mezzofy.input.url")
 
-# Block patterns for internal/unsafe hosts
-_BLOCKED_HOSTS = {
-    "localhost", "127.0.0.1", "0.0.0.0",
-    "169.254.169.254",  # AWS metadata endpoint
-    "::1",
-}
+# Internal host names (IP literals are checked against _BLOCKED_NETS)
+_BLOCKED_HOSTS = frozenset({
+    "localhost",
+    "metadata.google.internal",
+})
+
+# Loopback, private, link-local (incl. 169.254.169.254 cloud metadata) and CGNAT ranges
+_BLOCKED_NETS = tuple(
+    ipaddress.ip_network(net)
+    for net in (
+        "0.0.0.0/8",
+        "10.0.0.0/8",
+        "100.64.0.0/10",
+        "127.0.0.0/8",
+        "169.254.0.0/16",
+        "172.16.0.0/12",
+        "192.168.0.0/16",
+        "::/128",
+        "::1/128",
+        "fc00::/7",
+        "fe80::/10",
+    )
+)
+
+_NUMERIC_HOST_CHARS = frozenset("0123456789abcdefx.")
 
 # Max characters from scraped page to include in extracted_text
 _MAX_CONTENT_CHARS = 6000
+_STRIP_SLACK_CHARS = 256
 
 
-async def handle_url(task: dict) -> dict:
+async def handle_url(task: dict) -> EnrichedInput:
     """
     Fetch a URL and extract text content for the LLM.
 
@@ -31,7 +57,7 @@ async def handle_url(task: dict) -> dict:
         task: Task dict with _config, url (optional), and message.
 
     Returns:
-        Task dict enriched with extracted_text containing the page content.
+        EnrichedInput — extracted_text holds the page content.
     """
     config = task.get("_config", {})
     url = (task.get("url") or task.get("message", "")).strip()
@@ -40,13 +66,12 @@ async def handle_url(task: dict) -> dict:
     validation_error = _validate_url(url)
     if validation_error:
         logger.warning(f"URL rejected: {validation_error} — {url!r}")
-        return {
-            **task,
-            "input_type": "url",
-            "extracted_text": f"[URL rejected: {validation_error}]",
-            "media_content": None,
-            "input_summary": f"URL: {url} (rejected — {validation_error})",
-        }
+        return EnrichedInput(
+            input_type="url",
+            extracted_text=f"[URL rejected: {validation_error}]",
+            media_content=None,
+            input_summary=f"URL: {url} (rejected — {validation_error})",
+        )
 
     # Scrape
     from app.tools.web.scraping_ops import ScrapingOps
@@ -54,9 +79,12 @@ async def handle_url(task: dict) -> dict:
 
     content = ""
     try:
-        result = await scraping.execute("scrape_text", url=url)
+        result = await scraping.execute("scrape_url", url=url)
         if result.get("success"):
-            content = (result.get("output") or "").strip()[:_MAX_CONTENT_CHARS]
+            page_text = (result.get("output") or {}).get("text") or ""
+            # Cap before stripping — pages can be MBs and only the head is kept;
+            # the slack lets strip() drop leading whitespace without losing payload
+            content = page_text[:_MAX_CONTENT_CHARS + _STRIP_SLACK_CHARS].strip()[:_MAX_CONTENT_CHARS]
     except Exception as e:
         logger.warning(f"Scraping failed for {url!r}: {e}")
 
@@ -72,19 +100,41 @@ async def handle_url(task: dict) -> dict:
     if user_addendum:
         parts.append(user_addendum)
 
-    return {
-        **task,
-        "input_type": "url",
-        "extracted_text": "\n\n".join(parts),
-        "media_content": {"url": url, "content": content},
-        "input_summary": (
+    return EnrichedInput(
+        input_type="url",
+        extracted_text="\n\n".join(parts),
+        media_content={"url": url, "content": content},
+        input_summary=(
             f"URL: {url} ({len(content):,} chars scraped)"
             if content
             else f"URL: {url} (fetch failed)"
         ),
-    }
+    )
+
 
+def _parse_ip_host(host: str) -> Optional[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]]:
+    """
+    Return the IP address a host literal refers to, or None for a DNS name.
 
+    Besides dotted-quad and IPv6, accepts the inet_aton forms HTTP clients
+    also resolve (2130706433, 0x7f.1, 0177.0.0.1) so they can't dodge the
+    private-range check.
+    """
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        if not set(host) <= _NUMERIC_HOST_CHARS:
+            return None
+        try:
+            ip = ipaddress.IPv4Address(socket.inet_aton(host))
+        except OSError:
+            return None
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        return ip.ipv4_mapped
+    return ip
+
+
+@lru_cache(maxsize=1024)
 def _validate_url(url: str) -> str:
     """
     Validate URL format and block internal/dangerous hosts.
@@ -105,15 +155,11 @@ def _validate_url(url: str) -> str:
     if not host:
         return "missing host"
 
-    if host in _BLOCKED_HOSTS:
+    ip = _parse_ip_host(host)
+    if ip is not None:
+        if any(ip in net for net in _BLOCKED_NETS):
+            return f"blocked private network: {host}"
+    elif host in _BLOCKED_HOSTS:
         return f"blocked host: {host}"
 
-    # Block 10.x, 172.16-31.x, 192.168.x internal ranges (simple check)
-    if (
-        host.startswith("10.")
-        or host.startswith("192.168.")
-        or any(host.startswith(f"172.{n}.") for n in range(16, 32))
-    ):
-        return f"blocked private network: {host}"
-
     return ""
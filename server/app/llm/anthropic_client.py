@@ -9,12 +9,22 @@ Config section: config["llm"]["claude"]
 
 import asyncio
 import logging
-from typing import Any, AsyncIterator, Optional
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Optional, Union
 
 import httpx
 
+from app.llm import json_codec
+from app.llm.http_client import get_shared_http_client
+from app.llm.streaming import coalesce_deltas
+
 logger = logging.getLogger("mezzofy.llm.anthropic")
 
+# Formatted tool lists kept per client, keyed by id() of the ToolExecutor list
+_TOOL_CACHE_SIZE = 16
+
+_RETRY_STATUS = {429, 500, 529}
+
 
 class AnthropicClient:
     """
@@ -24,6 +34,9 @@ class AnthropicClient:
     native format (type/name/description/input_schema).
     """
 
+    # LLMManager starts tools while the turn is still streaming (stream_with_tools)
+    supports_tool_streaming = True
+
     _BASE_SYSTEM_PROMPT = (
         "You are a helpful AI assistant. Be concise and direct. "
         "Format responses clearly using markdown where appropriate. "
@@ -51,7 +64,9 @@ class AnthropicClient:
                 write=30.0,
                 pool=10.0,
             ),
+            http_client=get_shared_http_client(anthropic),
         )
+        self._tool_cache: OrderedDict[int, tuple[list[dict], int, list[dict]]] = OrderedDict()
         logger.info(f"AnthropicClient ready (model={self._model})")
 
     @property
@@ -62,7 +77,7 @@ class AnthropicClient:
         self,
         messages: list[dict],
         tools: Optional[list[dict]] = None,
-        system: Optional[str] = None,
+        system: Optional[Union[str, list[dict]]] = None,
         max_tokens: Optional[int] = None,
     ) -> dict:
         """
@@ -72,7 +87,8 @@ class AnthropicClient:
             messages: Conversation history in Anthropic format.
                       [{"role": "user"|"assistant", "content": str | list}, ...]
             tools: Optional list of tool definitions in Anthropic function-calling format.
-            system: System prompt string. Overrides default if provided.
+            system: System prompt string, or text blocks (with cache_control
+                    breakpoints). Overrides default if provided.
             max_tokens: Override max_tokens for this request.
 
         Returns:
@@ -84,39 +100,8 @@ class AnthropicClient:
                 "model": str,
             }
         """
-        effective_system = system or self._BASE_SYSTEM_PROMPT
-
-        kwargs: dict[str, Any] = {
-            "model": self._model,
-            "max_tokens": max_tokens or self._max_tokens,
-            "messages": self._sanitize_messages(messages),
-        }
-
-        if effective_system:
-            kwargs["system"] = effective_system
-
-        if tools:
-            # Convert from ToolExecutor format to Anthropic tool format
-            kwargs["tools"] = self._format_tools(tools)
+        kwargs = self._build_request(messages, tools, system, max_tokens)
 
-        # Add Files API beta header when any message contains a document or image-via-file block
-        def _is_files_api_block(b: dict) -> bool:
-            if b.get("type") == "document":
-                return True
-            if b.get("type") == "image":
-                src = b.get("source", {})
-                return isinstance(src, dict) and src.get("type") == "file"
-            return False
-
-        _has_files_api = any(
-            isinstance(m.get("content"), list)
-            and any(isinstance(b, dict) and _is_files_api_block(b) for b in m["content"])
-            for m in kwargs["messages"]
-        )
-        if _has_files_api:
-            kwargs["extra_headers"] = {"anthropic-beta": "files-api-2025-04-14"}
-
-        _RETRY_STATUS = {429, 500, 529}
         # 429 rate-limit: wait for the token-per-minute bucket to refill (30–60s).
         # 500/529 server errors and timeouts: short exponential backoff is fine.
         _RATE_LIMIT_DELAYS = [30, 60, 60]
@@ -132,11 +117,7 @@ class AnthropicClient:
             except Exception as e:
                 status = getattr(e, "status_code", None)
                 is_rate_limit = status == 429
-                is_retryable = (
-                    status in _RETRY_STATUS
-                    or "timeout" in str(e).lower()
-                    or "connection" in str(e).lower()
-                )
+                is_retryable = self._is_retryable(e)
                 delays = _RATE_LIMIT_DELAYS if is_rate_limit else _SERVER_ERROR_DELAYS
                 if is_retryable and attempt <= len(delays):
                     delay = delays[attempt - 1]
@@ -151,15 +132,78 @@ class AnthropicClient:
                 raise
         raise last_exc  # unreachable guard
 
+    async def stream_with_tools(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        system: Optional[Union[str, list[dict]]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        chat() over a streamed response, so tool calls can start early.
+
+        Yields ("tool_use", tool_call) as soon as each tool_use block has fully
+        decoded, then ("response", <same dict as chat()>) last.
+
+        The caller may already be running a yielded tool, so the turn is never
+        replayed after the first tool_use: if the stream breaks later, the
+        response is completed from the tool calls, text and usage received so
+        far. Retryable failures before that fall back to chat() and its retry
+        policy.
+        """
+        kwargs = self._build_request(messages, tools, system, max_tokens)
+        emitted: list[dict] = []
+        text_parts: list[str] = []
+        usage = {"input_tokens": 0, "output_tokens": 0}
+        try:
+            async with self._client.messages.stream(**kwargs) as stream:
+                async for event in stream:
+                    if event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                        block = event.content_block
+                        tool_call = {"id": block.id, "name": block.name, "arguments": block.input}
+                        emitted.append(tool_call)
+                        yield "tool_use", tool_call
+                    elif event.type == "content_block_delta" and event.delta.type == "text_delta":
+                        text_parts.append(event.delta.text)
+                    elif event.type == "message_start":
+                        usage["input_tokens"] = event.message.usage.input_tokens
+                        usage["output_tokens"] = event.message.usage.output_tokens
+                    elif event.type == "message_delta":
+                        usage["output_tokens"] = event.usage.output_tokens  # cumulative
+                final = await stream.get_final_message()
+        except Exception as e:
+            if emitted:
+                logger.warning(
+                    f"AnthropicClient.stream_with_tools: stream failed after "
+                    f"{len(emitted)} tool call(s): {e} — completing the turn with them"
+                )
+                yield "response", {
+                    "content": "".join(text_parts),
+                    "tool_calls": emitted,
+                    "stop_reason": "tool_use",
+                    "usage": usage,
+                    "model": self._model,
+                }
+                return
+            if not self._is_retryable(e):
+                logger.error(f"AnthropicClient.stream_with_tools failed: {e}")
+                raise
+            logger.warning(f"AnthropicClient.stream_with_tools failed: {e} — retrying via chat()")
+            yield "response", await self.chat(messages, tools=tools, system=system, max_tokens=max_tokens)
+            return
+
+        yield "response", self._parse_response(final)
+
     async def stream_chat(
         self,
         messages: list[dict],
-        system: Optional[str] = None,
+        system: Optional[Union[str, list[dict]]] = None,
     ) -> AsyncIterator[str]:
         """
-        Stream a chat response token by token (for WebSocket delivery).
+        Stream a chat response (for WebSocket delivery).
 
-        Yields text chunks as they arrive from the API.
+        Yields text as it arrives from the API, with token deltas coalesced
+        into chunks of up to ~64 chars / 25 ms (see coalesce_deltas).
         """
         kwargs: dict[str, Any] = {
             "model": self._model,
@@ -171,7 +215,7 @@ class AnthropicClient:
 
         try:
             async with self._client.messages.stream(**kwargs) as stream:
-                async for text in stream.text_stream:
+                async for text in coalesce_deltas(stream.text_stream):
                     yield text
         except Exception as e:
             logger.error(f"AnthropicClient.stream_chat failed: {e}")
@@ -179,6 +223,56 @@ class AnthropicClient:
 
     # ── Private helpers ───────────────────────────────────────────────────────
 
+    def _build_request(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]],
+        system: Optional[Union[str, list[dict]]],
+        max_tokens: Optional[int],
+    ) -> dict[str, Any]:
+        """messages.create() / messages.stream() kwargs for a chat turn."""
+        effective_system = system or self._BASE_SYSTEM_PROMPT
+
+        kwargs: dict[str, Any] = {
+            "model": self._model,
+            "max_tokens": max_tokens or self._max_tokens,
+            "messages": self._sanitize_messages(messages),
+        }
+
+        if effective_system:
+            kwargs["system"] = effective_system
+
+        if tools:
+            # Convert from ToolExecutor format to Anthropic tool format
+            kwargs["tools"] = self._format_tools(tools)
+
+        # Add Files API beta header when any message contains a document or image-via-file block
+        def _is_files_api_block(b: dict) -> bool:
+            if b.get("type") == "document":
+                return True
+            if b.get("type") == "image":
+                src = b.get("source", {})
+                return isinstance(src, dict) and src.get("type") == "file"
+            return False
+
+        _has_files_api = any(
+            isinstance(m.get("content"), list)
+            and any(isinstance(b, dict) and _is_files_api_block(b) for b in m["content"])
+            for m in kwargs["messages"]
+        )
+        if _has_files_api:
+            kwargs["extra_headers"] = {"anthropic-beta": "files-api-2025-04-14"}
+        return kwargs
+
+    @staticmethod
+    def _is_retryable(e: Exception) -> bool:
+        """Rate limits, server errors, timeouts and dropped connections."""
+        return (
+            getattr(e, "status_code", None) in _RETRY_STATUS
+            or "timeout" in str(e).lower()
+            or "connection" in str(e).lower()
+        )
+
     @staticmethod
     def _sanitize_messages(messages: list[dict]) -> list[dict]:
         """
@@ -192,6 +286,27 @@ class AnthropicClient:
         ]
 
     def _format_tools(self, tools: list[dict]) -> list[dict]:
+        """
+        Return _build_tools(tools), memoised per tools list.
+
+        chat() is called with the same ToolExecutor list on every tool-loop
+        iteration, so the formatted list is built once per list. Entries hold a
+        reference to the source list (so its id() can't be reused) and its
+        length (so a list that grew is rebuilt).
+        """
+        key = id(tools)
+        cached = self._tool_cache.get(key)
+        if cached is not None and cached[0] is tools and cached[1] == len(tools):
+            self._tool_cache.move_to_end(key)
+            return cached[2]
+
+        formatted = self._build_tools(tools)
+        self._tool_cache[key] = (tools, len(tools), formatted)
+        if len(self._tool_cache) > _TOOL_CACHE_SIZE:
+            self._tool_cache.popitem(last=False)
+        return formatted
+
+    def _build_tools(self, tools: list[dict]) -> list[dict]:
         """
         Convert ToolExecutor definition format to Anthropic tool format.
 
@@ -223,12 +338,12 @@ class AnthropicClient:
 
         Returns dict with content, tool_calls, stop_reason, usage, model.
         """
-        content_text = ""
+        text_parts = []
         tool_calls = []
 
         for block in response.content:
             if block.type == "text":
-                content_text += block.text
+                text_parts.append(block.text)
             elif block.type == "tool_use":
                 tool_calls.append({
                     "id": block.id,
@@ -237,7 +352,7 @@ class AnthropicClient:
                 })
 
         return {
-            "content": content_text,
+            "content": "".join(text_parts),
             "tool_calls": tool_calls if tool_calls else None,
             "stop_reason": response.stop_reason,
             "usage": {
@@ -259,8 +374,7 @@ class AnthropicClient:
         """
         content = result.get("output") or result.get("error") or ""
         if isinstance(content, dict):
-            import json
-            content = json.dumps(content)
+            content = json_codec.dumps(content)
         elif not isinstance(content, str):
             content = str(content)
 
@@ -284,7 +398,7 @@ class AnthropicClient:
         client_tools: list = None,
         betas: list = None,
         container: dict = None,
-        system: str = None,
+        system: Optional[Union[str, list[dict]]] = None,
         max_tokens: int = 8192,
     ) -> dict:
         """
@@ -0,0 +1,81 @@
+"""
+Circuit breaker for the LLM backends.
+
+LLMManager keeps one breaker per backend (Claude, Kimi). After
+`failure_threshold` consecutive failed calls the breaker opens, and for the
+next `recovery_timeout` seconds calls to that backend raise CircuitOpen
+immediately — the manager fails over to the other backend without waiting
+for another connect/read timeout on a wedged provider. Once the cooldown
+has passed a single trial call is let through (half-open): success closes
+the breaker, failure re-opens it for another cooldown.
+
+State is per process and needs no locking: transitions happen between
+awaits on the event loop thread.
+"""
+
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger("mezzofy.llm.breaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling a backend whose breaker is open."""
+
+
+class CircuitBreaker:
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._trial_started = None
+        return self._state
+
+    def is_open(self) -> bool:
+        """True while calls would be rejected (open, or half-open with a trial running)."""
+        state = self.state
+        if state == HALF_OPEN and self._trial_started is not None:
+            # A trial that never reported back (cancelled caller) stops blocking after a cooldown
+            return time.monotonic() - self._trial_started < self.recovery_timeout
+        return state == OPEN
+
+    def before_call(self) -> None:
+        """Raise CircuitOpen if the backend should not be called right now."""
+        if self.is_open():
+            raise CircuitOpen(f"{self.name} circuit open")
+        if self._state == HALF_OPEN:
+            self._trial_started = time.monotonic()
+
+    def record_success(self) -> None:
+        if self._state != CLOSED:
+            logger.info(f"Circuit {self.name}: trial call succeeded — closed")
+        self._state = CLOSED
+        self._failures = 0
+        self._trial_started = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != OPEN:
+                logger.warning(
+                    f"Circuit {self.name}: opened after {self._failures} consecutive failures "
+                    f"— skipping for {self.recovery_timeout:.0f}s"
+                )
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._trial_started = None
@@ -0,0 +1,77 @@
+"""
+Shared HTTP transport for the LLM SDK clients.
+
+AnthropicClient and KimiClient pass get_shared_http_client(sdk) as the SDK's
+http_client, so every client instance in the process reuses one keep-alive
+pool per SDK (HTTP/2 when `h2` is installed) instead of each instance opening
+its own with httpx's default of 5 idle connections.
+
+The pool is built with the SDK's own DefaultAsyncHttpxClient: each SDK only
+accepts a client from the httpx package it was built against, and each talks
+to a single API host, so one pool per SDK is the same as one pool per host.
+
+httpx connections belong to the event loop that opened them, and the API and
+each Celery worker process (app/tasks/worker_loop.py) run their own loops — so
+pools are kept per loop and dropped with it.
+"""
+
+import asyncio
+import logging
+import weakref
+from types import ModuleType
+from typing import Any, Optional
+
+logger = logging.getLogger("mezzofy.llm.http")
+
+_MAX_CONNECTIONS = 200
+_MAX_KEEPALIVE_CONNECTIONS = 100     # above peak in-flight LLM calls per worker
+_KEEPALIVE_EXPIRY = 60.0
+
+try:
+    import h2  # noqa: F401 — enables HTTP/2 in httpx
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# event loop → {sdk module name → AsyncClient}
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_http_client(sdk: ModuleType) -> Optional[Any]:
+    """
+    Return the pooled AsyncClient for `sdk` (the imported anthropic / openai
+    module) on the running event loop, creating it on first use.
+
+    Returns None outside a running loop — the SDK then builds its own transport.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    loop_clients = _clients.setdefault(loop, {})
+    client = loop_clients.get(sdk.__name__)
+    if client is None or client.is_closed:
+        # Limits must come from the SDK's httpx package, not necessarily ours
+        limits = type(sdk.DEFAULT_CONNECTION_LIMITS)(
+            max_connections=_MAX_CONNECTIONS,
+            max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        )
+        client = loop_clients[sdk.__name__] = sdk.DefaultAsyncHttpxClient(
+            http2=_HTTP2, limits=limits
+        )
+        logger.debug(f"Shared {sdk.__name__} HTTP client created (http2={_HTTP2})")
+    return client
+
+
+async def close_shared_http_clients() -> None:
+    """Close the running loop's pooled clients (called on app shutdown)."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    for client in (_clients.pop(loop, None) or {}).values():
+        await client.aclose()
@@ -0,0 +1,41 @@
+"""
+JSON encode/decode for the LLM tool-calling loop and WebSocket pushes.
+
+Tool results (scraped pages, DB rows) are serialised between every LLM turn,
+Kimi tool arguments are parsed on every response, and progress/transcript
+pushes go out many times a second per user, so these use orjson
+when it is installed and fall back to the stdlib json module otherwise.
+Financial report exports (JSON and PDF) go through dumps(indent=True).
+Both backends write UTF-8 (not \\u-escaped) and render values JSON has no
+type for (Decimal, sets, ...) via str(), but their output is not identical:
+  - datetimes: orjson writes RFC 3339 ("2024-01-02T03:04:05"), the stdlib
+    fallback str() ("2024-01-02 03:04:05")
+  - ints beyond 64 bits: orjson raises TypeError, the stdlib writes them
+  - non-str dict keys: orjson stringifies date/UUID/enum keys as well, the
+    stdlib only accepts int/float/bool/None keys and raises TypeError otherwise
+Output written on an install with orjson can differ from one without it.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialise obj to a JSON string (2-space indented when indent=True)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+    if indent:
+        return json.dumps(obj, default=str, ensure_ascii=False, indent=2)
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(text):
+    """Parse a JSON string or bytes. Raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(text)   # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return json.loads(text)
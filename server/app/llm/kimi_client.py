@@ -8,11 +8,20 @@ Routing: Chinese-language content and APAC market research → Kimi
 Config section: config["llm"]["kimi"]
 """
 
+import json
 import logging
+from collections import OrderedDict
 from typing import Any, AsyncIterator, Optional
 
+from app.llm import json_codec
+from app.llm.http_client import get_shared_http_client
+from app.llm.streaming import coalesce_deltas
+
 logger = logging.getLogger("mezzofy.llm.kimi")
 
+# Formatted tool lists kept per client, keyed by id() of the ToolExecutor list
+_TOOL_CACHE_SIZE = 16
+
 
 class KimiClient:
     """
@@ -22,11 +31,15 @@ class KimiClient:
     (which matches ToolExecutor's output format directly).
     """
 
+    # Tool calls arrive with the complete response (see AnthropicClient)
+    supports_tool_streaming = False
+
     def __init__(self, config: dict):
         """
         Args:
             config: Full config dict. Reads from config["llm"]["kimi"].
         """
+        import openai
         from openai import AsyncOpenAI
 
         kimi_cfg = config.get("llm", {}).get("kimi", {})
@@ -39,7 +52,17 @@ class KimiClient:
         self._client = AsyncOpenAI(
             api_key=self._api_key,
             base_url=self._base_url,
+            # Same budget as AnthropicClient; the SDK default would let a call wait
+            # up to 600 s for a slot in the shared pool
+            timeout=openai.Timeout(
+                connect=10.0,
+                read=600.0,
+                write=30.0,
+                pool=10.0,
+            ),
+            http_client=get_shared_http_client(openai),
         )
+        self._tool_cache: OrderedDict[int, tuple[list[dict], int, list[dict]]] = OrderedDict()
         logger.info(f"KimiClient ready (model={self._model}, base_url={self._base_url})")
 
     @property
@@ -72,10 +95,9 @@ class KimiClient:
                 "model": str,
             }
         """
-        full_messages = list(messages)
-        if system:
-            # Prepend system message (OpenAI style)
-            full_messages = [{"role": "system", "content": system}] + full_messages
+        # Prepend system message (OpenAI style); the SDK doesn't mutate messages,
+        # so without a system prompt the caller's list is passed through as-is
+        full_messages = [{"role": "system", "content": system}, *messages] if system else messages
 
         kwargs: dict[str, Any] = {
             "model": self._model,
@@ -107,13 +129,12 @@ class KimiClient:
         system: Optional[str] = None,
     ) -> AsyncIterator[str]:
         """
-        Stream a chat response token by token (for WebSocket delivery).
+        Stream a chat response (for WebSocket delivery).
 
-        Yields text chunks as they arrive from the API.
+        Yields text as it arrives from the API, with token deltas coalesced
+        into chunks of up to ~64 chars / 25 ms (see coalesce_deltas).
         """
-        full_messages = list(messages)
-        if system:
-            full_messages = [{"role": "system", "content": system}] + full_messages
+        full_messages = [{"role": "system", "content": system}, *messages] if system else messages
 
         try:
             stream = await self._client.chat.completions.create(
@@ -123,16 +144,22 @@ class KimiClient:
                 messages=full_messages,
                 stream=True,
             )
-            async for chunk in stream:
-                delta = chunk.choices[0].delta if chunk.choices else None
-                if delta and delta.content:
-                    yield delta.content
+            async for text in coalesce_deltas(self._text_deltas(stream)):
+                yield text
         except Exception as e:
             logger.error(f"KimiClient.stream_chat failed: {e}")
             raise
 
     # ── Private helpers ───────────────────────────────────────────────────────
 
+    @staticmethod
+    async def _text_deltas(stream) -> AsyncIterator[str]:
+        """Yield the text content of each chunk in a chat.completions stream."""
+        async for chunk in stream:
+            delta = chunk.choices[0].delta if chunk.choices else None
+            if delta and delta.content:
+                yield delta.content
+
     async def _stream_to_response(self, full_messages: list, max_tokens: int) -> dict:
         """
         Stream the completion internally and return an assembled response dict.
@@ -172,6 +199,27 @@ class KimiClient:
         }
 
     def _format_tools(self, tools: list[dict]) -> list[dict]:
+        """
+        Return _build_tools(tools), memoised per tools list.
+
+        chat() is called with the same ToolExecutor list on every tool-loop
+        iteration, so the formatted list is built once per list. Entries hold a
+        reference to the source list (so its id() can't be reused) and its
+        length (so a list that grew is rebuilt).
+        """
+        key = id(tools)
+        cached = self._tool_cache.get(key)
+        if cached is not None and cached[0] is tools and cached[1] == len(tools):
+            self._tool_cache.move_to_end(key)
+            return cached[2]
+
+        formatted = self._build_tools(tools)
+        self._tool_cache[key] = (tools, len(tools), formatted)
+        if len(self._tool_cache) > _TOOL_CACHE_SIZE:
+            self._tool_cache.popitem(last=False)
+        return formatted
+
+    def _build_tools(self, tools: list[dict]) -> list[dict]:
         """
         Convert ToolExecutor definition format to OpenAI function-calling format.
 
@@ -219,11 +267,10 @@ class KimiClient:
         tool_calls = None
 
         if message.tool_calls:
-            import json
             tool_calls = []
             for tc in message.tool_calls:
                 try:
-                    args = json.loads(tc.function.arguments) if tc.function.arguments else {}
+                    args = json_codec.loads(tc.function.arguments) if tc.function.arguments else {}
                 except json.JSONDecodeError:
                     args = {"raw": tc.function.arguments}
                 tool_calls.append({
@@ -254,10 +301,9 @@ class KimiClient:
         Build an OpenAI-format tool result message for multi-turn tool calling.
         Called by LLMManager after executing a tool.
         """
-        import json
         content = result.get("output") or result.get("error") or ""
         if isinstance(content, dict):
-            content = json.dumps(content)
+            content = json_codec.dumps(content)
         elif not isinstance(content, str):
             content = str(content)
 
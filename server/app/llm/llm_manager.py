@@ -4,7 +4,8 @@ LLMManager — Central orchestrator for Claude + Kimi LLM backends.
 Responsibilities:
   - Routes requests: Chinese content → Kimi, everything else → Claude
   - Manages the agentic tool-calling loop (≤5 iterations)
-  - Auto-failover: if primary model fails, retry on other
+  - Auto-failover: if primary model fails, retry on other; a per-backend
+    circuit breaker skips a backend that keeps failing for a cooldown
   - Tracks token usage per model/department/user → llm_usage table
   - Builds department-aware system prompts
 
@@ -17,19 +18,44 @@ Config section: config["llm"]
 """
 
 import asyncio
+import hashlib
 import logging
+import os
 import re
-import unicodedata
+import weakref
 from datetime import date, datetime, timezone, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+from app.llm import json_codec
 from app.llm.anthropic_client import AnthropicClient
+from app.llm.circuit_breaker import CircuitBreaker
 from app.llm.kimi_client import KimiClient
 from app.tools.tool_executor import ToolExecutor
 
 logger = logging.getLogger("mezzofy.llm.manager")
 
+# Han ideographs (incl. extensions, compatibility, radicals, strokes), Hiragana
+# and Katakana (incl. halfwidth and supplements) — one C-level scan per message
+_CJK_RE = re.compile(
+    "["
+    "\u2e80-\u2eff\u3040-\u30ff\u31c0-\u31ff\u32d0-\u32fe"
+    "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff65-\uff9f"
+    "\U0001aff0-\U0001b16f\U0001f200-\U0001f248\U00020000-\U0003134f"
+    "]"
+)
+
+# Message keywords / departments that route a task to Kimi (Chinese market / APAC)
+_APAC_SIGNALS_RE = re.compile(
+    "|".join(re.escape(signal) for signal in (
+        "china", "chinese market", "mainland", "apac",
+        "mandarin", "中国", "亚太", "新加坡",
+    )),
+    re.IGNORECASE,
+)
+_APAC_DEPARTMENTS = frozenset({"apac", "china", "asia"})
+
 # ── Module-level singleton ─────────────────────────────────────────────────────
 
 _manager: Optional["LLMManager"] = None
@@ -53,6 +79,24 @@ def get() -> "LLMManager":
 # Maximum tool-calling loop iterations
 MAX_TOOL_ITERATIONS = 5
 
+# Exact-match cache for chat() responses, for callers that opt in with
+# task_context["cacheable"] (answer depends only on the prompt — no tools).
+# Entries are per user unless task_context["cache_shared"] is also set.
+_RESPONSE_CACHE_PREFIX = "llm:resp:"
+_RESPONSE_CACHE_TTL = 300
+
+# llm_usage rows are buffered and written in one multi-row INSERT, at most this
+# many seconds after the first buffered row or as soon as this many are queued
+_USAGE_FLUSH_SECONDS = 5.0
+_USAGE_FLUSH_ROWS = 200
+
+_USAGE_INSERT_SQL = """
+    INSERT INTO llm_usage
+        (model, department, user_id, session_id, input_tokens, output_tokens)
+    VALUES
+        (:model, :department, :user_id, :session_id, :input_tokens, :output_tokens)
+"""
+
 # ── Anthropic server-side tool definitions (module-level constants) ────────────
 
 WEB_SEARCH_TOOL = {
@@ -93,8 +137,11 @@ def _map_scope(s: str) -> str:
     """Map tool storage_scope values to DB scope values."""
     return "personal" if s == "user" else s
 
-# System prompt template — filled with department/role/source/save_options at runtime
-_SYSTEM_PROMPT_TEMPLATE = """You are the Mezzofy AI Assistant helping the {department} team.
+# System prompt template, in three parts: the head and tail are filled with
+# department/role/source/save_options and cached per combination
+# (_static_system_prompt); the session lines change per call and go last, so
+# the static part is a stable prefix for Anthropic prompt caching
+_SYSTEM_PROMPT_HEAD = """You are the Mezzofy AI Assistant helping the {department} team.
 
 You have access to tools for:
 - Sending emails via Outlook (Microsoft Graph API)
@@ -112,11 +159,9 @@ You have access to tools for:
 Department context: {department}
 User role: {role}
 Task source: {source}
-Current date: {current_date}
-Current time: {current_time}
-Current user ID: {user_id}
-(Use this exact value for the user_id parameter in all personal_* tool calls)
+"""
 
+_SYSTEM_PROMPT_TAIL = """
 Be professional, concise, and action-oriented. When generating customer-facing content, use Mezzofy brand voice (confident, friendly, professional). When sending emails via Outlook, always confirm with the user before sending unless they explicitly said "auto send" or this is a scheduled/webhook task (auto-send is allowed for automated workflows).
 
 When delivering scheduled report results, format output clearly for MS Teams with headings and attach generated files.
@@ -138,6 +183,17 @@ file_path(s) to extract the content, then answer based on what you find. Do not
 the user to provide a file path — discover it yourself. If no files are found, respond:
 "I couldn't find any documents matching '<topic>' in your accessible folders." """
 
+_SYSTEM_PROMPT_SESSION = """
+
+Current date: {current_date}
+Current time: {current_time}
+Current user ID: {user_id}
+(Use this exact value for the user_id parameter in all personal_* tool calls)"""
+
+# Anthropic prompt-cache breakpoint: everything up to and including a block
+# carrying this marker (tool definitions + static system text) is cached
+_CACHE_CONTROL = {"type": "ephemeral"}
+
 # Appended to system prompt when a document is already in the conversation context
 _ATTACHED_FILE_DIRECTIVE = """
 
@@ -202,6 +258,124 @@ the right agent.
 """
 
 
+@lru_cache(maxsize=256)
+def _static_system_prompt(dept: str, role: str, source: str) -> str:
+    """The static part of the system prompt for one department/role/source."""
+    if dept.lower() == "management" or role.lower() in ("admin", "superadmin"):
+        save_options = (
+            f"Where would you like to save this file?\n"
+            f"  (1) Your personal folder — only visible to you\n"
+            f"  (2) The {dept} shared department folder — visible to your whole team\n"
+            f"  (3) The company-wide public folder — visible to all staff\n"
+            f'Wait for their reply. If they choose (1) or say "personal/mine/me", call with storage_scope="user". '
+            f'If they choose (2) or say "shared/team/department/{dept}", call with storage_scope="department". '
+            f'If they choose (3) or say "company/everyone/all staff", call with storage_scope="company". '
+            f"Do not skip this question."
+        )
+    else:
+        save_options = (
+            f"Where would you like to save this file?\n"
+            f"  (1) Your personal folder — only visible to you\n"
+            f"  (2) The {dept} shared department folder — visible to your whole team\n"
+            f'Wait for their reply. If they choose (1) or say "personal/mine/me", call with storage_scope="user". '
+            f'If they choose (2) or say "shared/team/department/{dept}", call with storage_scope="department". '
+            f"Do not skip this question."
+        )
+
+    persona_name = _AGENT_PERSONA_MAP.get(dept.lower(), "AI Assistant")
+    self_identity = f"You are **{persona_name}**, Mezzofy's {dept.title()} Agent.\n"
+
+    return (
+        self_identity + _AGENT_TEAM_ROSTER + "\n"
+        + _SYSTEM_PROMPT_HEAD.format(department=dept, role=role, source=source)
+        + _SYSTEM_PROMPT_TAIL.format(save_options=save_options)
+    )
+
+
+def _response_cache_key(
+    model_name: str,
+    system_blocks: list[dict],
+    messages: list[dict],
+    user_id: Optional[str],
+) -> str:
+    """
+    Redis key for a chat() response: backend + the cached system prefix +
+    messages + user_id (None for a response shared by all users). The
+    per-request date/time block is left out, so hits survive the clock.
+    """
+    prefix = [block["text"] for block in system_blocks if "cache_control" in block]
+    payload = json_codec.dumps([model_name, prefix, messages, user_id]).encode()
+    return _RESPONSE_CACHE_PREFIX + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _flatten_system(blocks: list[dict]) -> str:
+    """Join system prompt blocks back into one string (Kimi / string consumers)."""
+    return "".join(block["text"] for block in blocks)
+
+
+def _tool_result_text(result: dict) -> str:
+    """A tool result as the string both APIs expect in the tool message."""
+    content = result.get("output") or result.get("error") or ""
+    return content if isinstance(content, str) else json_codec.dumps(content)
+
+
+def _claude_exchange(tool_calls: list[dict], tool_results: list[tuple]) -> tuple[dict, dict]:
+    """Anthropic format: assistant tool_use blocks, then one user message of tool_result blocks."""
+    return (
+        {"role": "assistant", "content": [
+            {"type": "tool_use", "id": tc["id"], "name": tc["name"], "input": tc["arguments"]}
+            for tc in tool_calls
+        ]},
+        {"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": tc["id"], "content": _tool_result_text(result)}
+            for tc, result in tool_results
+        ]},
+    )
+
+
+def _openai_exchange(tool_calls: list[dict], tool_results: list[tuple]) -> list[dict]:
+    """OpenAI/Kimi format: assistant tool_calls array, then one tool message per result."""
+    return [
+        {"role": "assistant", "content": None, "tool_calls": [
+            {
+                "id": tc["id"],
+                "type": "function",
+                "function": {"name": tc["name"], "arguments": json_codec.dumps(tc["arguments"])},
+            }
+            for tc in tool_calls
+        ]},
+        *(
+            {"role": "tool", "tool_call_id": tc["id"], "name": tc["name"],
+             "content": _tool_result_text(result)}
+            for tc, result in tool_results
+        ),
+    ]
+
+
+def _is_backend_failure(exc: Exception) -> bool:
+    """
+    True when exc says the backend itself is unhealthy — transport error,
+    timeout, 5xx or 429 — and should count against its circuit breaker.
+    A 4xx is about the caller's request (bad input, context too long, invalid
+    tool schema) and must not trip the breaker for every other user.
+    """
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+
+    import anthropic
+    import httpx
+    import openai
+
+    return isinstance(exc, (
+        TimeoutError,
+        ConnectionError,
+        httpx.TransportError,
+        anthropic.APIConnectionError,       # includes APITimeoutError
+        openai.APIConnectionError,
+    ))
+
+
 class LLMManager:
     """
     Orchestrates Claude and Kimi LLM calls with routing, tool use, and failover.
@@ -212,6 +386,24 @@ class LLMManager:
         self.claude = AnthropicClient(config)
         self.kimi = KimiClient(config)
         self.tool_executor = ToolExecutor(config)
+        llm_cfg = config.get("llm", {})
+        threshold = int(llm_cfg.get("breaker_failure_threshold", 5))
+        cooldown = float(llm_cfg.get("breaker_recovery_seconds", 30.0))
+        self._claude_breaker = CircuitBreaker("claude", threshold, cooldown)
+        self._kimi_breaker = CircuitBreaker("kimi", threshold, cooldown)
+        # Bulkheads: cap in-flight calls per backend so a surge queues here instead
+        # of opening hundreds of provider connections. Semaphores are kept per event
+        # loop: the API and each Celery worker process run on different loops.
+        self._concurrency = {
+            "claude": int(llm_cfg.get("claude_concurrency", 32)),
+            "kimi": int(llm_cfg.get("kimi_concurrency", 32)),
+        }
+        # event loop → {backend → Semaphore}
+        self._bulkheads: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._usage_rows: list[dict] = []
+        self._usage_flush: Optional[asyncio.Task] = None
+        # The loop keeps only weak references to tasks — hold flushes until done
+        self._usage_tasks: set[asyncio.Task] = set()
         logger.info("LLMManager ready (Claude + Kimi)")
 
     # ── Public API ────────────────────────────────────────────────────────────
@@ -225,6 +417,9 @@ class LLMManager:
           2. APAC / Chinese market signals in context → Kimi
           3. Everything else → Claude
 
+        If the chosen backend's circuit breaker is open, the other backend is
+        returned instead (unless its breaker is open too).
+
         Args:
             message: The user's message text.
             context: Optional task context dict (may include "department", "source", etc.)
@@ -234,14 +429,22 @@ class LLMManager:
         """
         if self._contains_chinese(message):
             logger.debug("select_model: Chinese content detected → Kimi")
-            return self.kimi
-
-        if context and self._is_chinese_market_task(message, context):
+            model = self.kimi
+        elif context and self._is_chinese_market_task(message, context):
             logger.debug("select_model: APAC/Chinese market task detected → Kimi")
-            return self.kimi
-
-        logger.debug("select_model: default → Claude")
-        return self.claude
+            model = self.kimi
+        else:
+            logger.debug("select_model: default → Claude")
+            model = self.claude
+
+        if self._breaker_for(model).is_open():
+            fallback = self._fallback_for(model)
+            if not self._breaker_for(fallback).is_open():
+                logger.info(
+                    "select_model: %s circuit open → %s", model.model_name, fallback.model_name
+                )
+                return fallback
+        return model
 
     async def chat(
         self,
@@ -255,23 +458,42 @@ class LLMManager:
         Args:
             messages: Conversation history.
             task_context: {department, role, source} for system prompt.
+                          With "cacheable": True, identical requests from the
+                          same user_id within 5 minutes are answered from
+                          Redis. Add "cache_shared": True only when the
+                          answer cannot depend on who asks — the cached
+                          response is then served to every user.
             stream: If True, returns streaming response (for WebSocket).
 
         Returns:
             Normalized response dict from the selected model.
         """
-        system = self._build_system_prompt(task_context)
+        system = self._build_system_blocks(task_context)
         last_message = messages[-1]["content"] if messages else ""
         model = self.select_model(last_message, task_context)
 
+        cache_key = None
+        if task_context and task_context.get("cacheable"):
+            user_id = None if task_context.get("cache_shared") else task_context.get("user_id", "")
+            cache_key = _response_cache_key(model.model_name, system, messages, user_id)
+            cached = await self._cached_response(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            return await model.chat(messages, system=system)
+            response = await self._guarded_chat(model, messages, system=self._system_for(model, system))
         except Exception as primary_err:
             logger.warning(
                 f"LLMManager.chat: primary model ({model.model_name}) failed: {primary_err} — failing over"
             )
-            fallback = self.kimi if model is self.claude else self.claude
-            return await fallback.chat(messages, system=system)
+            fallback = self._fallback_for(model)
+            response = await self._guarded_chat(
+                fallback, messages, system=self._system_for(fallback, system)
+            )
+
+        if cache_key is not None:
+            await self._cache_response(cache_key, response)
+        return response
 
     async def execute_with_tools(
         self,
@@ -312,14 +534,16 @@ class LLMManager:
         """
         message = task.get("extracted_text") or task.get("message", "")
         model = self.select_model(message, task)
-        system = self._build_system_prompt(task)
+        system = self._build_system_blocks(task)
+        # Per-request hot path: %-args are only formatted if the record is emitted
         logger.info(
-            f"execute_with_tools: user_id={task.get('user_id')} "
-            f"dept={task.get('department')} model={model.model_name} "
-            f"msg_len={len(message)}"
+            "execute_with_tools: user_id=%s dept=%s model=%s msg_len=%d",
+            task.get("user_id"), task.get("department"), model.model_name, len(message),
         )
 
         # Build initial message list
+        # The loop's one working copy — appended to in place each iteration. Copied
+        # once so the caller's task["messages"] stays intact for fallbacks/retries.
         history = list(task.get("messages", []))
         file_id = task.get("anthropic_file_id")
         if file_id:
@@ -341,11 +565,7 @@ class LLMManager:
                 history.append({"role": "user", "content": message})
 
         # Get tool definitions
-        all_tool_defs = self.tool_executor.get_all_definitions()
-        if tool_names:
-            tool_defs = [t for t in all_tool_defs if t["name"] in tool_names]
-        else:
-            tool_defs = all_tool_defs
+        tool_defs = self.tool_executor.get_definitions(tool_names)
 
         total_usage = {"input_tokens": 0, "output_tokens": 0}
         tools_called: list[str] = []
@@ -361,17 +581,34 @@ class LLMManager:
             if callback:
                 await callback(tool=None, iteration=iterations, max_iter=max_iterations)
 
+            # Backends that stream tool_use blocks get each tool started as soon as
+            # its block decodes, overlapping tool latency with the rest of the turn
+            started: dict[str, asyncio.Task] = {}   # tool_use id → running execute()
+
+            def _start_tool(tc: dict) -> None:
+                started[tc["id"]] = asyncio.create_task(
+                    self.tool_executor.execute(tc["name"], **tc["arguments"])
+                )
+
             try:
-                response = await model.chat(history, tools=tool_defs, system=system)
+                response = await self._guarded_chat(
+                    model, history, tools=tool_defs, system=self._system_for(model, system),
+                    on_tool_use=_start_tool,
+                )
             except Exception as primary_err:
                 logger.warning(
                     f"LLMManager tool loop iter={iterations}: primary model "
                     f"({model.model_name}) failed: {primary_err!r} — trying fallback"
                 )
                 try:
-                    fallback = self.kimi if model is self.claude else self.claude
-                    response = await fallback.chat(history, tools=tool_defs, system=system)
-                    used_model = fallback
+                    fallback = self._fallback_for(model)
+                    response = await self._guarded_chat(
+                        fallback, history, tools=tool_defs, system=self._system_for(fallback, system),
+                        on_tool_use=_start_tool,
+                    )
+                    # Stay on the backend that answered: later iterations shouldn't pay the
+                    # primary's failure again, and history is now in the fallback's format
+                    model = used_model = fallback
                 except Exception as fallback_err:
                     logger.error(
                         f"LLMManager tool loop iter={iterations}: both models failed — "
@@ -404,15 +641,15 @@ class LLMManager:
 
             # No tool calls → final answer
             if not response.get("tool_calls"):
-                # Track usage asynchronously (non-blocking, non-fatal)
-                asyncio.create_task(self._track_usage(
+                # Queue usage for the next batched write (non-blocking, non-fatal)
+                self._track_usage(
                     model_name=used_model.model_name,
                     department=task.get("department", "unknown"),
                     user_id=task.get("user_id", "system"),
                     input_tokens=total_usage["input_tokens"],
                     output_tokens=total_usage["output_tokens"],
                     session_id=task.get("session_id"),
-                ))
+                )
                 return {
                     "success": True,
                     "content": response["content"],
@@ -427,31 +664,35 @@ class LLMManager:
             tool_results = []
 
             for tc in tool_calls:
-                tool_name = tc["name"]
-                tools_called.append(tool_name)
-                logger.info(f"LLMManager: executing tool '{tool_name}' (iteration {iterations})")
+                tools_called.append(tc["name"])
+                logger.info("LLMManager: executing tool '%s' (iteration %d)", tc["name"], iterations)
 
-                # Report tool call before execution
+                # Report each tool call before the batch executes
                 if callback:
-                    await callback(tool=tool_name, iteration=iterations, max_iter=max_iterations)
+                    await callback(tool=tc["name"], iteration=iterations, max_iter=max_iterations)
+
+            # Tool calls from one model turn are independent — run them concurrently
+            # (joining any already started while the turn streamed)
+            results = await asyncio.gather(
+                *(
+                    started.get(tc["id"]) or self.tool_executor.execute(tc["name"], **tc["arguments"])
+                    for tc in tool_calls
+                ),
+                return_exceptions=True,
+            )
 
-                try:
-                    result = await self.tool_executor.execute(tool_name, **tc["arguments"])
-                except Exception as tool_err:
+            failed: Optional[tuple[str, Exception]] = None
+            for tc, result in zip(tool_calls, results):
+                tool_name = tc["name"]
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
                     logger.error(
-                        f"LLMManager: tool '{tool_name}' raised exception: {tool_err!r} "
+                        f"LLMManager: tool '{tool_name}' raised exception: {result!r} "
                         f"(user={task.get('user_id')} iter={iterations})"
                     )
-                    # Return immediately — do NOT feed this back to the model as a tool result,
-                    # which would trigger another (likely failing) model API call.
-                    return {
-                        "success": False,
-                        "content": f"Tool '{tool_name}' failed: {tool_err}",
-                        "iterations": iterations,
-                        "tools_called": tools_called,
-                        "artifacts": artifacts,
-                        "usage": {**total_usage, "model": used_model.model_name},
-                    }
+                    failed = failed or (tool_name, result)
+                    continue
 
                 tool_results.append((tc, result))
 
@@ -468,8 +709,22 @@ class LLMManager:
                         "department": output.get("department", ""),
                     })
 
+            if failed is not None:
+                # Return immediately — do NOT feed this back to the model as a tool result,
+                # which would trigger another (likely failing) model API call. Files from
+                # sibling calls that succeeded are still returned for registration.
+                tool_name, tool_err = failed
+                return {
+                    "success": False,
+                    "content": f"Tool '{tool_name}' failed: {tool_err}",
+                    "iterations": iterations,
+                    "tools_called": tools_called,
+                    "artifacts": artifacts,
+                    "usage": {**total_usage, "model": used_model.model_name},
+                }
+
             # Append assistant message with tool calls + tool result messages to history
-            history = self._append_tool_exchange(
+            self._append_tool_exchange(
                 model=used_model,
                 history=history,
                 tool_calls=tool_calls,
@@ -480,14 +735,14 @@ class LLMManager:
         logger.warning(
             f"LLMManager: reached max iterations ({max_iterations}) — returning partial answer"
         )
-        asyncio.create_task(self._track_usage(
+        self._track_usage(
             model_name=used_model.model_name,
             department=task.get("department", "unknown"),
             user_id=task.get("user_id", "system"),
             input_tokens=total_usage["input_tokens"],
             output_tokens=total_usage["output_tokens"],
             session_id=task.get("session_id"),
-        ))
+        )
         return {
             "success": True,
             "content": f"I completed {len(tools_called)} steps but reached the maximum action limit. "
@@ -510,12 +765,13 @@ class LLMManager:
         """
         message = task.get("message", "")
         model = self.select_model(message, task)
-        system = self._build_system_prompt(task)
+        system = self._system_for(model, self._build_system_blocks(task))
         messages = task.get("messages", [{"role": "user", "content": message}])
 
         try:
-            async for chunk in model.stream_chat(messages, system=system):
-                yield chunk
+            async with self._bulkhead_for(model):
+                async for chunk in model.stream_chat(messages, system=system):
+                    yield chunk
         except Exception as e:
             logger.error(f"LLMManager.stream_response failed: {e}")
             yield f"\n[Error: streaming failed — {e}]"
@@ -529,56 +785,28 @@ class LLMManager:
         This allows specialist agents (e.g. SchedulerAgent) to inject a
         fully custom prompt without going through the department template.
         """
+        return _flatten_system(self._build_system_blocks(task))
+
+    def _build_system_blocks(self, task: Optional[dict]) -> list[dict]:
+        """
+        The system prompt as Anthropic text blocks, static parts first.
+
+        The department template and (for document tasks) the brand guidelines
+        carry cache_control breakpoints; the per-call session lines (date,
+        time, user ID) and attachment directives follow uncached.
+        """
         if task and task.get("system_prompt"):
-            return task["system_prompt"]
+            return [{"type": "text", "text": task["system_prompt"], "cache_control": _CACHE_CONTROL}]
 
         dept = (task or {}).get("department", "General")
         role = (task or {}).get("role", "user")
         source = (task or {}).get("source", "mobile")
-        user_id = (task or {}).get("user_id", "")
-
-        if dept.lower() == "management" or role.lower() in ("admin", "superadmin"):
-            save_options = (
-                f"Where would you like to save this file?\n"
-                f"  (1) Your personal folder — only visible to you\n"
-                f"  (2) The {dept} shared department folder — visible to your whole team\n"
-                f"  (3) The company-wide public folder — visible to all staff\n"
-                f'Wait for their reply. If they choose (1) or say "personal/mine/me", call with storage_scope="user". '
-                f'If they choose (2) or say "shared/team/department/{dept}", call with storage_scope="department". '
-                f'If they choose (3) or say "company/everyone/all staff", call with storage_scope="company". '
-                f"Do not skip this question."
-            )
-        else:
-            save_options = (
-                f"Where would you like to save this file?\n"
-                f"  (1) Your personal folder — only visible to you\n"
-                f"  (2) The {dept} shared department folder — visible to your whole team\n"
-                f'Wait for their reply. If they choose (1) or say "personal/mine/me", call with storage_scope="user". '
-                f'If they choose (2) or say "shared/team/department/{dept}", call with storage_scope="department". '
-                f"Do not skip this question."
-            )
-
-        persona_name = _AGENT_PERSONA_MAP.get(dept.lower(), "AI Assistant")
-        self_identity = f"You are **{persona_name}**, Mezzofy's {dept.title()} Agent.\n"
-
-        prompt = _SYSTEM_PROMPT_TEMPLATE.format(
-            department=dept,
-            role=role,
-            source=source,
-            save_options=save_options,
-            user_id=user_id,
-            current_date=date.today().strftime("%B %d, %Y"),
-            current_time=datetime.now(_SGT).strftime("%I:%M %p SGT"),
-        )
-
-        prompt = self_identity + _AGENT_TEAM_ROSTER + "\n" + prompt
 
-        # If a file/image was attached via Files API, tell Claude not to call extraction tools
-        if (task or {}).get("anthropic_file_id"):
-            if (task or {}).get("input_type") == "image":
-                prompt += _ATTACHED_IMAGE_DIRECTIVE
-            else:
-                prompt += _ATTACHED_FILE_DIRECTIVE
+        blocks = [{
+            "type": "text",
+            "text": _static_system_prompt(dept, role, source),
+            "cache_control": _CACHE_CONTROL,
+        }]
 
         # Inject brand guidelines for document generation tasks
         _DOC_KEYWORDS = [
@@ -587,47 +815,129 @@ class LLMManager:
         ]
         message_lower = ((task or {}).get("message", "") or "").lower()
         if any(kw in message_lower for kw in _DOC_KEYWORDS):
-            import os as _os
-            brand_path = _os.path.normpath(
-                _os.path.join(_os.path.dirname(__file__), "../../knowledge/brand/guidelines.md")
+            brand_path = os.path.normpath(
+                os.path.join(os.path.dirname(__file__), "../../knowledge/brand/guidelines.md")
             )
             try:
                 with open(brand_path) as f:
                     brand_guidelines = f.read()
-                prompt += f"\n\n## Brand Guidelines (MANDATORY for this document)\n\n{brand_guidelines}"
+                blocks.append({
+                    "type": "text",
+                    "text": f"\n\n## Brand Guidelines (MANDATORY for this document)\n\n{brand_guidelines}",
+                    "cache_control": _CACHE_CONTROL,
+                })
             except FileNotFoundError:
                 pass
 
-        return prompt
+        session = _SYSTEM_PROMPT_SESSION.format(
+            current_date=date.today().strftime("%B %d, %Y"),
+            current_time=datetime.now(_SGT).strftime("%I:%M %p SGT"),
+            user_id=(task or {}).get("user_id", ""),
+        )
+
+        # If a file/image was attached via Files API, tell Claude not to call extraction tools
+        if (task or {}).get("anthropic_file_id"):
+            if (task or {}).get("input_type") == "image":
+                session += _ATTACHED_IMAGE_DIRECTIVE
+            else:
+                session += _ATTACHED_FILE_DIRECTIVE
+
+        blocks.append({"type": "text", "text": session})
+        return blocks
+
+    def _system_for(self, model: object, blocks: list[dict]):
+        """System prompt in the form `model` takes: blocks for Claude, a string for Kimi."""
+        return blocks if model is self.claude else _flatten_system(blocks)
+
+    def _fallback_for(self, model: object) -> object:
+        """The other backend — Kimi for Claude and vice versa."""
+        return self.kimi if model is self.claude else self.claude
+
+    def _breaker_for(self, model: object) -> CircuitBreaker:
+        return self._claude_breaker if model is self.claude else self._kimi_breaker
+
+    def _bulkhead_for(self, model: object) -> asyncio.Semaphore:
+        """The running loop's concurrency limit for model's backend."""
+        backend = "claude" if model is self.claude else "kimi"
+        loop_sems = self._bulkheads.setdefault(asyncio.get_running_loop(), {})
+        sem = loop_sems.get(backend)
+        if sem is None:
+            sem = loop_sems[backend] = asyncio.Semaphore(self._concurrency[backend])
+        return sem
+
+    async def _guarded_chat(
+        self,
+        model: object,
+        messages: list[dict],
+        on_tool_use: Optional[Callable[[dict], None]] = None,
+        **kwargs,
+    ) -> dict:
+        """
+        model.chat() behind the backend's circuit breaker and bulkhead. Raises
+        CircuitOpen without touching the network while the breaker is open, so
+        callers fail over immediately; otherwise waits for a free slot. Only
+        backend failures (_is_backend_failure) count towards opening it.
+
+        With on_tool_use, backends that support it stream the turn and
+        on_tool_use(tool_call) is called as each tool call decodes; the returned
+        response still lists every tool call.
+        """
+        breaker = self._breaker_for(model)
+        breaker.before_call()
+        try:
+            async with self._bulkhead_for(model):
+                if on_tool_use is not None and model.supports_tool_streaming:
+                    response = None
+                    async for kind, payload in model.stream_with_tools(messages, **kwargs):
+                        if kind == "tool_use":
+                            on_tool_use(payload)
+                        else:
+                            response = payload
+                else:
+                    response = await model.chat(messages, **kwargs)
+        except Exception as e:
+            if _is_backend_failure(e):
+                breaker.record_failure()
+            raise
+        breaker.record_success()
+        return response
+
+    async def _cached_response(self, key: str) -> Optional[dict]:
+        """Cached chat() response, or None (miss or Redis unavailable)."""
+        from app.core.redis_client import get_redis
+        try:
+            raw = await get_redis().get(key)
+        except Exception as e:
+            logger.debug("LLM response cache read failed: %s", e)
+            return None
+        return json_codec.loads(raw) if raw else None
+
+    async def _cache_response(self, key: str, response: dict) -> None:
+        from app.core.redis_client import get_redis
+        try:
+            await get_redis().setex(key, _RESPONSE_CACHE_TTL, json_codec.dumps(response))
+        except Exception as e:
+            logger.debug("LLM response cache write failed: %s", e)
 
     def _contains_chinese(self, text: str) -> bool:
         """
         Return True if the text contains Chinese characters
-        (Simplified or Traditional CJK Unified Ideographs).
+        (Simplified or Traditional CJK Unified Ideographs) or Japanese kana.
         """
-        for char in text:
-            name = unicodedata.name(char, "")
-            if "CJK" in name or "HIRAGANA" in name or "KATAKANA" in name:
-                return True
-        # Also check Unicode ranges directly
-        return bool(re.search(r"[\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff]", text))
+        # isascii() reads a flag CPython keeps on the str — O(1), so English-only
+        # messages (most traffic) skip the regex scan entirely
+        return not text.isascii() and _CJK_RE.search(text) is not None
 
     def _is_chinese_market_task(self, message: str, context: dict) -> bool:
         """
         Return True if the task is oriented toward Chinese market / APAC research.
         Checked when no Chinese characters are present in the message.
         """
-        apac_signals = {
-            "china", "chinese market", "mainland", "apac",
-            "mandarin", "中国", "亚太", "新加坡"
-        }
-        msg_lower = message.lower()
-        if any(signal in msg_lower for signal in apac_signals):
+        if _APAC_SIGNALS_RE.search(message):
             return True
 
         # Check context for APAC routing signals
-        department = context.get("department", "").lower()
-        return department in ("apac", "china", "asia")
+        return context.get("department", "").lower() in _APAC_DEPARTMENTS
 
     def _append_tool_exchange(
         self,
@@ -635,72 +945,19 @@ class LLMManager:
         history: list[dict],
         tool_calls: list[dict],
         tool_results: list[tuple],
-    ) -> list[dict]:
+    ) -> None:
         """
-        Append the assistant's tool calls and tool results to the conversation history.
+        Append the assistant's tool calls and tool results to the conversation history
+        (in place).
 
         Handles format differences between Anthropic (content blocks) and OpenAI (tool_calls array).
         """
         if model is self.claude:
-            # Anthropic format: assistant message with tool_use content blocks
-            assistant_content = []
-            for tc in tool_calls:
-                assistant_content.append({
-                    "type": "tool_use",
-                    "id": tc["id"],
-                    "name": tc["name"],
-                    "input": tc["arguments"],
-                })
-            history.append({"role": "assistant", "content": assistant_content})
-
-            # Tool results: single user message with tool_result blocks
-            result_content = []
-            for tc, result in tool_results:
-                content = result.get("output") or result.get("error") or ""
-                if not isinstance(content, str):
-                    import json
-                    content = json.dumps(content)
-                result_content.append({
-                    "type": "tool_result",
-                    "tool_use_id": tc["id"],
-                    "content": content,
-                })
-            history.append({"role": "user", "content": result_content})
-
+            history.extend(_claude_exchange(tool_calls, tool_results))
         else:
-            # OpenAI/Kimi format: assistant message with tool_calls array
-            openai_tool_calls = []
-            import json
-            for tc in tool_calls:
-                openai_tool_calls.append({
-                    "id": tc["id"],
-                    "type": "function",
-                    "function": {
-                        "name": tc["name"],
-                        "arguments": json.dumps(tc["arguments"]),
-                    },
-                })
-            history.append({
-                "role": "assistant",
-                "content": None,
-                "tool_calls": openai_tool_calls,
-            })
-
-            # Individual tool result messages
-            for tc, result in tool_results:
-                content = result.get("output") or result.get("error") or ""
-                if not isinstance(content, str):
-                    content = json.dumps(content)
-                history.append({
-                    "role": "tool",
-                    "tool_call_id": tc["id"],
-                    "name": tc["name"],
-                    "content": content,
-                })
+            history.extend(_openai_exchange(tool_calls, tool_results))
 
-        return history
-
-    async def _track_usage(
+    def _track_usage(
         self,
         model_name: str,
         department: str,
@@ -710,31 +967,69 @@ class LLMManager:
         session_id: str = None,
     ) -> None:
         """
-        Insert token usage record into llm_usage table.
-        Non-fatal — failures are logged but do not affect the response.
+        Queue a token usage record for the llm_usage table.
+
+        Rows are written in batches by flush_usage() — scheduled on the running
+        loop _USAGE_FLUSH_SECONDS after the first queued row, or started at once
+        when _USAGE_FLUSH_ROWS are waiting. The buffer is in-process rather than
+        in Redis: a Redis write per turn would cost about what the per-turn
+        INSERT did, and only a process killed inside the flush window loses rows.
+        """
+        self._usage_rows.append({
+            "model": model_name,
+            "department": department,
+            "user_id": user_id,
+            "session_id": session_id,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+        })
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no running loop — rows wait for the next flush
+        if len(self._usage_rows) >= _USAGE_FLUSH_ROWS:
+            self._start_usage_task(loop, self.flush_usage())
+        elif self._usage_flush is None or self._usage_flush.done():
+            self._usage_flush = self._start_usage_task(
+                loop, self._flush_usage_after(_USAGE_FLUSH_SECONDS)
+            )
+
+    def _start_usage_task(self, loop: asyncio.AbstractEventLoop, coro) -> asyncio.Task:
+        task = loop.create_task(coro)
+        self._usage_tasks.add(task)
+        task.add_done_callback(self._usage_task_done)
+        return task
+
+    def _usage_task_done(self, task: asyncio.Task) -> None:
+        self._usage_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"llm_usage flush task failed: {task.exception()!r}")
+
+    async def _flush_usage_after(self, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            # Also runs when cancelled by loop shutdown (stop_worker_loop() on
+            # Celery worker exit) so queued rows are still written
+            await self.flush_usage()
+
+    async def flush_usage(self) -> None:
+        """
+        Write all queued llm_usage rows in one executemany INSERT.
+        Non-fatal — failures are logged and the batch is dropped.
         """
+        if not self._usage_rows:
+            return
+        rows, self._usage_rows = self._usage_rows, []
         try:
             from app.core.database import AsyncSessionLocal
             from sqlalchemy import text
 
-            sql = """
-                INSERT INTO llm_usage
-                    (model, department, user_id, session_id, input_tokens, output_tokens)
-                VALUES
-                    (:model, :department, :user_id, :session_id, :input_tokens, :output_tokens)
-            """
             async with AsyncSessionLocal() as session:
-                await session.execute(text(sql), {
-                    "model": model_name,
-                    "department": department,
-                    "user_id": user_id,
-                    "session_id": session_id,
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                })
+                await session.execute(text(_USAGE_INSERT_SQL), rows)
                 await session.commit()
         except Exception as e:
-            logger.warning(f"_track_usage failed (non-fatal): {e}")
+            logger.warning(f"_track_usage flush of {len(rows)} rows failed (non-fatal): {e}")
 
     # ── Extended LLM methods using Anthropic native capabilities ──────────────
 
@@ -779,14 +1074,15 @@ class LLMManager:
             user_content += f"\n\nAlso fetch and analyse these specific URLs:\n{url_list}"
 
         messages = [{"role": "user", "content": user_content}]
-        system = self._build_system_prompt(task_context)
+        system = self._build_system_blocks(task_context)
 
         # NOTE: web_search + web_fetch are GA — no beta header needed
-        result = await self.claude.chat_with_server_tools(
-            messages=messages,
-            server_tools=server_tools,
-            system=system,
-        )
+        async with self._bulkhead_for(self.claude):
+            result = await self.claude.chat_with_server_tools(
+                messages=messages,
+                server_tools=server_tools,
+                system=system,
+            )
 
         # Extract source citations from server tool result blocks
         sources = self._extract_web_sources(result["content"])
@@ -950,13 +1246,14 @@ class LLMManager:
 
         # pause_turn loop — Skills may need multiple turns to complete generation
         while True:
-            result = await self.claude.chat_with_server_tools(
-                messages=messages,
-                server_tools=[CODE_EXECUTION_TOOL],  # Required for Skills
-                betas=SKILLS_BETAS,
-                container=container,
-                system=system,
-            )
+            async with self._bulkhead_for(self.claude):
+                result = await self.claude.chat_with_server_tools(
+                    messages=messages,
+                    server_tools=[CODE_EXECUTION_TOOL],  # Required for Skills
+                    betas=SKILLS_BETAS,
+                    container=container,
+                    system=system,
+                )
 
             # Accumulate results
             all_file_ids.extend(result["file_ids"])
@@ -1051,12 +1348,13 @@ class LLMManager:
         if system:
             memory_system += system
 
-        result = await self.claude.chat_with_server_tools(
-            messages=messages,
-            server_tools=server_tools,
-            client_tools=client_tools,
-            system=memory_system,
-        )
+        async with self._bulkhead_for(self.claude):
+            result = await self.claude.chat_with_server_tools(
+                messages=messages,
+                server_tools=server_tools,
+                client_tools=client_tools,
+                system=memory_system,
+            )
 
         return result
 
@@ -1079,8 +1377,6 @@ class LLMManager:
         Falls back to original _track_usage() signature if new columns don't exist yet.
         Non-fatal — failures are logged but do not affect the response.
         """
-        import json as _json
-
         # Estimate cost if not provided (rough estimates, update as Anthropic pricing changes)
         if cost_usd is None:
             INPUT_COST_PER_1K  = 0.003   # claude-sonnet-4-6 input
@@ -1116,14 +1412,14 @@ class LLMManager:
                     "input_tokens":      input_tokens,
                     "output_tokens":     output_tokens,
                     "cost_usd":          cost_usd,
-                    "server_tools_used": _json.dumps(server_tools_used or []),
-                    "betas_used":        _json.dumps(betas_used or []),
+                    "server_tools_used": json_codec.dumps(server_tools_used or []),
+                    "betas_used":        json_codec.dumps(betas_used or []),
                     "skill_id":          skill_id,
                 })
                 await session.commit()
         except Exception:
             # Fallback to original schema if new columns not yet migrated
-            await self._track_usage(
+            self._track_usage(
                 model_name, department, user_id or "system",
                 input_tokens, output_tokens,
                 session_id=session_id,
@@ -0,0 +1,81 @@
+"""
+Streaming helpers shared by the LLM clients.
+
+coalesce_deltas() batches token deltas from a model stream so a WebSocket
+consumer sends one frame per ~25 ms / 64 chars instead of one per token.
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional
+
+# Flush the buffered text once it reaches this many chars ...
+COALESCE_MAX_CHARS = 64
+# ... or once the oldest buffered delta is this old (seconds)
+COALESCE_MAX_DELAY = 0.025
+
+
+async def coalesce_deltas(
+    deltas: AsyncIterator[str],
+    max_chars: int = COALESCE_MAX_CHARS,
+    max_delay: float = COALESCE_MAX_DELAY,
+) -> AsyncIterator[str]:
+    """
+    Re-chunk a stream of text deltas into larger, time-bounded pieces.
+
+    A chunk is yielded when the buffer reaches max_chars, when max_delay has
+    passed since its first delta, or when the source stream goes idle past
+    that deadline — so text is never held back longer than max_delay.
+    Concatenating the output always equals concatenating the input.
+    """
+    loop = asyncio.get_running_loop()
+    source = deltas.__aiter__()
+    buf: list[str] = []
+    size = 0
+    deadline = 0.0
+    # The pending __anext__ is kept across idle flushes rather than cancelled
+    # (cancelling it would close the source generator)
+    next_delta: Optional[asyncio.Future] = None
+
+    try:
+        while True:
+            if next_delta is None:
+                next_delta = asyncio.ensure_future(source.__anext__())
+
+            if buf:
+                done, _ = await asyncio.wait(
+                    {next_delta}, timeout=max(0.0, deadline - loop.time())
+                )
+                if not done:
+                    yield "".join(buf)
+                    buf.clear()
+                    size = 0
+                    continue
+
+            try:
+                text = await next_delta
+            except StopAsyncIteration:
+                next_delta = None
+                break
+            except Exception:
+                next_delta = None
+                if buf:
+                    yield "".join(buf)   # deliver what arrived before the failure
+                raise
+            next_delta = None
+            if not text:
+                continue
+
+            if not buf:
+                deadline = loop.time() + max_delay
+            buf.append(text)
+            size += len(text)
+            if size >= max_chars or loop.time() >= deadline:
+                yield "".join(buf)
+                buf.clear()
+                size = 0
+
+        if buf:
+            yield "".join(buf)
+    finally:
+        if next_delta is not None and not next_delta.done():
+            next_delta.cancel()
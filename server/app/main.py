@@ -25,15 +25,16 @@ Health:
     GET /health   — Returns DB + Redis status (unauthenticated)
 """
 
+import asyncio
 import os
 import logging
 from contextlib import asynccontextmanager
 
-import redis.asyncio as aioredis
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.database import check_db_connection
+from app.core.redis_client import close_redis_clients, get_redis, ping_redis
 from app.core.config import load_config
 from app.api import auth, chat, files, folders, admin, llm, tasks, ms_oauth, notifications as notifications_api
 from app.api import contact as contact_api
@@ -51,6 +52,21 @@ logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
 )
+# LOG_FORMAT=json: one JSON object per line, including `extra` fields (agent, skill, ...)
+if os.getenv("LOG_FORMAT", "").lower() == "json":
+    try:
+        from pythonjsonlogger.jsonlogger import JsonFormatter
+
+        for _handler in logging.getLogger().handlers:
+            _handler.setFormatter(JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    except ImportError:
+        logging.getLogger("mezzofy.main").warning(
+            "LOG_FORMAT=json but python-json-logger is not installed — using text logs"
+        )
+# The format above never prints thread/process fields — skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger("mezzofy.main")
 
 
@@ -85,6 +101,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Skill registry init failed: {e} — skill-based features unavailable")
 
+    # Preload content-generation brand/product context so the first request is warm
+    try:
+        from app.skills import skill_registry as sr_mod
+        content_skill = sr_mod.get("content_generation")
+        if content_skill is not None:
+            await content_skill.warmup()
+    except Exception as e:
+        logger.warning(f"Content generation warmup failed: {e} — will load on first use")
+
     # Verify DB
     db_ok = await check_db_connection()
     if db_ok:
@@ -107,10 +132,8 @@ async def lifespan(app: FastAPI):
         )
 
     # Verify Redis
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     try:
-        async with aioredis.from_url(redis_url, decode_responses=True) as r:
-            await r.ping()
+        await get_redis().ping()
         logger.info("Redis connection OK")
     except Exception as e:
         logger.warning(f"Redis connection FAILED: {e} — server starting anyway")
@@ -119,6 +142,22 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("Mezzofy AI Assistant shutting down")
 
+    # Write any buffered llm_usage rows before the DB pool goes away
+    await llm_mod.get().flush_usage()
+
+    from app.llm.http_client import close_shared_http_clients
+    await close_shared_http_clients()
+    from app.tools.communication.outlook_ops import close_batch_http_clients
+    await close_batch_http_clients()
+    from app.tools.web.scraping_ops import close_shared_connector
+    await close_shared_connector()
+    from app.tools.web.browser_pool import close_browser_pool
+    await close_browser_pool()
+    # WebSocket pushes share one Redis subscriber per worker (see stream_handler)
+    from app.output.stream_handler import ws_manager
+    await ws_manager.close()
+    await close_redis_clients()
+
 
 # ── App ───────────────────────────────────────────────────────────────────────
 
@@ -191,17 +230,8 @@ async def health_check():
     Unauthenticated health check used by nginx upstream and monitoring.
     Returns DB + Redis connectivity status.
     """
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-
-    db_ok = await check_db_connection()
-
-    redis_ok = False
-    try:
-        async with aioredis.from_url(redis_url, decode_responses=True) as r:
-            await r.ping()
-        redis_ok = True
-    except Exception:
-        pass
+    # Independent probes — run them side by side (both return False on error)
+    db_ok, redis_ok = await asyncio.gather(check_db_connection(), ping_redis())
 
     overall = "ok" if (db_ok and redis_ok) else "degraded"
 
@@ -14,14 +14,28 @@ Usage in chat.py:
 Usage in Celery tasks (Phase 6):
     from app.output.stream_handler import ws_manager
     await ws_manager.send(user_id, {"type": "task_progress", "progress": 60})
+
+Cross-worker delivery goes through Redis pub/sub on user:{user_id}:notifications
+(Celery tasks also publish there directly). Each worker holds ONE subscriber
+connection for all of its sockets and forwards messages to the right one.
 """
 
 import asyncio
 import logging
 from typing import Optional
 
+from app.llm import json_codec
+
 logger = logging.getLogger("mezzofy.output.stream")
 
+_CHANNEL_PREFIX = "user:"
+_CHANNEL_SUFFIX = ":notifications"
+_FORWARD_TIMEOUT = 5.0   # a stalled socket must not hold up the other users' pushes
+
+
+def notification_channel(user_id: str) -> str:
+    return f"{_CHANNEL_PREFIX}{user_id}{_CHANNEL_SUFFIX}"
+
 
 class WSConnectionManager:
     """
@@ -30,14 +44,17 @@ class WSConnectionManager:
     Maps user_id → active WebSocket instance. Only one active connection
     per user is maintained (new connection replaces old for same user_id).
 
-    Note: This is an in-process registry. In multi-worker deployments
-    (Uvicorn 4 workers), connections to different workers cannot see each
-    other. For cross-worker push (e.g., Celery → WebSocket), use Redis
-    pub/sub (wired in Phase 6).
+    The registry itself is per process (Uvicorn worker). For cross-worker
+    push, connect() also subscribes the user's notification channel on a
+    shared pub/sub connection, and send() publishes there when the user is
+    not connected to this worker.
     """
 
     def __init__(self):
         self._connections: dict = {}  # user_id → WebSocket
+        self._pubsub = None                          # shared subscriber connection
+        self._listener: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def connect(self, websocket, user_id: str) -> None:
         """Accept and register a WebSocket connection."""
@@ -50,12 +67,23 @@ class WSConnectionManager:
             except Exception:
                 pass
         self._connections[user_id] = websocket
-        logger.info(f"WebSocket connected: user={user_id}")
+        logger.info("WebSocket connected: user=%s", user_id)
+        await self._subscribe(user_id)
 
-    async def disconnect(self, user_id: str) -> None:
-        """Deregister a WebSocket connection."""
+    async def disconnect(self, user_id: str, websocket=None) -> None:
+        """
+        Deregister a WebSocket connection. When `websocket` is given and the user
+        has since reconnected with a different socket, the new one is kept.
+        """
+        if websocket is not None and self._connections.get(user_id) is not websocket:
+            return
         self._connections.pop(user_id, None)
-        logger.info(f"WebSocket disconnected: user={user_id}")
+        logger.info("WebSocket disconnected: user=%s", user_id)
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(notification_channel(user_id))
+            except Exception as e:
+                logger.debug("Notification unsubscribe failed for user=%s: %s", user_id, e)
 
     async def send(self, user_id: str, message: dict) -> bool:
         """
@@ -66,13 +94,15 @@ class WSConnectionManager:
             message: JSON-serialisable dict.
 
         Returns:
-            True if sent, False if user is not connected.
+            True if sent (or published to a worker the user is connected to),
+            False if the user is not connected anywhere.
         """
         ws = self._connections.get(user_id)
         if ws is None:
-            return False
+            return await self._publish(user_id, message)
         try:
-            await ws.send_json(message)
+            # orjson-encoded text frame — the mobile client JSON.parse()s string frames
+            await ws.send_text(json_codec.dumps(message))
             return True
         except Exception as e:
             logger.warning(f"WebSocket send failed for user={user_id}: {e}")
@@ -85,6 +115,76 @@ class WSConnectionManager:
     def active_count(self) -> int:
         return len(self._connections)
 
+    # ── Redis backplane ───────────────────────────────────────────────────────
+
+    async def close(self) -> None:
+        """Stop the shared subscriber (called on app shutdown)."""
+        if self._listener is not None:
+            self._listener.cancel()
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+        self._pubsub, self._listener = None, None
+
+    async def _publish(self, user_id: str, message: dict) -> bool:
+        from app.core.redis_client import get_redis
+        try:
+            receivers = await get_redis().publish(
+                notification_channel(user_id), json_codec.dumps(message)
+            )
+            return receivers > 0
+        except Exception as e:
+            logger.warning(f"Notification publish failed for user={user_id}: {e}")
+            return False
+
+    async def _subscribe(self, user_id: str) -> None:
+        """Add the user's channel to the shared subscriber, (re)starting it if needed."""
+        from app.core.redis_client import get_redis
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Subscriber from a previous event loop (tests, reloads) — start over
+            self._pubsub, self._listener, self._loop = None, None, loop
+        try:
+            if self._pubsub is None:
+                self._pubsub = get_redis().pubsub()
+                # Fresh connection: (re)subscribe every socket on this worker
+                await self._pubsub.subscribe(*(notification_channel(u) for u in self._connections))
+            else:
+                await self._pubsub.subscribe(notification_channel(user_id))
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen(self._pubsub))
+        except Exception as e:
+            logger.warning(f"Notification subscribe failed for user={user_id}: {e}")
+
+    async def _listen(self, pubsub) -> None:
+        """Forward published notifications to the matching local socket."""
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                channel = message["channel"]
+                user_id = channel[len(_CHANNEL_PREFIX):-len(_CHANNEL_SUFFIX)]
+                ws = self._connections.get(user_id)
+                if ws is None:
+                    continue
+                try:
+                    await asyncio.wait_for(ws.send_text(message["data"]), _FORWARD_TIMEOUT)
+                except Exception as e:
+                    logger.warning(f"Notification forward failed for user={user_id}: {e!r}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Notification listener stopped: {e} — resubscribing on next connect")
+            if self._pubsub is pubsub:
+                self._pubsub = None
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
 
 # Module-level singleton — imported by chat.py and Celery callbacks
 ws_manager = WSConnectionManager()
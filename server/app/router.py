@@ -15,6 +15,7 @@ Returns agent execute() result dict with at minimum:
 """
 
 import logging
+import re
 from typing import Optional
 
 from app.agents.agent_registry import get_agent_for_task, AGENT_MAP
@@ -34,6 +35,10 @@ _WEBHOOK_EVENT_AGENT: dict[str, str] = {
     "leave_request_submitted": "hr",
 }
 
+# All keywords in one alternation — a single C-level scan for prefixed/suffixed
+# event names (e.g. "stripe.order_completed") instead of one `in` test per entry
+_WEBHOOK_EVENT_RE = re.compile("|".join(map(re.escape, _WEBHOOK_EVENT_AGENT)))
+
 
 async def route_request(task: dict) -> dict:
     """
@@ -75,12 +80,12 @@ async def route_request(task: dict) -> dict:
 async def _route_webhook(task: dict, config: dict) -> dict:
     """Route webhook events by event keyword → agent name table."""
     event = task.get("event", "")
-    agent_name: Optional[str] = None
 
-    for keyword, name in _WEBHOOK_EVENT_AGENT.items():
-        if keyword in event:
-            agent_name = name
-            break
+    # Most events are exact keys; otherwise match a keyword inside the event name
+    agent_name: Optional[str] = _WEBHOOK_EVENT_AGENT.get(event)
+    if agent_name is None:
+        match = _WEBHOOK_EVENT_RE.search(event)
+        agent_name = _WEBHOOK_EVENT_AGENT[match.group()] if match else None
 
     if not agent_name:
         logger.warning(f"No agent mapping for webhook event: {event!r}")
@@ -110,8 +115,8 @@ async def _route_mobile(task: dict, config: dict) -> dict:
     if agent is None:
         # No agent matched — ask user to clarify
         logger.info(
-            "No agent matched — returning clarification prompt. "
-            f"message={task.get('message', '')[:80]!r}"
+            "No agent matched — returning clarification prompt. message=%r",
+            task.get("message", "")[:80],
         )
         return {
             "success": True,
@@ -132,23 +137,41 @@ async def _route_mobile(task: dict, config: dict) -> dict:
 
 async def _execute_by_name(agent_name: str, task: dict, config: dict) -> dict:
     """Instantiate an agent by name string and execute the task."""
-    AgentClass = AGENT_MAP.get(agent_name.lower())
+    # AGENT_MAP keys are lowercase; only mixed-case payloads pay for casefold()
+    AgentClass = AGENT_MAP.get(agent_name) or AGENT_MAP.get(agent_name.casefold())
     if AgentClass is None:
         logger.error(f"Unknown agent name: {agent_name!r}")
         return _err(f"Unknown agent: {agent_name}")
 
-    agent = AgentClass(config)
-    return await _execute_with_instance(agent, task)
+    return await _execute_with_instance(_get_agent(AgentClass, config), task)
+
+
+# Agent class → (config, instance). Agents keep no per-request state on self —
+# only lazily loaded skills and their DB record — so one instance per class is
+# reused across webhook/scheduler dispatches instead of being rebuilt each time.
+_AGENT_INSTANCES: dict[type, tuple[dict, object]] = {}
+
+
+def _get_agent(agent_cls: type, config: dict):
+    """Cached agent instance for agent_cls, rebuilt if the config changed."""
+    cached = _AGENT_INSTANCES.get(agent_cls)
+    # Celery tasks carry a deserialised copy of the config, hence the equality fallback
+    if cached is None or (cached[0] is not config and cached[0] != config):
+        cached = _AGENT_INSTANCES[agent_cls] = (config, agent_cls(config))
+    return cached[1]
 
 
 async def _execute_with_instance(agent, task: dict) -> dict:
     """Execute task with an already-constructed agent instance."""
-    agent_label = agent.__class__.__name__.replace("Agent", "").lower()
-    logger.info(
-        f"Dispatching to {agent.__class__.__name__} "
-        f"(source={task.get('source', 'mobile')}, "
-        f"message={task.get('message', '')[:60]!r})"
-    )
+    agent_label = _agent_label(agent.__class__)
+    if logger.isEnabledFor(logging.INFO):
+        agent_name = agent.__class__.__name__
+        source = task.get("source", "mobile")
+        preview = task.get("message", "")[:60]
+        logger.info(
+            "Dispatching to %s (source=%s, message=%r)", agent_name, source, preview,
+            extra={"agent": agent_name, "source": source, "msg_prefix": preview},
+        )
     # Set per-request user context for tool artifact routing and file scope access
     set_user_context(
         dept=task.get("department", "general"),
@@ -165,6 +188,17 @@ async def _execute_with_instance(agent, task: dict) -> dict:
     return result
 
 
+# Agent class → label reported as agent_used ("FinanceAgent" → "finance")
+_AGENT_LABELS: dict[type, str] = {}
+
+
+def _agent_label(agent_cls: type) -> str:
+    label = _AGENT_LABELS.get(agent_cls)
+    if label is None:
+        label = _AGENT_LABELS[agent_cls] = agent_cls.__name__.replace("Agent", "").lower()
+    return label
+
+
 def _err(detail: str) -> dict:
     return {
         "success": False,
@@ -69,7 +69,7 @@ class ApiIntegrationSkill:
                 "celery_task": (
                     "Create a Celery task following the Mezzofy pattern: "
                     "@celery_app.task(bind=True, name='app.tasks.tasks.<name>'), "
-                    "asyncio.run() wrapper, engine.sync_engine.dispose() before asyncio.run()."
+                    "sync body that calls run_async(<async core>) from app.tasks.worker_loop."
                 ),
                 "tool_class": (
                     "Create a BaseTool subclass following the Mezzofy pattern: "
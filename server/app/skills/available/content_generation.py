@@ -6,9 +6,13 @@ and uses the LLM (via LLMManager) to generate on-brand content.
 Used by MarketingAgent.
 """
 
+import asyncio
 import logging
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional
+
+from app.skills.truncation import truncate_repr
 
 logger = logging.getLogger("mezzofy.skills.content_generation")
 
@@ -24,6 +28,12 @@ Brand colors: Orange (#f97316), Black (#000000), White (#ffffff)
 Tagline: "The Smarter Way to Loyalty"
 """
 
+# Brand guidelines and product data change rarely — reuse them for this long
+_CACHE_TTL = 300
+
+# Product data is cut to this many characters before it goes into the prompt
+_PRODUCT_CONTEXT_CHARS = 1000
+
 _CONTENT_LENGTHS = {
     "short": 200,
     "medium": 500,
@@ -53,6 +63,12 @@ class ContentGenerationSkill:
         from app.tools.mezzofy.data_ops import MezzofyDataOps
         self._knowledge = KnowledgeOps(config)
         self._data = MezzofyDataOps(config)
+        self._cache: dict[str, tuple[float, str]] = {}        # key → (loaded_at, value)
+        self._loading: dict[str, asyncio.Future] = {}         # key → in-flight load
+
+    async def warmup(self) -> None:
+        """Preload brand guidelines and product data (called at app startup)."""
+        await asyncio.gather(self._get_brand(), self._get_products())
 
     # ── Public methods ────────────────────────────────────────────────────────
 
@@ -78,20 +94,9 @@ class ContentGenerationSkill:
             {success: bool, output: str (generated content) | error: str}
         """
         try:
-            # Load brand context
-            brand_result = await self._knowledge.execute("get_brand_guidelines")
-            brand_context = (
-                brand_result.get("output", _DEFAULT_BRAND_GUIDELINES)
-                if brand_result.get("success")
-                else _DEFAULT_BRAND_GUIDELINES
-            )
-
-            # Load relevant product data for accuracy
-            products_result = await self._data.execute("get_products")
-            product_context = (
-                str(products_result.get("output", ""))[:1000]
-                if products_result.get("success")
-                else ""
+            # Brand context + product data for accuracy (cached for _CACHE_TTL)
+            brand_context, product_context = await asyncio.gather(
+                self._get_brand(), self._get_products()
             )
 
             # Build generation prompt
@@ -114,8 +119,9 @@ class ContentGenerationSkill:
 
             content = result.get("content", "")
             logger.info(
-                f"ContentGenerationSkill.generate_content: type={content_type} "
-                f"topic='{topic}' chars={len(content)}"
+                "ContentGenerationSkill.generate_content: type=%s topic='%s' chars=%d",
+                content_type, topic, len(content),
+                extra={"skill": "content_generation", "content_type": content_type},
             )
             return {"success": True, "output": content}
 
@@ -125,6 +131,49 @@ class ContentGenerationSkill:
 
     # ── Private helpers ───────────────────────────────────────────────────────
 
+    async def _get_brand(self) -> str:
+        brand = await self._cached("brand", self._load_brand)
+        return brand if brand is not None else _DEFAULT_BRAND_GUIDELINES
+
+    async def _get_products(self) -> str:
+        products = await self._cached("products", self._load_products)
+        return products if products is not None else ""
+
+    async def _load_brand(self) -> Optional[str]:
+        result = await self._knowledge.execute("get_brand_guidelines")
+        return result.get("output", _DEFAULT_BRAND_GUIDELINES) if result.get("success") else None
+
+    async def _load_products(self) -> Optional[str]:
+        result = await self._data.execute("get_products")
+        if not result.get("success"):
+            return None
+        return truncate_repr(result.get("output", ""), _PRODUCT_CONTEXT_CHARS)
+
+    async def _cached(self, key: str, load: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+        """
+        Return the cached value for key, or load it. Concurrent misses share one
+        load; failed loads (None or an exception) aren't cached, so the next
+        call retries.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _CACHE_TTL:
+            return entry[1]
+
+        pending = self._loading.get(key)
+        loop = asyncio.get_running_loop()
+        # A load from another event loop (Celery runs each task in its own) can't be awaited here
+        if pending is None or pending.done() or pending.get_loop() is not loop:
+            pending = self._loading[key] = asyncio.ensure_future(load())
+        try:
+            value = await asyncio.shield(pending)   # one caller cancelling mustn't cancel the others
+        except Exception as e:
+            # Each context falls back on its own; a failed brand load mustn't sink the products
+            logger.warning(f"ContentGenerationSkill: loading {key} failed: {e}")
+            value = None
+        if value is not None:
+            self._cache[key] = (time.monotonic(), value)
+        return value
+
     def _build_prompt(
         self,
         content_type: str,
@@ -136,7 +185,8 @@ class ContentGenerationSkill:
         product_context: str,
     ) -> str:
         """Build the LLM prompt for content generation."""
-        content_desc = _CONTENT_DESCRIPTIONS.get(content_type, f"{content_type} content")
+        # `or` so the fallback f-string is only built for unknown types
+        content_desc = _CONTENT_DESCRIPTIONS.get(content_type) or f"{content_type} content"
         word_count = _CONTENT_LENGTHS.get(length or "medium", 500)
         tone_desc = tone or "professional"
         audience_desc = audience or "prospects"
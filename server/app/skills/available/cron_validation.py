@@ -131,7 +131,8 @@ class CronValidationSkill:
             )
             result = await llm_mod.get().chat(
                 messages=[{"role": "user", "content": prompt}],
-                task_context={},
+                # Same expression → same sentence, whoever asks
+                task_context={"cacheable": True, "cache_shared": True},
             )
             description = result.get("content", f"Cron expression: {cron_expr}")
         except Exception:
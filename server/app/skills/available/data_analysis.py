@@ -7,10 +7,54 @@ Used by SupportAgent, ManagementAgent, and FinanceAgent.
 """
 
 import logging
+import re
+from datetime import date, timedelta
 from typing import Optional
 
+from app.skills.truncation import truncate_repr
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
 logger = logging.getLogger("mezzofy.skills.data_analysis")
 
+# Explicit range "YYYY-MM-DD:YYYY-MM-DD"
+_RAW_RANGE_RE = re.compile(r"^\s*(\d{4}-\d{2}-\d{2})\s*:\s*(\d{4}-\d{2}-\d{2})\s*$")
+
+_DEFAULT_RANGE = "last_30_days"
+
+# Named ranges resolved to date strings — recomputed only when the day changes
+_RANGE_CACHE: dict[date, dict[str, tuple[str, str]]] = {}
+
+
+def _compute_ranges(today: date) -> dict[str, tuple[str, str]]:
+    def back(days: int) -> str:
+        return str(today - timedelta(days=days))
+
+    now = str(today)
+    return {
+        "today": (now, now),
+        "yesterday": (back(1), back(1)),
+        "last_7_days": (back(7), now),
+        "last_week": (back(7), now),
+        "last_30_days": (back(30), now),
+        "last_month": (back(30), now),
+        "last_quarter": (back(90), now),
+        "last_year": (back(365), now),
+        "this_month": (str(today.replace(day=1)), now),
+    }
+
+
+def _columnar(records: list, columns: list) -> dict:
+    """
+    Rows as {"columns": [...], "rows": [[...], ...]} — each column name once
+    instead of repeated in every row's dict, so more rows fit in the text the
+    agents pass to the LLM. Values come straight from the input records.
+    """
+    return {"columns": columns, "rows": [[rec.get(col) for col in columns] for rec in records]}
+
 
 class DataAnalysisSkill:
     """
@@ -43,6 +87,7 @@ class DataAnalysisSkill:
 
         Returns:
             {success: bool, output: dict with analysis results | error: str}
+            Row data (sample, trend_data) is columnar: {columns: [...], rows: [[...], ...]}.
         """
         try:
             # Resolve natural language date ranges to SQL-friendly bounds
@@ -67,10 +112,13 @@ class DataAnalysisSkill:
             data = raw_result.get("output", [])
             analysis = await self._run_analysis(data, analysis_type or "summary")
 
-            logger.info(
-                f"DataAnalysisSkill.analyze_data: type={analysis_type} "
-                f"date_range={date_range} rows={len(data) if isinstance(data, list) else 'n/a'}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                rows = len(data) if isinstance(data, list) else "n/a"
+                logger.info(
+                    "DataAnalysisSkill.analyze_data: type=%s date_range=%s rows=%s",
+                    analysis_type, date_range, rows,
+                    extra={"skill": "data_analysis", "analysis_type": analysis_type, "rows": rows},
+                )
             return {"success": True, "output": analysis}
 
         except Exception as e:
@@ -81,93 +129,81 @@ class DataAnalysisSkill:
 
     async def _run_analysis(self, data: object, analysis_type: str) -> dict:
         """Run the appropriate pandas analysis on the data."""
-        try:
-            import pandas as pd
-
-            if isinstance(data, list) and data:
-                df = pd.DataFrame(data)
-            elif isinstance(data, dict):
-                df = pd.DataFrame([data])
-            else:
-                return {"raw": str(data), "analysis_type": analysis_type, "rows": 0}
-
-            result: dict = {
-                "analysis_type": analysis_type,
-                "rows": len(df),
-                "columns": list(df.columns),
-            }
-
-            if analysis_type == "summary":
-                numeric_cols = df.select_dtypes(include="number")
-                if not numeric_cols.empty:
-                    desc = numeric_cols.describe().to_dict()
-                    result["statistics"] = {
-                        col: {k: round(v, 2) for k, v in stats.items()}
-                        for col, stats in desc.items()
-                    }
-                result["sample"] = df.head(5).to_dict(orient="records")
-
-            elif analysis_type == "trend":
-                # Find date column and numeric column for trend
-                date_cols = [c for c in df.columns if "date" in c.lower() or "time" in c.lower()]
-                num_cols = list(df.select_dtypes(include="number").columns)
-                if date_cols and num_cols:
-                    df_sorted = df.sort_values(date_cols[0])
-                    result["trend_column"] = num_cols[0]
-                    result["trend_data"] = df_sorted[[date_cols[0], num_cols[0]]].to_dict(orient="records")
-                    if len(df_sorted) >= 2:
-                        first = df_sorted[num_cols[0]].iloc[0]
-                        last = df_sorted[num_cols[0]].iloc[-1]
-                        result["change"] = round(float(last) - float(first), 2)
-                        if first != 0:
-                            result["change_pct"] = round((float(last) - float(first)) / float(first) * 100, 1)
-                result["sample"] = df.head(10).to_dict(orient="records")
-
-            elif analysis_type == "comparison":
-                num_cols = list(df.select_dtypes(include="number").columns)
-                if num_cols:
-                    result["totals"] = {col: round(float(df[col].sum()), 2) for col in num_cols}
-                    result["averages"] = {col: round(float(df[col].mean()), 2) for col in num_cols}
-                result["sample"] = df.to_dict(orient="records")
-
-            else:
-                result["raw"] = df.head(20).to_dict(orient="records")
-
-            return result
-
-        except ImportError:
+        if pd is None:
             # pandas not available — return raw data
             if isinstance(data, list):
                 return {"analysis_type": analysis_type, "rows": len(data), "raw": data[:20]}
-            return {"analysis_type": analysis_type, "raw": str(data)[:2000]}
+            return {"analysis_type": analysis_type, "raw": truncate_repr(data, 2000)}
+
+        if isinstance(data, list) and data:
+            records = data
+        elif isinstance(data, dict):
+            records = [data]
+        else:
+            return {"raw": str(data), "analysis_type": analysis_type, "rows": 0}
+        df = pd.DataFrame(records)
+
+        result: dict = {
+            "analysis_type": analysis_type,
+            "rows": len(df),
+            "columns": list(df.columns),
+        }
+
+        if analysis_type == "summary":
+            numeric_cols = df.select_dtypes(include="number")
+            if not numeric_cols.empty:
+                # Round inside pandas rather than per cell in Python
+                result["statistics"] = numeric_cols.describe().round(2).to_dict()
+            result["sample"] = _columnar(records[:5], result["columns"])
+
+        elif analysis_type == "trend":
+            # Find date column and numeric column for trend
+            date_cols = [c for c in df.columns if "date" in c.lower() or "time" in c.lower()]
+            num_cols = list(df.select_dtypes(include="number").columns)
+            if date_cols and num_cols:
+                df_sorted = df.sort_values(date_cols[0])
+                result["trend_column"] = num_cols[0]
+                trend_cols = [date_cols[0], num_cols[0]]
+                result["trend_data"] = {
+                    "columns": trend_cols,
+                    "rows": df_sorted[trend_cols].to_numpy().tolist(),
+                }
+                if len(df_sorted) >= 2:
+                    values = df_sorted[num_cols[0]]
+                    first = float(values.iat[0])
+                    last = float(values.iat[-1])
+                    result["change"] = round(last - first, 2)
+                    if first != 0:
+                        result["change_pct"] = round((last - first) / first * 100, 1)
+            result["sample"] = _columnar(records[:10], result["columns"])
+
+        elif analysis_type == "comparison":
+            num_cols = list(df.select_dtypes(include="number").columns)
+            if num_cols:
+                numeric = df[num_cols]
+                result["totals"] = numeric.sum().round(2).to_dict()
+                result["averages"] = numeric.mean().round(2).to_dict()
+            result["sample"] = _columnar(records, result["columns"])
+
+        else:
+            result["raw"] = records[:20]
+
+        return result
 
     @staticmethod
     def _resolve_date_range(date_range: Optional[str]) -> dict:
         """Convert a named date range to start/end date strings."""
-        from datetime import date, timedelta
-
         today = date.today()
-        ranges = {
-            "today": (today, today),
-            "yesterday": (today - timedelta(days=1), today - timedelta(days=1)),
-            "last_7_days": (today - timedelta(days=7), today),
-            "last_week": (today - timedelta(days=7), today),
-            "last_30_days": (today - timedelta(days=30), today),
-            "last_month": (today - timedelta(days=30), today),
-            "last_quarter": (today - timedelta(days=90), today),
-            "last_year": (today - timedelta(days=365), today),
-            "this_month": (today.replace(day=1), today),
-        }
-        if not date_range:
-            return {"start": str(today - timedelta(days=30)), "end": str(today)}
-
-        bounds = ranges.get(date_range.lower())
-        if bounds:
-            return {"start": str(bounds[0]), "end": str(bounds[1])}
-
-        # Raw date range "YYYY-MM-DD:YYYY-MM-DD"
-        if ":" in date_range:
-            parts = date_range.split(":")
-            return {"start": parts[0].strip(), "end": parts[1].strip()}
-
-        return {"start": str(today - timedelta(days=30)), "end": str(today)}
+        ranges = _RANGE_CACHE.get(today)
+        if ranges is None:
+            _RANGE_CACHE.clear()
+            ranges = _RANGE_CACHE[today] = _compute_ranges(today)
+
+        bounds = None
+        if date_range:
+            bounds = ranges.get(date_range) or ranges.get(date_range.lower())
+            if bounds is None and (match := _RAW_RANGE_RE.match(date_range)):
+                bounds = match.groups()
+
+        start, end = bounds or ranges[_DEFAULT_RANGE]
+        return {"start": start, "end": end}
@@ -8,11 +8,21 @@ Used by SalesAgent, MarketingAgent, and SupportAgent.
 
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Optional
 
+from jinja2 import Environment, Template
+
 logger = logging.getLogger("mezzofy.skills.email_outreach")
 
+_SERVER_ROOT = Path(__file__).parent.parent.parent.parent  # server/
+
+# Token bucket: bursts up to the full hourly allowance, then refills smoothly
+_SEND_LIMIT_PER_HOUR = 30
+_REFILL_PER_SECOND = _SEND_LIMIT_PER_HOUR / 3600
+_RATE_LIMIT_ERROR = "Email rate limit reached (30/hour). Please try again later."
+
 # Built-in email templates (used when no file-based template found)
 _BUILTIN_TEMPLATES: dict[str, str] = {
     "intro": """
@@ -63,6 +73,22 @@ achieve your loyalty and retention goals. Key highlights:</p>
 """,
 }
 
+# One environment for all email templates. Autoescape: names, company and
+# custom_context come from user/LLM input and are inserted into HTML bodies.
+_ENV = Environment(autoescape=True)
+
+# Built-in templates parsed once at import
+_COMPILED_BUILTINS: dict[str, Template] = {
+    name: _ENV.from_string(source) for name, source in _BUILTIN_TEMPLATES.items()
+}
+
+# Subject line per template: (company_name, recipient_name) → subject
+_SUBJECTS = {
+    "intro": lambda company, name: f"Introducing Mezzofy — Loyalty Platform for {company or 'Your Business'}",
+    "followup": lambda company, name: "Following Up — Mezzofy Loyalty Platform",
+    "proposal": lambda company, name: f"Mezzofy Proposal for {company or name}",
+}
+
 
 class EmailOutreachSkill:
     """
@@ -72,12 +98,17 @@ class EmailOutreachSkill:
     templates if not found. Rate-limited to 30/hour for batch sends.
     """
 
+    # Knowledge-base template files: path → (mtime, compiled template)
+    _FILE_TEMPLATE_CACHE: dict[Path, tuple[float, Template]] = {}
+
     def __init__(self, config: dict):
         self.config = config
         from app.tools.communication.outlook_ops import OutlookOps
         self._outlook = OutlookOps(config)
-        self._sent_count = 0
-        self._hour_reset_ts: float = 0.0
+        kb_dir = config.get("tools", {}).get("knowledge_base", {}).get("directory", "knowledge")
+        self._email_template_dir = _SERVER_ROOT / kb_dir / "templates" / "emails"
+        self._tokens = float(_SEND_LIMIT_PER_HOUR)
+        self._last_refill = time.monotonic()
 
     # ── Public methods ────────────────────────────────────────────────────────
 
@@ -103,26 +134,23 @@ class EmailOutreachSkill:
             {success: bool, output: {subject: str, body_html: str} | error: str}
         """
         try:
-            from jinja2 import Template
-
-            template_str = self._load_template(template)
-            rendered = Template(template_str).render(
+            rendered = self._get_template(template).render(
                 recipient_name=recipient_name,
                 company_name=company_name or "",
                 custom_context=custom_context or "",
             )
 
-            subject_map = {
-                "intro": f"Introducing Mezzofy — Loyalty Platform for {company_name or 'Your Business'}",
-                "followup": "Following Up — Mezzofy Loyalty Platform",
-                "proposal": f"Mezzofy Proposal for {company_name or recipient_name}",
-                "custom": f"Message for {recipient_name}",
-            }
-            subject = subject_map.get(template, f"Message for {recipient_name}")
+            make_subject = _SUBJECTS.get(template)
+            subject = (
+                make_subject(company_name, recipient_name)
+                if make_subject
+                else f"Message for {recipient_name}"
+            )
 
             logger.info(
-                f"EmailOutreachSkill.compose_email: template={template} "
-                f"to={recipient_email}"
+                "EmailOutreachSkill.compose_email: template=%s to=%s",
+                template, recipient_email,
+                extra={"skill": "email_outreach", "template": template},
             )
             return {"success": True, "output": {"subject": subject, "body_html": rendered}}
 
@@ -155,10 +183,7 @@ class EmailOutreachSkill:
         """
         try:
             if not await self._check_rate_limit():
-                return {
-                    "success": False,
-                    "error": "Email rate limit reached (30/hour). Please try again later.",
-                }
+                return {"success": False, "error": _RATE_LIMIT_ERROR}
 
             result = await self._outlook.execute(
                 "outlook_send_email",
@@ -170,39 +195,90 @@ class EmailOutreachSkill:
                 attachments=attachments or [],
             )
             if result.get("success"):
-                self._sent_count += 1
-                logger.info(f"EmailOutreachSkill.send_email: sent to={to}")
+                logger.info(
+                    "EmailOutreachSkill.send_email: sent to=%s", to,
+                    extra={"skill": "email_outreach", "emails_sent": 1},
+                )
+            else:
+                self._refund_token()
             return result
 
         except Exception as e:
             logger.error(f"EmailOutreachSkill.send_email failed: {e}")
             return {"success": False, "error": str(e)}
 
-    # ── Private helpers ───────────────────────────────────────────────────────
+    async def send_batch(self, messages: list[dict]) -> list[dict]:
+        """
+        Send several emails at once — 20 per MS Graph $batch request instead
+        of one HTTPS round trip each.
 
-    def _load_template(self, template_name: str) -> str:
-        """Load template from knowledge base; fall back to built-in."""
-        kb_dir = self.config.get("tools", {}).get("knowledge_base", {}).get("directory", "knowledge")
-        template_path = (
-            Path(__file__).parent.parent.parent.parent
-            / kb_dir
-            / "templates"
-            / "emails"
-            / f"{template_name}.html"
-        )
-        if template_path.exists():
-            return template_path.read_text(encoding="utf-8")
+        Args:
+            messages: [{to: str, subject: str, body_html: str}, ...]
 
-        if template_name in _BUILTIN_TEMPLATES:
-            return _BUILTIN_TEMPLATES[template_name]
+        Returns:
+            One {success: bool, output | error} per message, in order. Messages
+            past the remaining hourly allowance fail with the rate-limit error.
+        """
+        allowed = self._take_tokens(len(messages))
+        try:
+            results = await self._outlook.send_messages([
+                {"to": [m["to"]], "subject": m["subject"], "body_html": m["body_html"]}
+                for m in messages[:allowed]
+            ])
+        except Exception as e:
+            logger.error(f"EmailOutreachSkill.send_batch failed: {e}")
+            results = [{"success": False, "error": str(e)}] * allowed
+
+        for result in results:
+            if not result.get("success"):
+                self._refund_token()
+        if logger.isEnabledFor(logging.INFO):
+            sent = sum(1 for r in results if r.get("success"))
+            logger.info(
+                "EmailOutreachSkill.send_batch: %d/%d sent", sent, len(messages),
+                extra={"skill": "email_outreach", "emails_sent": sent},
+            )
+        return results + [{"success": False, "error": _RATE_LIMIT_ERROR}] * (len(messages) - allowed)
 
-        return _BUILTIN_TEMPLATES["intro"]
+    # ── Private helpers ───────────────────────────────────────────────────────
+
+    def _get_template(self, template_name: str) -> Template:
+        """
+        Compiled template from the knowledge base; falls back to built-in.
+        File templates are parsed once and re-read only when their mtime changes.
+        """
+        template_path = self._email_template_dir / f"{template_name}.html"
+        try:
+            mtime = template_path.stat().st_mtime
+        except OSError:
+            return _COMPILED_BUILTINS.get(template_name, _COMPILED_BUILTINS["intro"])
+
+        cached = self._FILE_TEMPLATE_CACHE.get(template_path)
+        if cached is None or cached[0] != mtime:
+            compiled = _ENV.from_string(template_path.read_text(encoding="utf-8"))
+            cached = self._FILE_TEMPLATE_CACHE[template_path] = (mtime, compiled)
+        return cached[1]
 
     async def _check_rate_limit(self) -> bool:
-        """Return True if under rate limit (30/hour)."""
-        import time
-        now = time.time()
-        if now - self._hour_reset_ts > 3600:
-            self._sent_count = 0
-            self._hour_reset_ts = now
-        return self._sent_count < 30
+        """Take one send token; False when the bucket is empty (30/hour)."""
+        return self._take_tokens(1) == 1
+
+    def _take_tokens(self, wanted: int) -> int:
+        """
+        Refill the bucket, then take up to `wanted` whole tokens and return how
+        many were granted. There is no await between refill and take, so
+        concurrent sends on the event loop cannot spend the same token.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            float(_SEND_LIMIT_PER_HOUR),
+            self._tokens + (now - self._last_refill) * _REFILL_PER_SECOND,
+        )
+        self._last_refill = now
+        granted = min(wanted, int(self._tokens))
+        self._tokens -= granted
+        return granted
+
+    def _refund_token(self) -> None:
+        """Give back the token of a send that Outlook did not accept."""
+        self._tokens = min(float(_SEND_LIMIT_PER_HOUR), self._tokens + 1.0)
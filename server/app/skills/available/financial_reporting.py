@@ -6,10 +6,13 @@ professional statements (P&L, balance sheet, cash flow) as PDF, CSV, or JSON.
 Used by FinanceAgent and ManagementAgent.
 """
 
-import json
+import csv
+import io
 import logging
 from typing import Any, Optional
 
+from app.llm import json_codec
+
 logger = logging.getLogger("mezzofy.skills.financial_reporting")
 
 
@@ -23,6 +26,7 @@ class FinancialReportingSkill:
         self.config = config
         from app.tools.database.db_ops import DatabaseOps
         self._db = DatabaseOps(config)
+        self._pdf = None  # PDFOps, created on first PDF export
 
     # ── Public methods ────────────────────────────────────────────────────────
 
@@ -54,8 +58,9 @@ class FinancialReportingSkill:
                 department=department,
             )
             logger.info(
-                f"FinancialReportingSkill.financial_query: type={report_type} "
-                f"{start_date}→{end_date}"
+                "FinancialReportingSkill.financial_query: type=%s %s→%s",
+                report_type, start_date, end_date,
+                extra={"skill": "financial_reporting", "report_type": report_type},
             )
             return result
         except Exception as e:
@@ -76,8 +81,8 @@ class FinancialReportingSkill:
         try:
             if format == "json":
                 if isinstance(data, dict):
-                    return {"success": True, "output": json.dumps(data, indent=2)}
-                return {"success": True, "output": json.dumps({"data": str(data)}, indent=2)}
+                    return {"success": True, "output": json_codec.dumps(data, indent=True)}
+                return {"success": True, "output": json_codec.dumps({"data": str(data)}, indent=True)}
 
             if format == "csv":
                 return await self._format_as_csv(data)
@@ -95,21 +100,21 @@ class FinancialReportingSkill:
 
     async def _format_as_csv(self, data: Any) -> dict:
         """Convert financial data to CSV string."""
-        import csv
-        import io
-
         rows = data if isinstance(data, list) else data.get("rows", [data])
-        output = io.StringIO()
+        output = io.StringIO(newline="")
         if rows:
-            writer = csv.DictWriter(output, fieldnames=rows[0].keys())
-            writer.writeheader()
-            writer.writerows(rows)
+            # Plain csv.writer over tuples: DictWriter re-checks every row's keys in Python
+            fieldnames = list(rows[0].keys())
+            writer = csv.writer(output)
+            writer.writerow(fieldnames)
+            writer.writerows(tuple(r.get(k, "") for k in fieldnames) for r in rows)
         return {"success": True, "output": output.getvalue()}
 
     async def _format_as_pdf(self, data: Any) -> dict:
         """Delegate PDF creation to PdfOps."""
-        from app.tools.document.pdf_ops import PDFOps
-        pdf_ops = PDFOps(self.config)
-        content = json.dumps(data, indent=2) if not isinstance(data, str) else data
-        result = await pdf_ops.execute("create_pdf", content=content, title="Financial Report")
+        if self._pdf is None:
+            from app.tools.document.pdf_ops import PDFOps
+            self._pdf = PDFOps(self.config)
+        content = json_codec.dumps(data, indent=True) if not isinstance(data, str) else data
+        result = await self._pdf.execute("create_pdf", content=content, title="Financial Report")
         return result
@@ -55,10 +55,14 @@ class LinkedinProspectingSkill:
                 type=search_type,
                 limit=max_results,
             )
-            logger.info(
-                f"LinkedInProspectingSkill.search_linkedin: query='{query}' "
-                f"type={search_type} results={len(result.get('output', []))}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                output = result.get("output")
+                count = output.get("count", 0) if isinstance(output, dict) else 0
+                logger.info(
+                    "LinkedInProspectingSkill.search_linkedin: query='%s' type=%s results=%d",
+                    query, search_type, count,
+                    extra={"skill": "linkedin_prospecting", "results": count},
+                )
             return result
         except Exception as e:
             logger.error(f"LinkedInProspectingSkill.search_linkedin failed: {e}")
@@ -75,9 +79,39 @@ class LinkedinProspectingSkill:
             {success: bool, output: dict | error: str}
         """
         try:
-            result = await self._ops.execute("linkedin_extract", url=url)
-            logger.info(f"LinkedInProspectingSkill.extract_profile: url={url}")
+            result = await self._ops.execute("linkedin_extract", profile_url=url)
+            logger.info(
+                "LinkedInProspectingSkill.extract_profile: url=%s", url,
+                extra={"skill": "linkedin_prospecting"},
+            )
             return result
         except Exception as e:
             logger.error(f"LinkedInProspectingSkill.extract_profile failed: {e}")
             return {"success": False, "error": str(e)}
+
+    async def extract_profiles(self, urls: list[str], max_concurrency: int = 3) -> dict:
+        """
+        Extract several LinkedIn profiles in one authenticated browser session.
+
+        Args:
+            urls: LinkedIn profile URLs.
+            max_concurrency: Profiles loaded at once (capped at 3 by LinkedInOps).
+
+        Returns:
+            {success: bool, output: {profiles: list[dict], extracted: int} | error: str}
+            Each profile dict has "url" plus the profile fields, or "error".
+        """
+        try:
+            result = await self._ops.execute(
+                "linkedin_extract_batch",
+                profile_urls=urls,
+                max_concurrency=max_concurrency,
+            )
+            logger.info(
+                "LinkedInProspectingSkill.extract_profiles: urls=%d", len(urls),
+                extra={"skill": "linkedin_prospecting"},
+            )
+            return result
+        except Exception as e:
+            logger.error(f"LinkedInProspectingSkill.extract_profiles failed: {e}")
+            return {"success": False, "error": str(e)}
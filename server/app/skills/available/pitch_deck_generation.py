@@ -6,9 +6,12 @@ the latest product info, pricing, and case studies.
 Used by SalesAgent for customer-specific pitch materials.
 """
 
+import asyncio
 import logging
 from typing import Optional
 
+from app.skills.truncation import truncate_repr
+
 logger = logging.getLogger("mezzofy.skills.pitch_deck_generation")
 
 
@@ -73,8 +76,9 @@ class PitchDeckGenerationSkill:
                 slides=slides,
             )
             logger.info(
-                f"PitchDeckGenerationSkill.create_pitch_deck: "
-                f"customer='{customer_name}' industry={industry}"
+                "PitchDeckGenerationSkill.create_pitch_deck: customer='%s' industry=%s",
+                customer_name, industry,
+                extra={"skill": "pitch_deck_generation"},
             )
             return result
 
@@ -98,7 +102,8 @@ class PitchDeckGenerationSkill:
                 category=product_category,
             )
             logger.info(
-                f"PitchDeckGenerationSkill.get_mezzofy_products: category={product_category}"
+                "PitchDeckGenerationSkill.get_mezzofy_products: category=%s", product_category,
+                extra={"skill": "pitch_deck_generation"},
             )
             return result
         except Exception as e:
@@ -139,35 +144,24 @@ class PitchDeckGenerationSkill:
             },
         ]
 
-        # Products slide
-        products_result = await self._data.execute(
-            "get_products", category=(focus_products[0] if focus_products else None)
-        )
-        if products_result.get("success") and products_result.get("output"):
-            sections.append({
-                "title": "Product Features",
-                "content": str(products_result["output"])[:2000],
-            })
-
-        # Case studies slide
+        # Data slides — independent MezzofyDataOps calls, fetched together.
+        # (title, character cap, request), in slide order.
+        fetches = [(
+            "Product Features", 2000,
+            self._data.execute("get_products", category=(focus_products[0] if focus_products else None)),
+        )]
         if include_case_studies:
-            cs_result = await self._data.execute(
-                "get_case_studies", industry=industry
-            )
-            if cs_result.get("success") and cs_result.get("output"):
-                sections.append({
-                    "title": "Case Studies",
-                    "content": str(cs_result["output"])[:2000],
-                })
-
-        # Pricing slide
+            fetches.append(("Case Studies", 2000, self._data.execute("get_case_studies", industry=industry)))
         if include_pricing:
-            pricing_result = await self._data.execute("get_pricing")
-            if pricing_result.get("success") and pricing_result.get("output"):
-                sections.append({
-                    "title": "Pricing",
-                    "content": str(pricing_result["output"])[:1500],
-                })
+            fetches.append(("Pricing", 1500, self._data.execute("get_pricing")))
+
+        results = await asyncio.gather(*(request for _, _, request in fetches), return_exceptions=True)
+        for (title, limit, _), result in zip(fetches, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"PitchDeckGenerationSkill: '{title}' data fetch failed: {result}")
+                continue
+            if result.get("success") and result.get("output"):
+                sections.append({"title": title, "content": truncate_repr(result["output"], limit)})
 
         sections.append({
             "title": "Next Steps",
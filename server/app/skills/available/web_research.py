@@ -7,8 +7,12 @@ CRM enrichment, and competitive analysis.
 Used by SalesAgent and ManagementAgent.
 """
 
+import asyncio
 import logging
 from typing import Optional
+from urllib.parse import urlencode
+
+from app.skills.truncation import truncate_repr
 
 logger = logging.getLogger("mezzofy.skills.web_research")
 
@@ -42,37 +46,41 @@ class WebResearchSkill:
         Args:
             company_name: Target company name.
             website_url: Company website URL (if known).
-            focus_areas: Aspects to extract: "products", "team", "funding", "news".
+            focus_areas: Aspects to extract. The site's page text (products, about)
+                is always scraped; "team" adds contact details and is on by
+                default when focus_areas is omitted.
 
         Returns:
             {success: bool, output: dict with company profile | error: str}
         """
         try:
             profile: dict = {"company_name": company_name}
-            focus = set(focus_areas or ["products", "team"])
+            want_contact = not focus_areas or "team" in focus_areas
 
             if website_url:
-                # Extract main page text
-                scrape_result = await self._scraping.execute(
-                    "scrape_url",
-                    url=website_url,
-                    extract_text=True,
-                )
-                if scrape_result.get("success"):
-                    profile["website_content"] = str(scrape_result.get("output", ""))[:3000]
-
-                # Extract contact info
-                if "team" in focus:
-                    contact_result = await self._scraping.execute(
-                        "extract_contact_info",
-                        url=website_url,
-                    )
-                    if contact_result.get("success"):
-                        profile["contact_info"] = contact_result.get("output", {})
+                # Page text and contact details are independent fetches — run them together
+                fetches = [self._scraping.execute("scrape_url", url=website_url, extract_text=True)]
+                if want_contact:
+                    fetches.append(self._scraping.execute("extract_contact_info", url=website_url))
+                results = await asyncio.gather(*fetches, return_exceptions=True)
+                for action, result in zip(("scrape_url", "extract_contact_info"), results):
+                    if isinstance(result, BaseException):
+                        logger.warning(
+                            "WebResearchSkill.research_company: %s failed for %s: %r",
+                            action, website_url, result,
+                            extra={"skill": "web_research"},
+                        )
+                scrape_result, *contact = results
+
+                if isinstance(scrape_result, dict) and scrape_result.get("success"):
+                    profile["website_content"] = truncate_repr(scrape_result.get("output", ""), 3000)
+                if contact and isinstance(contact[0], dict) and contact[0].get("success"):
+                    profile["contact_info"] = contact[0].get("output", {})
 
             logger.info(
-                f"WebResearchSkill.research_company: '{company_name}' "
-                f"url={website_url} focus={focus}"
+                "WebResearchSkill.research_company: '%s' url=%s contact=%s",
+                company_name, website_url, want_contact,
+                extra={"skill": "web_research"},
             )
             return {"success": True, "output": profile}
 
@@ -80,6 +88,30 @@ class WebResearchSkill:
             logger.error(f"WebResearchSkill.research_company failed: {e}")
             return {"success": False, "error": str(e)}
 
+    async def research_companies(self, companies: list[dict], max_concurrency: int = 5) -> list[dict]:
+        """
+        Research several companies concurrently, at most max_concurrency at a time.
+
+        Args:
+            companies: research_company() kwargs per company, e.g.
+                [{"company_name": "Acme", "website_url": "https://acme.com"}, ...]
+            max_concurrency: Companies researched at once (each may open a browser page).
+
+        Returns:
+            One research_company() result per company, in order.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(company: dict) -> dict:
+            async with sem:
+                return await self.research_company(**company)
+
+        results = await asyncio.gather(*(_one(c) for c in companies), return_exceptions=True)
+        return [
+            {"success": False, "error": str(r)} if isinstance(r, BaseException) else r
+            for r in results
+        ]
+
     async def search_web(self, query: str, max_results: int = 10) -> dict:
         """
         Perform a web search and extract relevant information.
@@ -93,15 +125,16 @@ class WebResearchSkill:
         """
         try:
             # Use browser to open a search page and extract results
-            search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}&num={max_results}"
+            search_url = "https://www.google.com/search?" + urlencode({"q": query, "num": max_results})
             result = await self._browser.execute("extract_text", url=search_url)
             if result.get("success"):
                 logger.info(
-                    f"WebResearchSkill.search_web: query='{query}' max={max_results}"
+                    "WebResearchSkill.search_web: query='%s' max=%s", query, max_results,
+                    extra={"skill": "web_research"},
                 )
                 return {
                     "success": True,
-                    "output": {"query": query, "results": str(result.get("output", ""))[:3000]},
+                    "output": {"query": query, "results": truncate_repr(result.get("output", ""), 3000)},
                 }
 
             # Fall back to scraping links from search
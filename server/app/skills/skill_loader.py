@@ -1,15 +1,18 @@
 """
-SkillLoader — Scans the available/ directory and loads all YAML + Python skill pairs.
+SkillLoader — Scans the available/ directory and indexes all YAML + Python skill pairs.
 
 Each skill is a:
   - <name>.yaml  — metadata: name, version, description, capabilities, tools
   - <name>.py    — implementation: class <NameSkill> with helper methods
 
-Called by SkillRegistry at startup (lazy-loaded on first agent use).
+Called by SkillRegistry at startup. Startup reads only the YAML; each skill's
+module is imported and its class instantiated on first get().
 """
 
 import importlib
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -20,70 +23,113 @@ logger = logging.getLogger("mezzofy.skills.loader")
 # Path to available skills directory (relative to this file)
 _AVAILABLE_DIR = Path(__file__).parent / "available"
 
+# libyaml's loader parses the skill YAMLs ~10x faster; fall back if PyYAML was built without it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# yaml path → (mtime_ns, parsed skill definition) — re-parsed only when the file changes
+_META_CACHE: dict[Path, tuple[int, dict]] = {}
+
+
+def _read_skill_yaml(yaml_path: Path) -> dict:
+    """Parse a skill YAML, reusing the previous parse while the file is unchanged."""
+    mtime_ns = yaml_path.stat().st_mtime_ns
+    cached = _META_CACHE.get(yaml_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    skill_def = yaml.load(yaml_path.read_text(encoding="utf-8"), Loader=_YAML_LOADER) or {}
+    _META_CACHE[yaml_path] = (mtime_ns, skill_def)
+    return skill_def
+
 
 class SkillLoader:
     """Loads and indexes all available skill packages."""
 
     def __init__(self):
-        self._skills: dict[str, dict] = {}  # name → {meta, instance}
+        # name → {meta, module, instance}; instance is None until first get()
+        self._skills: dict[str, dict] = {}
+        self._config: dict = {}
         self._loaded = False
+        self._lock = threading.Lock()   # first get() may race across worker threads
 
     def load_all(self, config: Optional[dict] = None) -> None:
         """
-        Scan available/ for YAML files, load each skill's Python class,
-        and register in _skills dict.
+        Scan available/ for YAML files and register each skill's metadata.
+
+        Only the YAML is read here. The Python module is imported and the
+        skill class instantiated on the first get() for that skill, so a
+        worker never pays for skills (and their imports, e.g. Playwright)
+        it does not use.
         """
         if self._loaded:
             return
+        self._config = config or {}
 
         for yaml_path in sorted(_AVAILABLE_DIR.glob("*.yaml")):
             try:
-                skill_def = yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
+                skill_def = _read_skill_yaml(yaml_path)
                 name = skill_def.get("name")
                 if not name:
                     logger.warning(f"Skill YAML missing 'name': {yaml_path}")
                     continue
-
-                # Load matching Python module
-                module_name = f"app.skills.available.{yaml_path.stem}"
-                try:
-                    module = importlib.import_module(module_name)
-                    # Expect class NameSkill — e.g. linkedin_prospecting → LinkedInProspectingSkill
-                    class_name = self._to_class_name(yaml_path.stem)
-                    cls = getattr(module, class_name, None)
-                    if cls is None:
-                        logger.warning(f"Skill class '{class_name}' not found in {module_name}")
-                        continue
-                    instance = cls(config or {})
-                except Exception as e:
-                    logger.warning(f"Failed to load skill class for '{name}': {e}")
+                if not yaml_path.with_suffix(".py").exists():
+                    logger.warning(f"Skill module missing for '{name}': {yaml_path.with_suffix('.py')}")
                     continue
 
                 self._skills[name] = {
                     "meta": skill_def,
-                    "instance": instance,
+                    "module": f"app.skills.available.{yaml_path.stem}",
+                    "instance": None,
                 }
-                logger.debug(f"Loaded skill: {name} (v{skill_def.get('version', '?')})")
+                logger.debug(f"Registered skill: {name} (v{skill_def.get('version', '?')})")
 
             except Exception as e:
                 logger.error(f"Failed to load skill from {yaml_path}: {e}")
 
         self._loaded = True
-        logger.info(f"SkillLoader: {len(self._skills)} skills loaded")
+        logger.info(f"SkillLoader: {len(self._skills)} skills registered")
 
     def get(self, name: str) -> Optional[dict]:
-        """Return {meta, instance} for named skill, or None."""
+        """Return {meta, instance} for named skill (instantiating it on first use), or None."""
         if not self._loaded:
             self.load_all()
-        return self._skills.get(name)
+        entry = self._skills.get(name)
+        if entry is None or entry["instance"] is not None:
+            return entry
+
+        with self._lock:
+            if entry["instance"] is None:
+                instance = self._instantiate(name, entry["module"])
+                if instance is None:
+                    self._skills.pop(name, None)
+                    return None
+                entry["instance"] = instance
+        return entry
 
     def list_skills(self) -> list[str]:
-        """Return names of all loaded skills."""
+        """Return names of all registered skills."""
         if not self._loaded:
             self.load_all()
         return list(self._skills.keys())
 
+    def _instantiate(self, name: str, module_name: str):
+        """Import the skill's module and construct its class; None on failure."""
+        try:
+            module = importlib.import_module(module_name)
+            # Expect class NameSkill — e.g. linkedin_prospecting → LinkedInProspectingSkill
+            class_name = self._to_class_name(module_name.rsplit(".", 1)[-1])
+            cls = getattr(module, class_name, None)
+            if cls is None:
+                logger.warning(f"Skill class '{class_name}' not found in {module_name}")
+                return None
+            instance = cls(self._config)
+        except Exception as e:
+            logger.warning(f"Failed to load skill class for '{name}': {e}")
+            return None
+        logger.debug(f"Instantiated skill: {name}")
+        return instance
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def _to_class_name(stem: str) -> str:
         """Convert snake_case stem to CamelCaseSkill class name."""
-        return "".join(word.capitalize() for word in stem.split("_")) + "Skill"
+        return stem.replace("_", " ").title().replace(" ", "") + "Skill"
@@ -16,6 +16,9 @@ logger = logging.getLogger("mezzofy.skills.registry")
 _loader: Optional[SkillLoader] = None
 _config: dict = {}
 
+# name → skill instance; agents look skills up on every tool call
+_instances: dict[str, object] = {}
+
 
 def init(config: dict) -> None:
     """
@@ -25,10 +28,18 @@ def init(config: dict) -> None:
     global _loader, _config
     _config = config
     _loader = SkillLoader()
+    _instances.clear()
     _loader.load_all(config)
     logger.info(f"SkillRegistry initialized: {_loader.list_skills()}")
 
 
+def reload() -> None:
+    """Drop all loaded skills; they are re-read and re-created on next use."""
+    global _loader
+    _loader = None
+    _instances.clear()
+
+
 def get(name: str):
     """
     Return the skill instance for the given name.
@@ -39,6 +50,10 @@ def get(name: str):
     Returns:
         Skill instance, or None if not found.
     """
+    instance = _instances.get(name)
+    if instance is not None:
+        return instance
+
     global _loader, _config
     if _loader is None:
         # Lazy init if not explicitly initialized
@@ -49,6 +64,7 @@ def get(name: str):
     if entry is None:
         logger.warning(f"SkillRegistry.get: skill '{name}' not found")
         return None
+    _instances[name] = entry["instance"]
     return entry["instance"]
 
 
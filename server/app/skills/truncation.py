@@ -0,0 +1,47 @@
+"""
+Bounded str() for tool output that goes into prompts and slide content.
+
+Skills keep only the first few thousand characters of a tool result, but
+str(result)[:n] renders the whole object first — a full product catalog
+or search dump, just to slice off its head. truncate_repr() yields the same
+text as str(obj)[:limit] while rendering only as much of plain lists and
+dicts as the limit needs.
+"""
+
+from typing import Any, Iterator
+
+
+def _repr_pieces(obj: Any) -> Iterator[str]:
+    """Yield str(obj) in fragments, descending into plain lists and dicts."""
+    if type(obj) is list:
+        yield "["
+        for i, item in enumerate(obj):
+            if i:
+                yield ", "
+            yield from _repr_pieces(item)
+        yield "]"
+    elif type(obj) is dict:
+        yield "{"
+        for i, (key, value) in enumerate(obj.items()):
+            if i:
+                yield ", "
+            yield repr(key)
+            yield ": "
+            yield from _repr_pieces(value)
+        yield "}"
+    else:
+        yield repr(obj)
+
+
+def truncate_repr(obj: Any, limit: int) -> str:
+    """str(obj)[:limit], without rendering more of a list or dict than needed."""
+    if type(obj) not in (list, dict):
+        return str(obj)[:limit]
+    parts: list[str] = []
+    size = 0
+    for piece in _repr_pieces(obj):
+        parts.append(piece)
+        size += len(piece)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
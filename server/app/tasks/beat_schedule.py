@@ -14,9 +14,11 @@ Beat is started with:
 All schedules use UTC timezone. Conversion: 9AM SGT = 01:00 UTC, 10AM SGT = 02:00 UTC.
 """
 
-import asyncio
 import logging
+import re
 import time
+import types
+from functools import lru_cache
 
 from celery.beat import PersistentScheduler
 from celery.schedules import crontab
@@ -28,7 +30,16 @@ logger = logging.getLogger("mezzofy.tasks.beat")
 
 # ── Static built-in schedules ─────────────────────────────────────────────────
 
-STATIC_BEAT_SCHEDULE = {
+def _fire_and_forget(entry: dict) -> dict:
+    """
+    Add ignore_result to a Beat entry's apply_async options. Nothing reads the
+    result of a scheduled run (outcomes go to agent_tasks and the delivery
+    channel), so the Redis result write and its 24 h retention are pure cost.
+    """
+    return {**entry, "options": {**entry.get("options", {}), "ignore_result": True}}
+
+
+_STATIC_JOBS = {
 
     # System health check — every 5 minutes
     "system-health-check": {
@@ -212,42 +223,51 @@ STATIC_BEAT_SCHEDULE = {
     },
 }
 
+# Read-only: setup_schedule() copies it, so nothing can alter the built-ins in place
+STATIC_BEAT_SCHEDULE = types.MappingProxyType(
+    {name: _fire_and_forget(entry) for name, entry in _STATIC_JOBS.items()}
+)
+
 
 # ── DB job loader ─────────────────────────────────────────────────────────────
 
+# Upper bound on user-created jobs held in the Beat schedule (config: scheduler.max_beat_jobs)
+_MAX_BEAT_JOBS = 5000
+
 def load_db_jobs() -> dict:
     """
     Load user-created jobs from the scheduled_jobs PostgreSQL table.
 
     Returns a dict in Celery Beat schedule format, ready to be merged with
     STATIC_BEAT_SCHEDULE. Only active jobs (is_active=True) are loaded.
+
+    Beat is synchronous, so this uses the sync engine — one SELECT does not
+    need an event loop, and the pooled connection is reused across reloads.
     """
     try:
-        # Invalidate the async engine's connection pool before creating a new
-        # event loop via asyncio.run().  close=False avoids calling async
-        # close() on existing connections (which raises MissingGreenlet);
-        # the connections are simply discarded and fresh ones are created.
-        from app.core.database import engine
-        engine.sync_engine.dispose(close=False)
-        return asyncio.run(_load_db_jobs_async())
+        from app.core.config import get_config
+        from app.core.database import SyncSessionLocal
+        from sqlalchemy import text
+
+        limit = get_config().get("scheduler", {}).get("max_beat_jobs", _MAX_BEAT_JOBS)
+        with SyncSessionLocal() as db:
+            # Served by the partial index idx_scheduled_jobs_beat (created_at WHERE is_active)
+            rows = db.execute(
+                text(
+                    "SELECT id, user_id, name, agent, message, workflow_name, schedule, deliver_to "
+                    "FROM scheduled_jobs WHERE is_active = TRUE ORDER BY created_at LIMIT :lim"
+                ),
+                {"lim": limit},
+            ).fetchall()
     except Exception as e:
         logger.error(f"Failed to load DB scheduled jobs: {e}")
         return {}
 
-
-async def _load_db_jobs_async() -> dict:
-    """Async implementation of load_db_jobs."""
-    from app.core.database import AsyncSessionLocal
-    from sqlalchemy import text
-
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(
-            text(
-                "SELECT id, user_id, name, agent, message, workflow_name, schedule, deliver_to "
-                "FROM scheduled_jobs WHERE is_active = TRUE ORDER BY created_at"
-            )
+    if len(rows) >= limit:
+        logger.warning(
+            f"Beat loaded the maximum of {limit} active scheduled jobs — newer jobs are not "
+            f"scheduled; raise scheduler.max_beat_jobs"
         )
-        rows = result.fetchall()
 
     schedule = {}
     for row in rows:
@@ -276,7 +296,7 @@ def _row_to_beat_entry(row) -> dict | None:
 
     deliver_to = row.deliver_to if isinstance(row.deliver_to, dict) else {}
 
-    return {
+    return _fire_and_forget({
         "task": "app.tasks.tasks.process_agent_task",
         "schedule": parsed_crontab,
         "args": [{
@@ -290,7 +310,7 @@ def _row_to_beat_entry(row) -> dict | None:
             "deliver_to": deliver_to,
             "_job_id": str(row.id),
         }],
-    }
+    })
 
 
 def _normalize_dow(dow: str) -> str:
@@ -299,23 +319,33 @@ def _normalize_dow(dow: str) -> str:
     Standard cron also allows 7 as a Sunday alias; ranges like '1-7' must be
     translated or Celery raises a ValueError and silently skips the job.
     """
-    import re
     if dow in ('1-7', '0-7'):
         return '*'
     return re.sub(r'(?<![0-9])7(?![0-9])', '0', dow)
 
 
+# One cron field: comma-separated items of '*' or a value/range (numbers or
+# three-letter day/month names), each optionally stepped ('*/15', '1-5/2').
+# Anything else cannot be a valid crontab field, so it is rejected up front.
+_CRON_VALUE = r"(?:\d+|[A-Za-z]{3})"
+_CRON_ITEM = rf"(?:\*|{_CRON_VALUE}(?:-{_CRON_VALUE})?)(?:/\d+)?"
+_CRON_FIELD_RE = re.compile(rf"{_CRON_ITEM}(?:,{_CRON_ITEM})*")
+
+
+@lru_cache(maxsize=4096)
 def _parse_cron(expr: str) -> crontab | None:
     """
     Parse a standard 5-field cron expression into a Celery crontab object.
 
-    Returns None if the expression is invalid.
+    Returns None if the expression is invalid. Cached by expression: Beat
+    re-reads every DB job each reload interval, and most jobs share a handful
+    of schedules. Entries may share one crontab — its fields are never mutated.
     """
     if not expr or not expr.strip():
         return None
 
-    parts = expr.strip().split()
-    if len(parts) != 5:
+    parts = expr.split()
+    if len(parts) != 5 or not all(_CRON_FIELD_RE.fullmatch(part) for part in parts):
         return None
 
     minute, hour, day_of_month, month_of_year, day_of_week = parts
@@ -357,17 +387,17 @@ class DatabaseScheduler(PersistentScheduler):
 
     def setup_schedule(self):
         # Start with static built-in schedule
-        static = {**STATIC_BEAT_SCHEDULE}
+        merged = dict(STATIC_BEAT_SCHEDULE)
 
         # Merge user-created DB jobs
         db_jobs = load_db_jobs()
-        merged = {**static, **db_jobs}
+        merged.update(db_jobs)
 
         # Inject into Celery app config
         self.app.conf.beat_schedule = merged
 
         logger.info(
-            f"Beat schedule loaded: {len(static)} static + {len(db_jobs)} DB jobs "
+            f"Beat schedule loaded: {len(STATIC_BEAT_SCHEDULE)} static + {len(db_jobs)} DB jobs "
             f"= {len(merged)} total"
         )
 
@@ -13,7 +13,12 @@ Beat (scheduled jobs) is started separately:
 
 import os
 from celery import Celery
-from celery.signals import worker_process_init
+from celery.signals import worker_process_init, worker_process_shutdown
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ── App init ──────────────────────────────────────────────────────────────────
 
@@ -31,13 +36,34 @@ celery_app = Celery(
     ],
 )
 
+# ── Serialisation ─────────────────────────────────────────────────────────────
+# Task payloads carry full agent messages and results (often 10+ KB of LLM
+# output); orjson encodes and decodes them several times faster than the
+# stdlib json Kombu uses. datetime/UUID/Decimal go out as strings, as in
+# json_codec. "json" stays accepted so messages queued by a process still on
+# the stdlib serializer are consumed during a rolling deploy.
+
+if orjson is not None:
+    from kombu.serialization import register
+
+    def _orjson_dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    register(
+        "orjson", _orjson_dumps, orjson.loads,
+        content_type="application/x-orjson", content_encoding="utf-8",
+    )
+    _SERIALIZER = "orjson"
+else:
+    _SERIALIZER = "json"
+
 # ── Configuration ─────────────────────────────────────────────────────────────
 
 celery_app.conf.update(
     # Serialisation
-    task_serializer="json",
-    result_serializer="json",
-    accept_content=["json"],
+    task_serializer=_SERIALIZER,
+    result_serializer=_SERIALIZER,
+    accept_content=["orjson", "json"] if _SERIALIZER == "orjson" else ["json"],
 
     # Timezone: UTC (cron expressions are stored and evaluated in UTC)
     # Conversion examples: 9AM SGT = 01:00 UTC, 10AM SGT = 02:00 UTC, 5PM SGT = 09:00 UTC
@@ -81,14 +107,24 @@ celery_app.conf.task_routes = {
 
 
 # ── Event loop safety (Bug B fix) ─────────────────────────────────────────────
-# AsyncSessionLocal and the SQLAlchemy engine are module-level singletons bound
-# to the event loop that was active when the Celery worker forked from the parent
-# process.  asyncio.run() creates and closes a new event loop per task call, so
-# on the second call the engine's asyncpg connections point at the closed parent
-# loop → "Future attached to a different loop".
-# Disposing the sync-engine's connection pool at worker-process-init ensures
-# each asyncio.run() call starts with fresh connections on the current loop.
+# AsyncSessionLocal and the SQLAlchemy engine are module-level singletons; their
+# asyncpg connections belong to the event loop that opened them.  Task bodies
+# run their async code on one persistent loop per worker process
+# (app.tasks.worker_loop.run_async) instead of a fresh asyncio.run() loop per
+# call, so pooled connections, Redis clients and HTTP pools stay valid across
+# tasks.  After fork the child drops the parent's pool without closing the
+# parent's sockets, then starts its own loop thread.
 @worker_process_init.connect
 def reset_db_pool(**kwargs):
     from app.core.database import engine
+    from app.tasks.worker_loop import start_worker_loop
+
     engine.sync_engine.dispose(close=False)
+    start_worker_loop()
+
+
+@worker_process_shutdown.connect
+def stop_loop(**kwargs):
+    from app.tasks.worker_loop import stop_worker_loop
+
+    stop_worker_loop()
@@ -15,10 +15,10 @@ Tasks:
 All schedules are in UTC. Conversion: 9AM SGT = 01:00 UTC, 8:30AM SGT = 00:30 UTC.
 """
 
-import asyncio
 import logging
 
 from app.tasks.celery_app import celery_app
+from app.tasks.worker_loop import run_async
 
 logger = logging.getLogger("mezzofy.tasks.finance")
 
@@ -33,7 +33,7 @@ def check_overdue_invoices():
     """
     logger.info("Finance task: checking overdue invoices")
     try:
-        asyncio.run(_check_overdue_invoices_async())
+        run_async(_check_overdue_invoices_async())
     except Exception as e:
         logger.error(f"check_overdue_invoices failed: {e}")
         raise
@@ -49,7 +49,7 @@ def ar_ap_weekly_summary():
     """
     logger.info("Finance task: generating weekly AR/AP summary")
     try:
-        asyncio.run(_ar_ap_weekly_summary_async())
+        run_async(_ar_ap_weekly_summary_async())
     except Exception as e:
         logger.error(f"ar_ap_weekly_summary failed: {e}")
         raise
@@ -65,7 +65,7 @@ def month_close_reminder():
     """
     logger.info("Finance task: sending month-end close reminder")
     try:
-        asyncio.run(_month_close_reminder_async())
+        run_async(_month_close_reminder_async())
     except Exception as e:
         logger.error(f"month_close_reminder failed: {e}")
         raise
@@ -81,7 +81,7 @@ def gst_filing_reminder():
     """
     logger.info("Finance task: sending GST filing reminder")
     try:
-        asyncio.run(_gst_filing_reminder_async())
+        run_async(_gst_filing_reminder_async())
     except Exception as e:
         logger.error(f"gst_filing_reminder failed: {e}")
         raise
@@ -97,7 +97,7 @@ def generate_monthly_statements():
     """
     logger.info("Finance task: generating monthly financial statements")
     try:
-        asyncio.run(_generate_monthly_statements_async())
+        run_async(_generate_monthly_statements_async())
     except Exception as e:
         logger.error(f"generate_monthly_statements failed: {e}")
         raise
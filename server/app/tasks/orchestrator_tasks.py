@@ -10,18 +10,18 @@ Tasks:
     notify_step_complete     — WS notification: step done
     notify_step_retry        — WS notification: step retrying
 
-All Celery task bodies are synchronous. Async operations are wrapped in asyncio.run().
-Per project standard: `from app.core.database import engine; engine.sync_engine.dispose()`
-precedes every asyncio.run() call to prevent "Future attached to a different loop" errors.
+All Celery task bodies are synchronous. Async operations are wrapped in run_async(),
+which runs them on the worker process's persistent event loop — pooled DB and Redis
+connections stay bound to that one loop, so no per-call pool dispose is needed.
 """
 
-import asyncio
 import json
 import logging
 import os
 from datetime import datetime
 
 from app.tasks.celery_app import celery_app
+from app.tasks.worker_loop import run_async
 from app.orchestrator.plan_manager import plan_manager
 
 logger = logging.getLogger("mezzofy.tasks.orchestrator")
@@ -332,7 +332,7 @@ def _orchestrator_review(plan_id: str, step_id: str) -> dict:
         "Be lenient on first attempt."
     )
 
-    review_result = asyncio.run(_call_claude_for_review(review_prompt))
+    review_result = run_async(_call_claude_for_review(review_prompt))
 
     # Save review to step
     try:
@@ -479,7 +479,7 @@ def orchestrator_synthesise(plan_id: str):
         "Rules: No raw JSON. No 'step_1' references. Brand voice: direct, results-focused."
     )
 
-    final_response = asyncio.run(_call_claude_synthesis(synthesis_prompt))
+    final_response = run_async(_call_claude_synthesis(synthesis_prompt))
 
     # Persist final state
     plan.final_output = final_response
@@ -492,7 +492,7 @@ def orchestrator_synthesise(plan_id: str):
 
     # Append to conversation history
     try:
-        asyncio.run(_append_to_conversation(plan.session_id, final_response, plan_id, deliverables))
+        run_async(_append_to_conversation(plan.session_id, final_response, plan_id, deliverables))
     except Exception as e:
         logger.warning(f"orchestrator_synthesise: _append_to_conversation failed (non-fatal): {e}")
 
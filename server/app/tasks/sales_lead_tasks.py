@@ -18,7 +18,7 @@ Tasks:
         send personalised HTML email per PIC.
 
 All tasks:
-    - Use asyncio.run() at the Celery/async boundary.
+    - Use run_async() at the Celery/async boundary.
     - Use lazy inline imports for *Ops classes (per project pattern).
     - Rate-limit concurrent LLM calls via asyncio.Semaphore(5).
     - Log start/end with run_id; per-item try/except (never abort batch on single failure).
@@ -32,6 +32,7 @@ import re
 from datetime import datetime, timezone, timedelta
 
 from app.tasks.celery_app import celery_app
+from app.tasks.worker_loop import run_async
 
 logger = logging.getLogger("mezzofy.tasks.sales")
 
@@ -257,7 +258,7 @@ def ingest_leads_from_email(self):
     """Daily email lead ingestion from hello@/sales@ mailboxes."""
     logger.info(f"[Task] sales.ingest_leads_from_email started | run_id={self.request.id}")
     try:
-        result = asyncio.run(_ingest_leads_from_email_async(self.request.id))
+        result = run_async(_ingest_leads_from_email_async(self.request.id))
         logger.info(
             f"[Task] sales.ingest_leads_from_email done | run_id={self.request.id} | {result}"
         )
@@ -406,7 +407,7 @@ def ingest_leads_from_tickets(self):
     """Daily ticket lead ingestion from support_tickets table."""
     logger.info(f"[Task] sales.ingest_leads_from_tickets started | run_id={self.request.id}")
     try:
-        result = asyncio.run(_ingest_leads_from_tickets_async(self.request.id))
+        result = run_async(_ingest_leads_from_tickets_async(self.request.id))
         logger.info(
             f"[Task] sales.ingest_leads_from_tickets done | run_id={self.request.id} | {result}"
         )
@@ -576,7 +577,7 @@ def research_new_leads(self, targets: list = None):
     """Weekly web/LinkedIn lead research. Also triggered manually via API."""
     logger.info(f"[Task] sales.research_new_leads started | run_id={self.request.id}")
     try:
-        result = asyncio.run(_research_new_leads_async(self.request.id, targets))
+        result = run_async(_research_new_leads_async(self.request.id, targets))
         logger.info(
             f"[Task] sales.research_new_leads done | run_id={self.request.id} | {result}"
         )
@@ -750,7 +751,7 @@ def daily_crm_digest(self):
     """Daily CRM status digest — post to Teams + email each PIC."""
     logger.info(f"[Task] sales.daily_crm_digest started | run_id={self.request.id}")
     try:
-        result = asyncio.run(_daily_crm_digest_async(self.request.id))
+        result = run_async(_daily_crm_digest_async(self.request.id))
         logger.info(
             f"[Task] sales.daily_crm_digest done | run_id={self.request.id} | {result}"
         )
@@ -7,7 +7,8 @@ Tasks:
                                      batch email outreach, webhook-triggered workflows.
     health_check()                 — Periodic system health check (every 5 minutes).
 
-Celery workers run in separate processes; async agent code is called via asyncio.run().
+Celery workers run in separate processes; async agent code runs on the worker's
+persistent event loop via run_async() (app.tasks.worker_loop).
 """
 
 import asyncio
@@ -16,6 +17,7 @@ import os
 from typing import Optional
 
 from app.tasks.celery_app import celery_app
+from app.tasks.worker_loop import run_async
 from celery.signals import worker_process_init, worker_ready
 
 logger = logging.getLogger("mezzofy.tasks.core")
@@ -111,12 +113,7 @@ async def _recover_stale_tasks():
 @celery_app.task(name="app.tasks.tasks.cleanup_stuck_tasks")
 def cleanup_stuck_tasks():
     """Periodic cleanup: mark tasks stuck in 'running' for >1 hour as failed."""
-    try:
-        from app.core.database import engine
-        engine.sync_engine.dispose()
-    except Exception:
-        pass
-    asyncio.run(_cleanup_stuck_tasks_async())
+    run_async(_cleanup_stuck_tasks_async())
 
 
 async def _cleanup_stuck_tasks_async():
@@ -303,12 +300,7 @@ def process_agent_task(self, task_data: dict):
             - source:      "scheduler" | "webhook" (affects permission bypass)
     """
     try:
-        try:
-            from app.core.database import engine
-            engine.sync_engine.dispose()
-        except Exception:
-            pass
-        result = asyncio.run(_run_agent_task(task_data))
+        result = run_async(_run_agent_task(task_data))
         logger.info(
             f"process_agent_task completed: agent={task_data.get('agent')!r} "
             f"user={task_data.get('user_id')!r}"
@@ -544,12 +536,7 @@ def process_chat_task(self, task_data: dict):
     """
     task_data["_celery_task_id"] = self.request.id
     try:
-        try:
-            from app.core.database import engine
-            engine.sync_engine.dispose()
-        except Exception as _e:
-            logger.warning(f"process_chat_task engine.dispose() failed (non-fatal): {_e}")
-        result = asyncio.run(_run_chat_task(task_data))
+        result = run_async(_run_chat_task(task_data))
         logger.info(
             f"process_chat_task completed: user={task_data.get('user_id')!r} "
             f"task_id={self.request.id}"
@@ -563,14 +550,7 @@ def process_chat_task(self, task_data: dict):
         if isinstance(exc, SoftTimeLimitExceeded):
             logger.warning(f"process_chat_task soft time limit exceeded: {agent_task_id}")
             if agent_task_id:
-                # Dispose pool so the new asyncio.run() opens fresh connections
-                # (avoids "Future attached to a different loop" from the closed loop)
-                try:
-                    from app.core.database import engine
-                    engine.sync_engine.dispose()
-                except Exception:
-                    pass
-                asyncio.run(_update_agent_task_failed(
+                run_async(_update_agent_task_failed(
                     agent_task_id, "Task exceeded time limit (9 minutes)"
                 ))
             raise
@@ -581,13 +561,7 @@ def process_chat_task(self, task_data: dict):
             raise self.retry(exc=exc, countdown=10)
         except self.MaxRetriesExceededError:
             if agent_task_id:
-                # Dispose pool so the new asyncio.run() opens fresh connections
-                try:
-                    from app.core.database import engine
-                    engine.sync_engine.dispose()
-                except Exception:
-                    pass
-                asyncio.run(_update_agent_task_failed(agent_task_id, str(exc)))
+                run_async(_update_agent_task_failed(agent_task_id, str(exc)))
             raise
 
 
@@ -1052,13 +1026,6 @@ def process_delegated_agent_task(
         parent_task_id:         UUID of the parent agent_task_log row.
         requested_by_agent_id:  ID of the agent that delegated this task.
     """
-    # Dispose engine pool (same Celery async pattern as all other tasks)
-    try:
-        from app.core.database import engine
-        engine.sync_engine.dispose()
-    except Exception:
-        pass
-
     # Inject delegation context so log_task_start() records the chain
     task_data["_requesting_agent_id"] = requested_by_agent_id
     task_data["_parent_task_id"] = parent_task_id
@@ -1071,7 +1038,7 @@ def process_delegated_agent_task(
     step_id = task_data.get("_step_id", "")
 
     try:
-        result = asyncio.run(
+        result = run_async(
             _run_delegated_agent_task(task_data, agent_id, parent_task_id, log_id)
         )
         logger.info(
@@ -1087,7 +1054,7 @@ def process_delegated_agent_task(
                 f"(task_id={self.request.id}, plan_id={plan_id!r}, step_id={step_id!r})"
             )
             try:
-                asyncio.run(_update_delegated_task_log(log_id, "failed", error="soft_time_limit_exceeded"))
+                run_async(_update_delegated_task_log(log_id, "failed", error="soft_time_limit_exceeded"))
             except Exception:
                 pass
             return {
@@ -1102,7 +1069,7 @@ def process_delegated_agent_task(
         )
         # Update log row to failed before retrying
         try:
-            asyncio.run(_update_delegated_task_log(log_id, "failed", error=str(exc)))
+            run_async(_update_delegated_task_log(log_id, "failed", error=str(exc)))
         except Exception:
             pass
         raise self.retry(exc=exc, countdown=30 * (self.request.retries + 1))
@@ -1295,12 +1262,7 @@ def health_check():
 
     # PostgreSQL
     try:
-        try:
-            from app.core.database import engine
-            engine.sync_engine.dispose()
-        except Exception:
-            pass
-        asyncio.run(_check_db())
+        run_async(_check_db())
         results["database"] = "ok"
     except Exception as e:
         results["database"] = f"FAIL: {e}"
@@ -10,11 +10,11 @@ Each task:
 Called by: app.webhooks.webhooks (after returning 200 to the external service)
 """
 
-import asyncio
 import logging
 from datetime import datetime, timezone
 
 from app.tasks.celery_app import celery_app
+from app.tasks.worker_loop import run_async
 
 logger = logging.getLogger("mezzofy.tasks.webhook")
 
@@ -44,12 +44,12 @@ def handle_mezzofy_event(self, event_id: str, event_type: str, payload: dict):
         payload:    Parsed event data dict from the webhook body.
     """
     try:
-        asyncio.run(_run_mezzofy_event(event_id, event_type, payload))
+        run_async(_run_mezzofy_event(event_id, event_type, payload))
     except Exception as exc:
         logger.error(f"Mezzofy webhook task failed (event_id={event_id}): {exc}", exc_info=True)
         # Update event record to failed
         try:
-            asyncio.run(_mark_event_failed(event_id, str(exc)))
+            run_async(_mark_event_failed(event_id, str(exc)))
         except Exception:
             pass
         raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
@@ -121,11 +121,11 @@ def handle_teams_mention(self, event_id: str, payload: dict):
         payload:  Parsed Teams webhook payload dict.
     """
     try:
-        asyncio.run(_run_teams_mention(event_id, payload))
+        run_async(_run_teams_mention(event_id, payload))
     except Exception as exc:
         logger.error(f"Teams webhook task failed (event_id={event_id}): {exc}", exc_info=True)
         try:
-            asyncio.run(_mark_event_failed(event_id, str(exc)))
+            run_async(_mark_event_failed(event_id, str(exc)))
         except Exception:
             pass
         raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
@@ -220,11 +220,11 @@ def handle_custom_event(self, event_id: str, source: str, payload: dict):
         payload:  Parsed webhook payload dict.
     """
     try:
-        asyncio.run(_run_custom_event(event_id, source, payload))
+        run_async(_run_custom_event(event_id, source, payload))
     except Exception as exc:
         logger.error(f"Custom webhook task failed (event_id={event_id}): {exc}", exc_info=True)
         try:
-            asyncio.run(_mark_event_failed(event_id, str(exc)))
+            run_async(_mark_event_failed(event_id, str(exc)))
         except Exception:
             pass
         raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
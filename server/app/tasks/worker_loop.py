@@ -0,0 +1,116 @@
+"""
+Worker event loop — one long-lived asyncio loop per Celery worker process.
+
+Task bodies are synchronous; they used to run their async core with
+asyncio.run(), which built and tore down a loop per task. That threw away
+everything kept per loop — the SQLAlchemy pool (disposed before every run
+to avoid "Future attached to a different loop"), Redis clients, LLM HTTP
+pools, Graph clients, the shared browser — so each task reconnected to
+everything it touched.
+
+run_async(coro) instead submits the coroutine to a loop running forever in
+a daemon thread of the current process and blocks until it finishes, so
+those resources are created once per worker process and reused by every
+task it runs. The loop is started by worker_process_init (see celery_app)
+or lazily on first use, and is tied to the process that started it: after
+a fork the child starts its own.
+
+A Celery soft time limit raised while waiting cancels the coroutine, as
+asyncio.run() did when the exception unwound through it.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+logger = logging.getLogger("mezzofy.tasks.loop")
+
+T = TypeVar("T")
+
+_WORKER_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_pid: Optional[int] = None
+_start_lock = threading.Lock()
+
+
+def start_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return this process's worker loop, starting it (and its thread) if needed."""
+    global _WORKER_LOOP, _loop_thread, _loop_pid
+    with _start_lock:
+        pid = os.getpid()
+        if _WORKER_LOOP is not None and _loop_pid == pid and _loop_thread.is_alive():
+            return _WORKER_LOOP
+        # None yet, or inherited through fork — the parent's loop thread does not exist here
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="worker-event-loop", daemon=True)
+        thread.start()
+        _WORKER_LOOP, _loop_thread, _loop_pid = loop, thread, pid
+        logger.info(f"Worker event loop started in pid={pid}")
+        return loop
+
+
+def run_async(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    Run coro on the worker loop and return its result (or raise its exception).
+
+    Replaces asyncio.run() at the Celery task → async boundary. Like
+    asyncio.run(), it must not be called from code already running on the loop.
+    """
+    loop = start_worker_loop()
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_async() cannot be called from the worker event loop")
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except BaseException:
+        # Soft time limit, timeout or shutdown in the waiting thread — stop the work too
+        future.cancel()
+        raise
+
+
+def stop_worker_loop(timeout: float = 10.0) -> None:
+    """
+    Cancel outstanding tasks on this process's loop and stop it.
+
+    Cancelling lets background work finish its cleanup — e.g. LLMManager's
+    delayed usage flush writes its queued rows when cancelled. The shared
+    Chromium and the Graph $batch client are closed afterwards; they live as
+    long as the loop and would otherwise outlive the worker process.
+    """
+    global _WORKER_LOOP, _loop_thread, _loop_pid
+    with _start_lock:
+        loop, thread = _WORKER_LOOP, _loop_thread
+        if loop is None or _loop_pid != os.getpid():
+            return
+        _WORKER_LOOP = _loop_thread = _loop_pid = None
+
+    async def _drain() -> None:
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        from app.tools.web.browser_pool import close_browser_pool
+        try:
+            await close_browser_pool()
+        except Exception as e:
+            logger.warning(f"Closing the worker's browser failed: {e}")
+
+        from app.tools.communication.outlook_ops import close_batch_http_clients
+        try:
+            await close_batch_http_clients()
+        except Exception as e:
+            logger.warning(f"Closing the worker's Graph $batch client failed: {e}")
+
+    try:
+        asyncio.run_coroutine_threadsafe(_drain(), loop).result(timeout)
+    except Exception as e:
+        logger.warning(f"Worker event loop drain failed: {e}")
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
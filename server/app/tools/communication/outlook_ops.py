@@ -18,9 +18,11 @@ Email rate limit: 30 emails/hour (Microsoft policy).
 All sent emails are logged to audit_log.
 """
 
+import asyncio
 import logging
 import os
-from typing import Optional
+import weakref
+from typing import Any, Optional
 
 from app.tools.base_tool import BaseTool
 
@@ -30,21 +32,96 @@ logger = logging.getLogger("mezzofy.tools.outlook")
 _GRAPH_BASE = "https://graph.microsoft.com/v1.0"
 
 
-def _get_graph_client(config: dict):
-    """Build an authenticated MS Graph client using app credentials."""
-    from azure.identity.aio import ClientSecretCredential
-    from msgraph import GraphServiceClient
+# Graph accepts at most 20 requests per $batch call
+_BATCH_SIZE = 20
+_BATCH_MAX_RETRIES = 3
+_GRAPH_SCOPE = "https://graph.microsoft.com/.default"
+_EMAIL_FOOTER = "<br><br><small>Sent via Mezzofy AI Assistant</small>"
+
+# event loop → httpx.AsyncClient for raw Graph calls ($batch)
+_batch_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# event loop → {(tenant, client id, secret) → (credential, GraphServiceClient)}
+_graph_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, tuple[Any, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
 
+
+def _graph_entry(config: dict) -> tuple[Any, Any]:
     ms365 = config.get("ms365", {})
-    credential = ClientSecretCredential(
-        tenant_id=ms365.get("tenant_id") or os.getenv("MS365_TENANT_ID", ""),
-        client_id=ms365.get("client_id") or os.getenv("MS365_CLIENT_ID", ""),
-        client_secret=ms365.get("client_secret") or os.getenv("MS365_CLIENT_SECRET", ""),
-    )
-    return GraphServiceClient(
-        credentials=credential,
-        scopes=["https://graph.microsoft.com/.default"],
+    key = (
+        ms365.get("tenant_id") or os.getenv("MS365_TENANT_ID", ""),
+        ms365.get("client_id") or os.getenv("MS365_CLIENT_ID", ""),
+        ms365.get("client_secret") or os.getenv("MS365_CLIENT_SECRET", ""),
     )
+    loop_clients = _graph_clients.setdefault(asyncio.get_running_loop(), {})
+    entry = loop_clients.get(key)
+    if entry is None:
+        from azure.identity.aio import ClientSecretCredential
+        from msgraph import GraphServiceClient
+
+        tenant_id, client_id, client_secret = key
+        credential = ClientSecretCredential(
+            tenant_id=tenant_id,
+            client_id=client_id,
+            client_secret=client_secret,
+        )
+        client = GraphServiceClient(credentials=credential, scopes=[_GRAPH_SCOPE])
+        entry = loop_clients[key] = (credential, client)
+    return entry
+
+
+def _get_graph_client(config: dict):
+    """
+    Authenticated MS Graph client for the app credentials, shared per event loop.
+
+    A fresh client per call meant a fresh credential — a new Azure AD token
+    request and TLS handshake before every Graph call. The shared one keeps
+    its cached token and keep-alive connections. Its HTTP pool is bound to
+    the loop that opened it, so Celery's per-task loops each get their own.
+    """
+    return _graph_entry(config)[1]
+
+
+def _get_graph_credential(config: dict):
+    """The credential behind _get_graph_client() — for raw Graph calls such as $batch."""
+    return _graph_entry(config)[0]
+
+
+def _get_batch_http_client():
+    """The running loop's keep-alive httpx client for $batch posts, created on first use."""
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _batch_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _batch_http_clients[loop] = httpx.AsyncClient(timeout=30.0)
+    return client
+
+
+async def close_batch_http_clients() -> None:
+    """Close the running loop's $batch client (called on app and worker shutdown)."""
+    client = _batch_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class _BatchNotSent(Exception):
+    """The $batch request provably never reached Graph — its emails may be resent."""
+
+
+def _send_mail_body(to: list[str], subject: str, body_html: str) -> dict:
+    """sendMail request body (Graph JSON) for a plain HTML email."""
+    return {
+        "message": {
+            "subject": subject,
+            "body": {"contentType": "HTML", "content": body_html + _EMAIL_FOOTER},
+            "toRecipients": [{"emailAddress": {"address": addr}} for addr in to],
+        },
+        "saveToSentItems": True,
+    }
 
 
 def _build_attachment(attachment: dict) -> dict:
@@ -270,8 +347,7 @@ class OutlookOps(BaseTool):
             message.body = ItemBody()
             message.body.content_type = BodyType.Html
             # Append standard footer
-            footer = "<br><br><small>Sent via Mezzofy AI Assistant</small>"
-            message.body.content = body_html + footer
+            message.body.content = body_html + _EMAIL_FOOTER
             message.to_recipients = [_recipient(addr) for addr in to]
             if cc:
                 message.cc_recipients = [_recipient(addr) for addr in cc]
@@ -463,8 +539,7 @@ class OutlookOps(BaseTool):
         body_html_template: str,
     ) -> dict:
         """Send personalized emails to a list. Rate-limited: 30/hour."""
-        import asyncio
-        sent = []
+        messages = []
         failed = []
         rate_limit = self.config.get("ms365", {}).get("rate_limit_emails_per_hour", 30)
 
@@ -477,22 +552,18 @@ class OutlookOps(BaseTool):
             variables.setdefault("name", recipient.get("name", ""))
             variables.setdefault("email", recipient["email"])
 
-            subject = subject_template.format(**variables)
-            body_html = body_html_template.format(**variables)
+            messages.append({
+                "to": [recipient["email"]],
+                "subject": subject_template.format(**variables),
+                "body_html": body_html_template.format(**variables),
+            })
 
-            result = await self._send_email(
-                to=[recipient["email"]],
-                subject=subject,
-                body_html=body_html,
-            )
+        sent = []
+        for message, result in zip(messages, await self.send_messages(messages)):
             if result["success"]:
-                sent.append(recipient["email"])
+                sent.append(message["to"][0])
             else:
-                failed.append({"email": recipient["email"], "reason": result.get("error")})
-
-            # Small delay to avoid bursting Microsoft rate limits
-            if i < len(recipients) - 1:
-                await asyncio.sleep(1.2)
+                failed.append({"email": message["to"][0], "reason": result.get("error")})
 
         return self._ok({
             "sent_count": len(sent),
@@ -501,6 +572,126 @@ class OutlookOps(BaseTool):
             "failed": failed,
         })
 
+    async def send_messages(self, messages: list[dict]) -> list[dict]:
+        """
+        Send already-rendered emails ({to: list, subject, body_html}) through
+        Graph's $batch endpoint — one HTTP request per 20 emails instead of a
+        sendMail round trip each.
+
+        Returns one _ok/_err result per message, in order. Emails Graph
+        throttles (429) are re-batched after its Retry-After (exponential
+        backoff if absent). If a $batch call never reached Graph (token or
+        connect failure, envelope rejected with a 4xx) that chunk is sent one
+        sendMail at a time instead; if it failed after it may have been
+        accepted (read timeout, 5xx, unreadable response) its emails are
+        reported failed and NOT resent, so no customer gets a duplicate.
+        """
+        results: list[Optional[dict]] = [None] * len(messages)
+        http = _get_batch_http_client()
+        for start in range(0, len(messages), _BATCH_SIZE):
+            pending = list(range(start, min(start + _BATCH_SIZE, len(messages))))
+            for attempt in range(_BATCH_MAX_RETRIES + 1):
+                try:
+                    responses = await self._post_batch(http, [(i, messages[i]) for i in pending])
+                except _BatchNotSent as e:
+                    logger.warning(f"Graph $batch not sent ({e}) — sending {len(pending)} emails singly")
+                    for i in pending:
+                        results[i] = await self._send_email(
+                            to=messages[i]["to"],
+                            subject=messages[i]["subject"],
+                            body_html=messages[i]["body_html"],
+                        )
+                    pending = []
+                    break
+                except Exception as e:
+                    logger.error(
+                        f"Graph $batch outcome unknown ({type(e).__name__}: {e}) — "
+                        f"not resending {len(pending)} emails"
+                    )
+                    for i in pending:
+                        results[i] = self._err(
+                            f"Delivery unknown: Graph $batch failed after sending ({e}); "
+                            "not retried to avoid a duplicate email"
+                        )
+                    pending = []
+                    break
+
+                throttled: list[int] = []
+                retry_after = 0.0
+                for i in pending:
+                    status, error, wait = responses.get(i, (0, "missing from $batch response", None))
+                    if status == 429:
+                        throttled.append(i)
+                        retry_after = max(retry_after, wait or 2.0 ** attempt)
+                    elif 200 <= status < 300:
+                        results[i] = self._ok({
+                            "sent_to": messages[i]["to"],
+                            "subject": messages[i]["subject"],
+                            "from": self._sender,
+                        })
+                    else:
+                        results[i] = self._err(f"Failed to send email: {error or f'HTTP {status}'}")
+                pending = throttled
+                if not pending or attempt == _BATCH_MAX_RETRIES:
+                    break
+                await asyncio.sleep(retry_after)
+
+            for i in pending:
+                results[i] = self._err("Failed to send email: throttled by Microsoft Graph (429)")
+
+        sent = sum(1 for r in results if r and r["success"])
+        logger.info(f"Batch email: {sent}/{len(messages)} sent")
+        return results
+
+    async def _post_batch(self, http, items: list[tuple[int, dict]]) -> dict[int, tuple[int, Optional[str], Optional[float]]]:
+        """
+        POST one $batch of sendMail requests → {index: (status, error message, retry-after seconds)}.
+
+        Raises _BatchNotSent when Graph cannot have acted on the request; any
+        other exception leaves the outcome unknown.
+        """
+        import httpx
+
+        try:
+            token = await _get_graph_credential(self.config).get_token(_GRAPH_SCOPE)
+        except Exception as e:
+            raise _BatchNotSent(f"token request failed: {e}") from e
+        url = f"/users/{self._sender}/sendMail"
+        payload = {
+            "requests": [
+                {
+                    "id": str(i),
+                    "method": "POST",
+                    "url": url,
+                    "headers": {"Content-Type": "application/json"},
+                    "body": _send_mail_body(m["to"], m["subject"], m["body_html"]),
+                }
+                for i, m in items
+            ]
+        }
+        try:
+            resp = await http.post(
+                f"{_GRAPH_BASE}/$batch",
+                json=payload,
+                headers={"Authorization": f"Bearer {token.token}"},
+            )
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+            raise _BatchNotSent(f"could not connect: {e}") from e
+        if resp.status_code == 429:
+            wait = resp.headers.get("Retry-After")
+            return {i: (429, None, float(wait) if wait else None) for i, _ in items}
+        if 400 <= resp.status_code < 500:
+            # The envelope was rejected as a whole — none of its requests ran
+            raise _BatchNotSent(f"$batch rejected with HTTP {resp.status_code}")
+        resp.raise_for_status()
+
+        out = {}
+        for r in resp.json().get("responses", []):
+            wait = (r.get("headers") or {}).get("Retry-After")
+            error = ((r.get("body") or {}).get("error") or {}).get("message")
+            out[int(r["id"])] = (int(r.get("status", 0)), error, float(wait) if wait else None)
+        return out
+
     async def _reply_email(
         self,
         user_email: str,
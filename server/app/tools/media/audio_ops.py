@@ -13,13 +13,25 @@ Libraries: openai-whisper, pydub (all lazy-imported)
 
 import logging
 import os
-import tempfile
 from typing import Optional
 
+try:
+    import pybase64 as _b64  # SIMD base64, same API as the stdlib module
+except ImportError:
+    import base64 as _b64
+
 from app.tools.base_tool import BaseTool
+from app.tools.media.tmp_dir import media_tempfile
 
 logger = logging.getLogger("mezzofy.tools.audio")
 
+# Loaded Whisper models keyed by model name. Loading reads the weights from
+# disk onto the device, so reuse one instance per process across AudioOps.
+_WHISPER_MODELS: dict = {}
+
+# Sample rate Whisper operates on; transcribe_pcm expects samples at this rate
+WHISPER_SAMPLE_RATE = 16000
+
 
 class AudioOps(BaseTool):
 
@@ -128,11 +140,60 @@ class AudioOps(BaseTool):
     # ── Private helpers ────────────────────────────────────────────────────────
 
     def _load_whisper_model(self):
-        """Lazy-load the Whisper model (heavy import — done once per instance)."""
-        import whisper  # openai-whisper
-
+        """Lazy-load the Whisper model (heavy import — cached per process)."""
         model_name = self.config.get("media_processing", {}).get("whisper_model", "base")
-        return whisper.load_model(model_name)
+        model = _WHISPER_MODELS.get(model_name)
+        if model is None:
+            import whisper  # openai-whisper
+
+            model = _WHISPER_MODELS[model_name] = whisper.load_model(model_name)
+        return model
+
+    # ── In-memory transcription (not exposed as an LLM tool) ───────────────────
+
+    async def transcribe_pcm(
+        self,
+        samples,
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+    ) -> dict:
+        """
+        Transcribe mono float32 PCM samples at WHISPER_SAMPLE_RATE with word timestamps.
+
+        Used by live speech sessions, which convert captured audio to that
+        rate as it arrives: no temp file or ffmpeg decode, the ndarray goes
+        straight to Whisper. Word times are relative to samples[0].
+
+        Returns _ok({"text", "language", "words": [{"start", "end", "word"}]}).
+        """
+        try:
+            import asyncio
+
+            model = self._load_whisper_model()
+            options: dict = {"word_timestamps": True, "condition_on_previous_text": False}
+            if language:
+                options["language"] = language
+            if prompt:
+                options["initial_prompt"] = prompt
+
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                None, lambda: model.transcribe(samples, **options)
+            )
+
+            words = [
+                {"start": w["start"], "end": w["end"], "word": w["word"]}
+                for segment in result.get("segments", [])
+                for w in segment.get("words", [])
+            ]
+            return self._ok({
+                "text": result["text"].strip(),
+                "language": result.get("language"),
+                "words": words,
+            })
+        except Exception as e:
+            logger.error(f"transcribe_pcm failed: {e}")
+            return self._err(f"Transcription failed: {e}")
 
     # ── Handlers ──────────────────────────────────────────────────────────────
 
@@ -143,11 +204,9 @@ class AudioOps(BaseTool):
         file_extension: str = "wav",
     ) -> dict:
         try:
-            import base64
-
-            raw = base64.b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
+            raw = _b64.b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
 
-            with tempfile.NamedTemporaryFile(suffix=f".{file_extension}", delete=False) as tmp:
+            with media_tempfile(suffix=f".{file_extension}", size=len(raw)) as tmp:
                 tmp.write(raw)
                 tmp_path = tmp.name
 
@@ -181,13 +240,11 @@ class AudioOps(BaseTool):
 
     async def _detect_language(self, audio_bytes: str) -> dict:
         try:
-            import base64
-
             import whisper
 
-            raw = base64.b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
+            raw = _b64.b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            with media_tempfile(suffix=".wav", size=len(raw)) as tmp:
                 tmp.write(raw)
                 tmp_path = tmp.name
 
@@ -226,15 +283,11 @@ class AudioOps(BaseTool):
         src_path = None
         dst_path = None
         try:
-            import base64
-
             from pydub import AudioSegment
 
-            raw = base64.b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
+            raw = _b64.b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
 
-            with tempfile.NamedTemporaryFile(
-                suffix=f".{from_format}", delete=False
-            ) as src:
+            with media_tempfile(suffix=f".{from_format}") as src:
                 src.write(raw)
                 src_path = src.name
 
@@ -250,7 +303,7 @@ class AudioOps(BaseTool):
                 f"convert_audio: {from_format} → {to_format}, {len(converted)} bytes"
             )
             return self._ok({
-                "audio_bytes": base64.b64encode(converted).decode(),
+                "audio_bytes": _b64.b64encode(converted).decode(),
                 "format": to_format,
                 "size_bytes": len(converted),
             })
@@ -264,13 +317,11 @@ class AudioOps(BaseTool):
 
     async def _get_audio_info(self, audio_bytes: str, file_extension: str = "wav") -> dict:
         try:
-            import base64
-
             from pydub import AudioSegment
 
-            raw = base64.b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
+            raw = _b64.b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
 
-            with tempfile.NamedTemporaryFile(suffix=f".{file_extension}", delete=False) as tmp:
+            with media_tempfile(suffix=f".{file_extension}", size=len(raw)) as tmp:
                 tmp.write(raw)
                 tmp_path = tmp.name
 
@@ -15,9 +15,9 @@ Library: openai-whisper (lazy-imported)
 
 import logging
 import os
-import tempfile
 
 from app.tools.base_tool import BaseTool
+from app.tools.media.tmp_dir import media_tempfile
 
 logger = logging.getLogger("mezzofy.tools.speech")
 
@@ -127,7 +127,7 @@ class SpeechOps(BaseTool):
             if not combined:
                 return self._ok({"partial_text": "", "is_final": True, "buffered_bytes": 0})
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            with media_tempfile(suffix=".wav", size=len(combined)) as tmp:
                 tmp.write(combined)
                 tmp_path = tmp.name
 
@@ -154,7 +154,7 @@ class SpeechOps(BaseTool):
 
             raw = base64.b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            with media_tempfile(suffix=".wav", size=len(raw)) as tmp:
                 tmp.write(raw)
                 tmp_path = tmp.name
 
@@ -0,0 +1,48 @@
+"""
+Scratch location for media temp files.
+
+Whisper, OpenCV, MoviePy and pydub all open their input by path (ffmpeg
+underneath), so media ops still spill uploaded bytes to a file. Small files
+go to /dev/shm (tmpfs) on Linux so the write + ffmpeg read-back stay in RAM;
+everything else uses the default temp directory.
+
+/dev/shm is small in containers (Docker's default is 64 MB) while uploads
+may be up to 100 MB, so it is used only when the caller passes the size it
+will write, that size is at most _SHM_MAX_BYTES, and /dev/shm still has
+room for it plus _SHM_RESERVE_BYTES. Callers that write derived files next
+to the scratch file (extracted audio, format conversions) pass no size and
+always get the default temp directory.
+"""
+
+import os
+import tempfile
+from typing import Optional
+
+_SHM_DIR = "/dev/shm"
+_SHM_MAX_BYTES = 8 * 1024 * 1024
+_SHM_RESERVE_BYTES = 16 * 1024 * 1024
+
+MEDIA_TMP_DIR: Optional[str] = (
+    _SHM_DIR if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK) else None
+)
+
+
+def _scratch_dir(size: Optional[int]) -> Optional[str]:
+    """MEDIA_TMP_DIR if a file of `size` bytes fits there comfortably, else None (default dir)."""
+    if MEDIA_TMP_DIR is None or size is None or size > _SHM_MAX_BYTES:
+        return None
+    try:
+        stat = os.statvfs(MEDIA_TMP_DIR)
+    except OSError:
+        return None
+    if stat.f_bavail * stat.f_frsize < size + _SHM_RESERVE_BYTES:
+        return None
+    return MEDIA_TMP_DIR
+
+
+def media_tempfile(suffix: str, size: Optional[int] = None):
+    """
+    NamedTemporaryFile(delete=False) for `size` bytes of media — caller unlinks
+    the path. On tmpfs only when size is given and small (see module docstring).
+    """
+    return tempfile.NamedTemporaryFile(suffix=suffix, dir=_scratch_dir(size), delete=False)
@@ -11,15 +11,20 @@ Config section: config["media_processing"]
 Libraries: opencv-python-headless, moviepy, openai-whisper, anthropic (all lazy-imported)
 """
 
+import asyncio
 import logging
 import os
-import tempfile
 from typing import Optional
 
 from app.tools.base_tool import BaseTool
+from app.tools.media.tmp_dir import media_tempfile
 
 logger = logging.getLogger("mezzofy.tools.video")
 
+# analyze_video: key frame spacing, and how many of them go to Claude Vision
+_KEY_FRAME_INTERVAL_SECONDS = 5
+_MAX_VISION_FRAMES = 5
+
 
 class VideoOps(BaseTool):
 
@@ -121,7 +126,7 @@ class VideoOps(BaseTool):
 
             raw = base64.b64decode(video_bytes) if isinstance(video_bytes, str) else video_bytes
 
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
+            with media_tempfile(suffix=".mp4", size=len(raw)) as tmp:
                 tmp.write(raw)
                 tmp_path = tmp.name
 
@@ -163,7 +168,7 @@ class VideoOps(BaseTool):
 
             raw = base64.b64decode(video_bytes) if isinstance(video_bytes, str) else video_bytes
 
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
+            with media_tempfile(suffix=".mp4") as tmp:
                 tmp.write(raw)
                 tmp_path = tmp.name
 
@@ -205,7 +210,7 @@ class VideoOps(BaseTool):
 
             raw = base64.b64decode(video_bytes) if isinstance(video_bytes, str) else video_bytes
 
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
+            with media_tempfile(suffix=".mp4", size=len(raw)) as tmp:
                 tmp.write(raw)
                 tmp_path = tmp.name
 
@@ -241,91 +246,171 @@ class VideoOps(BaseTool):
             return self._err(f"Video info failed: {e}")
 
     async def _analyze_video(self, video_bytes: str) -> dict:
+        video_path = None
         try:
             import base64
-            import tempfile
-
-            import anthropic
-            import whisper
 
             raw = base64.b64decode(video_bytes) if isinstance(video_bytes, str) else video_bytes
 
-            # ── Step 1: Extract key frames every 5 seconds ────────────────────
-            frames_result = await self._extract_key_frames(
-                video_bytes=video_bytes, interval_seconds=5
-            )
-            if not frames_result["success"]:
-                return frames_result
-            frames: list[str] = frames_result["output"]["frames"]
-
-            # ── Step 2: Extract and transcribe audio (inline Whisper) ─────────
-            transcript = ""
-            audio_result = await self._extract_audio_track(video_bytes=video_bytes)
-            if audio_result["success"]:
-                audio_raw = base64.b64decode(audio_result["output"]["audio_bytes"])
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as atmp:
-                    atmp.write(audio_raw)
-                    atmp_path = atmp.name
-                try:
-                    model_name = (
-                        self.config.get("media_processing", {}).get("whisper_model", "base")
-                    )
-                    wmodel = whisper.load_model(model_name)
-                    result = wmodel.transcribe(atmp_path)
-                    transcript = result["text"].strip()
-                except Exception as te:
-                    logger.warning(f"analyze_video transcription failed: {te}")
-                finally:
-                    os.unlink(atmp_path)
-
-            # ── Step 3: Analyze frames via Claude Vision ───────────────────────
-            api_key = (
-                self.config.get("llm", {}).get("claude", {}).get("api_key")
-                or os.getenv("ANTHROPIC_API_KEY", "")
-            )
-            model = (
-                self.config.get("llm", {}).get("claude", {}).get("model")
-                or os.getenv("CLAUDE_MODEL", "claude-sonnet-4-6")
-            )
-
-            client = anthropic.Anthropic(api_key=api_key)
-            # Use up to 5 evenly-spaced frames for visual analysis
-            sample_frames = frames[:: max(1, len(frames) // 5)][:5]
-
-            content: list[dict] = [
-                {
-                    "type": "text",
-                    "text": (
-                        "Describe the visual content of this video based on these key frames. "
-                        "Be concise and focus on what is shown."
-                    ),
-                }
-            ]
-            for frame_b64 in sample_frames:
-                content.append({
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": "image/jpeg",
-                        "data": frame_b64,
-                    },
-                })
+            with media_tempfile(suffix=".mp4", size=len(raw)) as tmp:
+                tmp.write(raw)
+                video_path = tmp.name
 
-            response = client.messages.create(
-                model=model,
-                max_tokens=1024,
-                messages=[{"role": "user", "content": content}],
+            # Frames → Claude Vision and audio → Whisper don't depend on each
+            # other; run both branches concurrently instead of back to back
+            (visual_summary, frames_analyzed), transcript = await asyncio.gather(
+                self._describe_key_frames(video_path),
+                self._transcribe_video_audio(video_path),
             )
-            visual_summary = response.content[0].text if response.content else ""
 
             logger.info(
-                f"analyze_video: {len(frames)} frames, transcript={len(transcript)} chars"
+                f"analyze_video: {frames_analyzed} frames, transcript={len(transcript)} chars"
             )
             return self._ok({
                 "visual_summary": visual_summary,
                 "transcript": transcript,
-                "frames_analyzed": len(sample_frames),
+                "frames_analyzed": frames_analyzed,
             })
         except Exception as e:
             logger.error(f"analyze_video failed: {e}")
             return self._err(f"Video analysis failed: {e}")
+        finally:
+            if video_path and os.path.exists(video_path):
+                os.unlink(video_path)
+
+    async def _describe_key_frames(self, video_path: str) -> tuple[str, int]:
+        """Sample key frames and describe them in one Claude Vision call."""
+        import anthropic
+
+        from app.llm.http_client import get_shared_http_client
+
+        loop = asyncio.get_event_loop()
+        frames = await loop.run_in_executor(
+            None, _sample_key_frames, video_path, _KEY_FRAME_INTERVAL_SECONDS, _MAX_VISION_FRAMES
+        )
+        if not frames:
+            raise ValueError("no frames could be decoded from the video")
+
+        api_key = (
+            self.config.get("llm", {}).get("claude", {}).get("api_key")
+            or os.getenv("ANTHROPIC_API_KEY", "")
+        )
+        model = (
+            self.config.get("llm", {}).get("claude", {}).get("model")
+            or os.getenv("CLAUDE_MODEL", "claude-sonnet-4-6")
+        )
+
+        content: list[dict] = [
+            {
+                "type": "text",
+                "text": (
+                    "Describe the visual content of this video based on these key frames. "
+                    "Be concise and focus on what is shown."
+                ),
+            }
+        ]
+        for frame_b64 in frames:
+            content.append({
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": "image/jpeg",
+                    "data": frame_b64,
+                },
+            })
+
+        # Reuse the loop's pooled connections to the API (shared with AnthropicClient)
+        client = anthropic.AsyncAnthropic(
+            api_key=api_key, http_client=get_shared_http_client(anthropic)
+        )
+        response = await client.messages.create(
+            model=model,
+            max_tokens=1024,
+            messages=[{"role": "user", "content": content}],
+        )
+        visual_summary = response.content[0].text if response.content else ""
+        return visual_summary, len(frames)
+
+    async def _transcribe_video_audio(self, video_path: str) -> str:
+        """Transcribe the video's audio track; "" if it has none or transcription fails."""
+        from app.tools.media.audio_ops import AudioOps
+
+        loop = asyncio.get_event_loop()
+        try:
+            return await loop.run_in_executor(
+                None, _transcribe_audio_track, video_path, AudioOps(self.config)
+            )
+        except Exception as e:
+            logger.warning(f"analyze_video transcription failed: {e}")
+            return ""
+
+
+# ── Blocking helpers (run in the default executor) ────────────────────────────
+
+def _sample_key_frames(video_path: str, interval_seconds: float, max_frames: int) -> list[str]:
+    """
+    Return up to max_frames base64 JPEG frames, evenly spaced over the
+    one-per-interval_seconds key frame timeline.
+
+    Seeks straight to the sampled frames when the container reports a frame
+    count, instead of decoding every frame of the video.
+    """
+    import base64
+
+    import cv2
+
+    cap = cv2.VideoCapture(video_path)
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        frame_interval = max(1, int(fps * interval_seconds))
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+        def _encode(frame) -> str:
+            _, buf = cv2.imencode(".jpg", frame)
+            return base64.b64encode(buf.tobytes()).decode()
+
+        if frame_count > 0:
+            key_frames = list(range(0, frame_count, frame_interval))
+            frames = []
+            for idx in key_frames[:: max(1, len(key_frames) // max_frames)][:max_frames]:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+                ret, frame = cap.read()
+                if ret:
+                    frames.append(_encode(frame))
+            return frames
+
+        # Frame count unknown (some streams) — decode sequentially
+        key_frames_b64: list[str] = []
+        frame_idx = 0
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            if frame_idx % frame_interval == 0:
+                key_frames_b64.append(_encode(frame))
+            frame_idx += 1
+        return key_frames_b64[:: max(1, len(key_frames_b64) // max_frames)][:max_frames]
+    finally:
+        cap.release()
+
+
+def _transcribe_audio_track(video_path: str, audio_ops) -> str:
+    """
+    Extract the audio track to a WAV scratch file and run Whisper on it,
+    using AudioOps' process-wide cached model.
+    """
+    from moviepy.editor import VideoFileClip
+
+    audio_path = None
+    clip = VideoFileClip(video_path)
+    try:
+        if clip.audio is None:
+            return ""
+        with media_tempfile(suffix=".wav") as tmp:
+            audio_path = tmp.name
+        clip.audio.write_audiofile(audio_path, logger=None)
+        return audio_ops._load_whisper_model().transcribe(audio_path)["text"].strip()
+    finally:
+        clip.close()
+        if audio_path and os.path.exists(audio_path):
+            os.unlink(audio_path)
@@ -17,11 +17,20 @@ Phase 2 tools registered here. Phase 3, 4 tools will extend this in later sessio
 import logging
 import os
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 logger = logging.getLogger("mezzofy.tool_executor")
 
+try:
+    import fastjsonschema   # compiles each tool's parameter schema to a Python validator
+except ImportError:
+    fastjsonschema = None
+
+# Filtered definition lists kept per executor, keyed by the requested name set
+_SUBSET_CACHE_SIZE = 64
+
 
 def _load_config() -> dict:
     """Load config.yaml from server/config/ directory."""
@@ -47,6 +56,8 @@ class ToolExecutor:
         self.config = config or _load_config()
         self._registry: dict[str, object] = {}  # tool_name → ops_instance
         self._definitions: list[dict] = []
+        self._validators: dict[str, object] = {}  # tool_name → compiled argument validator
+        self._subsets: OrderedDict[frozenset, list[dict]] = OrderedDict()
         self._loaded = False
 
     def _load_all_tools(self) -> None:
@@ -106,6 +117,7 @@ class ToolExecutor:
                     "description": tool_def["description"],
                     "parameters": tool_def["parameters"],
                 })
+                self._compile_validator(name, tool_def["parameters"])
         except Exception as e:
             logger.warning(f"Failed to load {class_name} from {module_suffix}: {e}")
 
@@ -118,8 +130,24 @@ class ToolExecutor:
         ops = self._registry.get(tool_name)
         if not ops:
             return {"success": False, "error": f"Unknown tool: '{tool_name}'"}
+        validate = self._validators.get(tool_name)
+        if validate is not None:
+            try:
+                validate(kwargs)
+            except fastjsonschema.JsonSchemaException as e:
+                # Returned to the model as the tool result so it can correct the call
+                return {"success": False, "error": f"Invalid arguments for '{tool_name}': {e.message}"}
         return await ops.execute(tool_name, **kwargs)
 
+    def _compile_validator(self, name: str, schema: dict) -> None:
+        """Compile the tool's parameter schema once, at registration (no-op without fastjsonschema)."""
+        if fastjsonschema is None:
+            return
+        try:
+            self._validators[name] = fastjsonschema.compile(schema)
+        except Exception as e:
+            logger.warning(f"Tool '{name}': parameter schema not compilable, arguments unchecked: {e}")
+
     def get_all_definitions(self) -> list[dict]:
         """
         Return all registered tool definitions in OpenAI function-calling format.
@@ -128,6 +156,31 @@ class ToolExecutor:
         self._load_all_tools()
         return self._definitions
 
+    def get_definitions(self, tool_names: Optional[Iterable[str]] = None) -> list[dict]:
+        """
+        Return the definitions for `tool_names` (registry order), or all of them
+        when tool_names is empty/None.
+
+        The registry doesn't change after loading, so each subset is built once
+        and the same list is returned on later calls — which also keeps the LLM
+        clients' id()-keyed formatted-tool caches warm. Callers must not mutate it.
+        """
+        if not tool_names:
+            return self.get_all_definitions()
+
+        key = frozenset(tool_names)
+        subset = self._subsets.get(key)
+        if subset is not None:
+            self._subsets.move_to_end(key)
+            return subset
+
+        subset = self._subsets[key] = [
+            t for t in self.get_all_definitions() if t["name"] in key
+        ]
+        if len(self._subsets) > _SUBSET_CACHE_SIZE:
+            self._subsets.popitem(last=False)
+        return subset
+
     def get_tool_names(self) -> list[str]:
         """Return all registered tool names."""
         self._load_all_tools()
@@ -10,7 +10,8 @@ Config section: config["tools"]["browser"]
 Library: playwright (lazy-imported; headless Chromium)
 
 Security: SSRF blocklist applied — private/internal IP ranges and non-HTTP schemes are rejected.
-          A singleton browser instance is reused across calls to avoid per-call launch overhead.
+          Pages come from the shared browser in browser_pool — one Chromium per event
+          loop, a fresh context per call.
 """
 
 import logging
@@ -18,6 +19,7 @@ import re
 from typing import Optional
 
 from app.tools.base_tool import BaseTool
+from app.tools.web.browser_pool import browser_context
 
 logger = logging.getLogger("mezzofy.tools.browser")
 
@@ -37,10 +39,6 @@ _BLOCKED_URL_PATTERNS = [
     r"^javascript:",
 ]
 
-# Singleton browser instance — lazily initialised and reused
-_playwright_instance = None
-_browser_instance = None
-
 
 class BrowserOps(BaseTool):
 
@@ -128,19 +126,6 @@ class BrowserOps(BaseTool):
                 return "URL blocked: internal/private addresses are not permitted"
         return None
 
-    async def _get_browser(self):
-        """Return the singleton Playwright Chromium browser, launching if needed."""
-        global _playwright_instance, _browser_instance
-        from playwright.async_api import async_playwright
-
-        if _browser_instance is None:
-            cfg = self.config.get("tools", {}).get("browser", {})
-            _playwright_instance = await async_playwright().start()
-            _browser_instance = await _playwright_instance.chromium.launch(
-                headless=cfg.get("headless", True),
-            )
-        return _browser_instance
-
     def _timeout_ms(self) -> int:
         cfg = self.config.get("tools", {}).get("browser", {})
         return min(cfg.get("timeout_seconds", 30), 60) * 1000
@@ -157,18 +142,15 @@ class BrowserOps(BaseTool):
         if err:
             return self._err(err)
         try:
-            browser = await self._get_browser()
             timeout_ms = min(timeout_seconds, 60) * 1000
-            page = await browser.new_page()
-            try:
+            async with browser_context(self.config) as context:
+                page = await context.new_page()
                 response = await page.goto(url, wait_until=wait_for, timeout=timeout_ms)
                 title = await page.title()
                 final_url = page.url
                 status = response.status if response else None
                 logger.info(f"open_page: {url} → status={status}, title={title!r}")
                 return self._ok({"title": title, "url": final_url, "status": status})
-            finally:
-                await page.close()
         except Exception as e:
             logger.error(f"open_page failed for {url}: {e}")
             return self._err(f"Failed to open page: {e}")
@@ -180,16 +162,13 @@ class BrowserOps(BaseTool):
         try:
             import base64
 
-            browser = await self._get_browser()
-            page = await browser.new_page()
-            try:
+            async with browser_context(self.config) as context:
+                page = await context.new_page()
                 await page.goto(url, wait_until="networkidle", timeout=self._timeout_ms())
                 screenshot = await page.screenshot(full_page=True, type="jpeg")
                 b64 = base64.b64encode(screenshot).decode()
                 logger.info(f"screenshot_page: {url}, {len(screenshot)} bytes")
                 return self._ok({"image_bytes": b64, "url": page.url})
-            finally:
-                await page.close()
         except Exception as e:
             logger.error(f"screenshot_page failed for {url}: {e}")
             return self._err(f"Screenshot failed: {e}")
@@ -199,9 +178,8 @@ class BrowserOps(BaseTool):
         if err:
             return self._err(err)
         try:
-            browser = await self._get_browser()
-            page = await browser.new_page()
-            try:
+            async with browser_context(self.config) as context:
+                page = await context.new_page()
                 await page.goto(
                     url, wait_until="domcontentloaded", timeout=self._timeout_ms()
                 )
@@ -210,8 +188,6 @@ class BrowserOps(BaseTool):
                 text = re.sub(r"\n{3,}", "\n\n", text.strip())
                 logger.info(f"extract_text: {url}, {len(text)} chars")
                 return self._ok({"text": text, "url": page.url, "length": len(text)})
-            finally:
-                await page.close()
         except Exception as e:
             logger.error(f"extract_text failed for {url}: {e}")
             return self._err(f"Text extraction failed: {e}")
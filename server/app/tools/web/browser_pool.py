@@ -0,0 +1,118 @@
+"""
+Shared headless Chromium for the web tools.
+
+BrowserOps and LinkedInOps used to launch Chromium themselves — LinkedInOps on
+every call (a 1–2 s cold start per search or profile), BrowserOps once into a
+module global that a later event loop could not use. Both now take pages from
+one browser per event loop: each call opens its own BrowserContext (separate
+cookies and storage, so LinkedIn's session cookie never reaches a research
+scrape) and closes it afterwards, which costs milliseconds, not a launch.
+
+Playwright's connection belongs to the loop that started it, and the API and
+each Celery worker process run their own loops — so browsers are kept per loop,
+as with the Redis and LLM HTTP pools. Set tools.browser.cdp_url (or BROWSER_CDP_URL) to
+attach to an already running Chromium over CDP instead of launching one, so
+every worker shares a single browser.
+
+Config section: config["tools"]["browser"]
+  headless      — launch headless (default: true)
+  cdp_url       — ws/http endpoint of a shared Chromium (optional)
+  max_contexts  — contexts open at once per loop (default: 5)
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+logger = logging.getLogger("mezzofy.tools.browser_pool")
+
+_DEFAULT_MAX_CONTEXTS = 5
+
+
+class _LoopBrowser:
+    """Browser state for one event loop."""
+
+    def __init__(self, max_contexts: int):
+        self.playwright: Optional[Any] = None
+        self.browser: Optional[Any] = None
+        self.lock = asyncio.Lock()                      # one launch at a time
+        self.slots = asyncio.Semaphore(max_contexts)    # bounds open contexts (pages)
+
+
+# event loop → browser state
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopBrowser]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _browser_cfg(config: dict) -> dict:
+    return config.get("tools", {}).get("browser", {})
+
+
+def _state(config: dict) -> _LoopBrowser:
+    loop = asyncio.get_running_loop()
+    state = _pools.get(loop)
+    if state is None:
+        max_contexts = _browser_cfg(config).get("max_contexts", _DEFAULT_MAX_CONTEXTS)
+        state = _pools[loop] = _LoopBrowser(max_contexts)
+    return state
+
+
+async def get_browser(config: dict):
+    """Return the running loop's Chromium, launching (or connecting) on first use."""
+    state = _state(config)
+    async with state.lock:
+        if state.browser is None or not state.browser.is_connected():
+            from playwright.async_api import async_playwright
+
+            if state.playwright is None:
+                state.playwright = await async_playwright().start()
+            cfg = _browser_cfg(config)
+            cdp_url = cfg.get("cdp_url") or os.getenv("BROWSER_CDP_URL")
+            if cdp_url:
+                state.browser = await state.playwright.chromium.connect_over_cdp(cdp_url)
+                logger.info(f"Connected to shared Chromium at {cdp_url}")
+            else:
+                state.browser = await state.playwright.chromium.launch(
+                    headless=cfg.get("headless", True),
+                )
+                logger.info("Launched shared Chromium")
+    return state.browser
+
+
+@asynccontextmanager
+async def browser_context(config: dict, **context_options) -> AsyncIterator[Any]:
+    """
+    `async with browser_context(config) as context:` — a fresh, isolated
+    BrowserContext on the shared browser, closed (with its pages) on exit.
+    context_options go to Browser.new_context() (user_agent, locale, ...).
+    """
+    state = _state(config)
+    async with state.slots:
+        browser = await get_browser(config)
+        context = await browser.new_context(**context_options)
+        try:
+            yield context
+        finally:
+            await context.close()
+
+
+async def close_browser_pool() -> None:
+    """
+    Close the running loop's browser and Playwright driver — called on app
+    shutdown and by stop_worker_loop() when a Celery worker process exits.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    state = _pools.pop(loop, None)
+    if state is None:
+        return
+    if state.browser is not None:
+        await state.browser.close()
+    if state.playwright is not None:
+        await state.playwright.stop()
@@ -4,12 +4,13 @@ LinkedIn Tool — profile search and extraction via authenticated Playwright ses
 Tools provided:
     linkedin_search   — Search LinkedIn for people or companies by keyword
     linkedin_extract  — Extract profile data from a LinkedIn profile URL
+    linkedin_extract_batch — Extract several profiles in one session (bounded parallel tabs)
 
 Config section: config["tools"]["linkedin"]
   linkedin.session_cookie — LinkedIn 'li_at' cookie value (from env LINKEDIN_COOKIE)
   linkedin.rate_limit_per_session — max profiles per session (default: 50)
 
-Library: playwright (lazy-imported; uses existing Chromium binary)
+Library: playwright (via browser_pool — shared Chromium, one isolated context per call)
 
 Constraints:
   - Authentication via session cookie — no passwords stored.
@@ -18,15 +19,23 @@ Constraints:
   - Long searches should be enqueued as Celery background tasks for large result sets.
 """
 
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from urllib.parse import quote, urlencode
 
 from app.tools.base_tool import BaseTool
+from app.tools.web.browser_pool import browser_context
 
 logger = logging.getLogger("mezzofy.tools.linkedin")
 
 _LINKEDIN_BASE = "https://www.linkedin.com"
 
+# Upper bound on profile tabs open at once in linkedin_extract_batch
+_MAX_BATCH_CONCURRENCY = 3
+
 # Per-instance counters for rate limiting
 _session_counter: int = 0
 
@@ -92,6 +101,31 @@ class LinkedInOps(BaseTool):
                 },
                 "handler": self._linkedin_extract,
             },
+            {
+                "name": "linkedin_extract_batch",
+                "description": (
+                    "Extract profile data from several LinkedIn profile URLs in one session. "
+                    "Prefer this over repeated linkedin_extract calls when prospecting a list. "
+                    "Returns one entry per URL (profile fields, or an error)."
+                ),
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "profile_urls": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Full LinkedIn profile URLs",
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Profiles loaded at once (default: 3, max: 3)",
+                            "default": 3,
+                        },
+                    },
+                    "required": ["profile_urls"],
+                },
+                "handler": self._linkedin_extract_batch,
+            },
         ]
 
     # ── Private helpers ────────────────────────────────────────────────────────
@@ -105,29 +139,27 @@ class LinkedInOps(BaseTool):
         global _session_counter
         _session_counter += 1
 
-    async def _make_browser(self):
-        """Launch a new Playwright browser context with the LinkedIn session cookie."""
-        from playwright.async_api import async_playwright
-
-        pw = await async_playwright().start()
-        browser = await pw.chromium.launch(headless=True)
-        context = await browser.new_context(
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[Any]:
+        """A browser context on the shared Chromium carrying the LinkedIn session cookie."""
+        async with browser_context(
+            self.config,
             user_agent=(
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/120.0.0.0 Safari/537.36"
-            )
-        )
-        if self._cookie:
-            await context.add_cookies([{
-                "name": "li_at",
-                "value": self._cookie,
-                "domain": ".linkedin.com",
-                "path": "/",
-                "httpOnly": True,
-                "secure": True,
-            }])
-        return pw, browser, context
+            ),
+        ) as context:
+            if self._cookie:
+                await context.add_cookies([{
+                    "name": "li_at",
+                    "value": self._cookie,
+                    "domain": ".linkedin.com",
+                    "path": "/",
+                    "httpOnly": True,
+                    "secure": True,
+                }])
+            yield context
 
     # ── Handlers ──────────────────────────────────────────────────────────────
 
@@ -147,63 +179,52 @@ class LinkedInOps(BaseTool):
 
         limit = min(limit, 25)
         search_type = "people" if type.lower() != "companies" else "companies"
-        encoded_query = query.replace(" ", "%20")
-        search_url = (
-            f"{_LINKEDIN_BASE}/search/results/{search_type}/"
-            f"?keywords={encoded_query}&origin=GLOBAL_SEARCH_HEADER"
-        )
+        params = urlencode({"keywords": query, "origin": "GLOBAL_SEARCH_HEADER"}, quote_via=quote)
+        search_url = f"{_LINKEDIN_BASE}/search/results/{search_type}/?{params}"
 
-        pw = browser = context = None
         try:
-            pw, browser, context = await self._make_browser()
-            page = await context.new_page()
-            self._increment_counter()
-
-            timeout_ms = self._li_cfg.get("timeout_seconds", 30) * 1000
-            await page.goto(search_url, wait_until="domcontentloaded", timeout=timeout_ms)
-            await page.wait_for_timeout(2000)  # let results render
-
-            # Extract search result cards
-            results: list[dict] = []
-            cards = await page.query_selector_all(
-                ".reusable-search__result-container"
-            )
+            async with self._session() as context:
+                page = await context.new_page()
+                self._increment_counter()
+
+                timeout_ms = self._li_cfg.get("timeout_seconds", 30) * 1000
+                await page.goto(search_url, wait_until="domcontentloaded", timeout=timeout_ms)
+                await page.wait_for_timeout(2000)  # let results render
+
+                # Extract search result cards
+                results: list[dict] = []
+                cards = await page.query_selector_all(
+                    ".reusable-search__result-container"
+                )
 
-            for card in cards[:limit]:
-                try:
-                    name_el = await card.query_selector(
-                        ".entity-result__title-text a span[aria-hidden='true']"
-                    )
-                    name = (await name_el.inner_text()).strip() if name_el else ""
-
-                    subtitle_el = await card.query_selector(".entity-result__primary-subtitle")
-                    subtitle = (await subtitle_el.inner_text()).strip() if subtitle_el else ""
-
-                    link_el = await card.query_selector(".entity-result__title-text a")
-                    href = await link_el.get_attribute("href") if link_el else ""
-                    profile_url = href.split("?")[0] if href else ""
-
-                    if name:
-                        results.append({
-                            "name": name,
-                            "subtitle": subtitle,
-                            "url": profile_url,
-                        })
-                except Exception:
-                    continue
-
-            logger.info(f"linkedin_search: '{query}' → {len(results)} results")
-            return self._ok({"results": results, "count": len(results), "query": query})
+                for card in cards[:limit]:
+                    try:
+                        name_el = await card.query_selector(
+                            ".entity-result__title-text a span[aria-hidden='true']"
+                        )
+                        name = (await name_el.inner_text()).strip() if name_el else ""
+
+                        subtitle_el = await card.query_selector(".entity-result__primary-subtitle")
+                        subtitle = (await subtitle_el.inner_text()).strip() if subtitle_el else ""
+
+                        link_el = await card.query_selector(".entity-result__title-text a")
+                        href = await link_el.get_attribute("href") if link_el else ""
+                        profile_url = href.split("?")[0] if href else ""
+
+                        if name:
+                            results.append({
+                                "name": name,
+                                "subtitle": subtitle,
+                                "url": profile_url,
+                            })
+                    except Exception:
+                        continue
+
+                logger.info(f"linkedin_search: '{query}' → {len(results)} results")
+                return self._ok({"results": results, "count": len(results), "query": query})
         except Exception as e:
             logger.error(f"linkedin_search failed for '{query}': {e}")
             return self._err(f"LinkedIn search failed: {e}")
-        finally:
-            if context:
-                await context.close()
-            if browser:
-                await browser.close()
-            if pw:
-                await pw.stop()
 
     async def _linkedin_extract(self, profile_url: str) -> dict:
         if not profile_url.startswith("https://www.linkedin.com/"):
@@ -215,12 +236,55 @@ class LinkedInOps(BaseTool):
                 f"LinkedIn rate limit reached ({self._rate_limit} page loads per session)."
             )
 
-        pw = browser = context = None
         try:
-            pw, browser, context = await self._make_browser()
-            page = await context.new_page()
-            self._increment_counter()
+            async with self._session() as context:
+                self._increment_counter()
+                return await self._scrape_profile(context, profile_url)
+        except Exception as e:
+            logger.error(f"linkedin_extract failed for {profile_url}: {e}")
+            return self._err(f"LinkedIn profile extraction failed: {e}")
+
+    async def _linkedin_extract_batch(self, profile_urls: list, max_concurrency: int = 3) -> dict:
+        if not self._cookie:
+            return self._err("LinkedIn session cookie not configured. Set LINKEDIN_COOKIE env var.")
+        # Kept low: parallel profile loads from one session are what LinkedIn throttles
+        sem = asyncio.Semaphore(max(1, min(max_concurrency, _MAX_BATCH_CONCURRENCY)))
+
+        async def _one(context, profile_url: str) -> dict:
+            if not str(profile_url).startswith("https://www.linkedin.com/"):
+                return self._err("Invalid LinkedIn profile URL. Must start with https://www.linkedin.com/")
+            async with sem:
+                if not self._check_rate_limit():
+                    return self._err(
+                        f"LinkedIn rate limit reached ({self._rate_limit} page loads per session)."
+                    )
+                self._increment_counter()
+                try:
+                    return await self._scrape_profile(context, profile_url)
+                except Exception as e:
+                    logger.error(f"linkedin_extract_batch failed for {profile_url}: {e}")
+                    return self._err(f"LinkedIn profile extraction failed: {e}")
+
+        try:
+            # One cookie-carrying context for the whole batch; one tab per profile
+            async with self._session() as context:
+                results = await asyncio.gather(*(_one(context, url) for url in profile_urls))
+        except Exception as e:
+            logger.error(f"linkedin_extract_batch failed: {e}")
+            return self._err(f"LinkedIn profile extraction failed: {e}")
+
+        profiles = [
+            {"url": url, **(r["output"] if r["success"] else {"error": r["error"]})}
+            for url, r in zip(profile_urls, results)
+        ]
+        extracted = sum(1 for r in results if r["success"])
+        logger.info(f"linkedin_extract_batch: {extracted}/{len(profile_urls)} profiles extracted")
+        return self._ok({"profiles": profiles, "extracted": extracted})
 
+    async def _scrape_profile(self, context, profile_url: str) -> dict:
+        """Load one profile in a new tab of context and read its fields."""
+        page = await context.new_page()
+        try:
             timeout_ms = self._li_cfg.get("timeout_seconds", 30) * 1000
             await page.goto(profile_url, wait_until="domcontentloaded", timeout=timeout_ms)
             await page.wait_for_timeout(2000)
@@ -240,28 +304,20 @@ class LinkedInOps(BaseTool):
 
             # About/summary section
             summary = await _text("#about ~ .pvs-list__container .pv-shared-text-with-see-more")
+        finally:
+            await page.close()
 
-            if not name:
-                return self._err(
-                    "Could not extract profile. Session cookie may be expired or profile is private."
-                )
+        if not name:
+            return self._err(
+                "Could not extract profile. Session cookie may be expired or profile is private."
+            )
 
-            logger.info(f"linkedin_extract: {profile_url} → {name!r}")
-            return self._ok({
-                "name": name,
-                "title": title,
-                "company": company,
-                "location": location,
-                "summary": summary,
-                "url": profile_url,
-            })
-        except Exception as e:
-            logger.error(f"linkedin_extract failed for {profile_url}: {e}")
-            return self._err(f"LinkedIn profile extraction failed: {e}")
-        finally:
-            if context:
-                await context.close()
-            if browser:
-                await browser.close()
-            if pw:
-                await pw.stop()
+        logger.info(f"linkedin_extract: {profile_url} → {name!r}")
+        return self._ok({
+            "name": name,
+            "title": title,
+            "company": company,
+            "location": location,
+            "summary": summary,
+            "url": profile_url,
+        })
@@ -13,14 +13,50 @@ Libraries: aiohttp, beautifulsoup4, lxml (all lazy-imported)
 Security: Same SSRF URL blocklist as browser_ops.
 """
 
+import asyncio
 import logging
 import re
+import weakref
 from typing import Optional
 
 from app.tools.base_tool import BaseTool
 
 logger = logging.getLogger("mezzofy.tools.scraping")
 
+# Resolved addresses are reused for this long by the shared connector
+_DNS_CACHE_TTL_SECONDS = 300
+
+# One TCPConnector per event loop, shared by every fetch so its DNS cache and
+# keep-alive connections outlive a single scrape (aiohttp connectors are bound
+# to the loop that created them — Celery tasks each run a fresh loop)
+_CONNECTORS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _shared_connector():
+    """Return the running loop's TCPConnector, creating it on first use."""
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    connector = _CONNECTORS.get(loop)
+    if connector is None or connector.closed:
+        try:
+            import aiodns  # noqa: F401 — c-ares resolver instead of getaddrinfo in a thread
+            resolver = aiohttp.AsyncResolver()
+        except ImportError:
+            resolver = None
+        connector = _CONNECTORS[loop] = aiohttp.TCPConnector(
+            ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+            resolver=resolver,
+        )
+    return connector
+
+
+async def close_shared_connector() -> None:
+    """Close the running loop's shared connector (called on app shutdown)."""
+    connector = _CONNECTORS.pop(asyncio.get_running_loop(), None)
+    if connector is not None:
+        await connector.close()
+
 # Shared SSRF blocklist
 _BLOCKED_URL_PATTERNS = [
     r"localhost",
@@ -166,7 +202,13 @@ class ScrapingOps(BaseTool):
             )
         }
         timeout = aiohttp.ClientTimeout(total=self._timeout())
-        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+        # Per-call session (own cookie jar) over the shared connector
+        async with aiohttp.ClientSession(
+            headers=headers,
+            timeout=timeout,
+            connector=_shared_connector(),
+            connector_owner=False,
+        ) as session:
             async with session.get(url, allow_redirects=True) as resp:
                 resp.raise_for_status()
                 html = await resp.text(errors="replace")
@@ -479,6 +479,8 @@ def run_migrations(conn):
          "CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_log(action, created_at DESC)"),
         ("idx_scheduled_active",
          "CREATE INDEX IF NOT EXISTS idx_scheduled_active ON scheduled_jobs(is_active, next_run)"),
+        ("idx_scheduled_jobs_beat",
+         "CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_beat ON scheduled_jobs(created_at) WHERE is_active"),
         ("idx_webhook_events_source",
          "CREATE INDEX IF NOT EXISTS idx_webhook_events_source ON webhook_events(source, created_at DESC)"),
         ("idx_webhook_events_status",
@@ -279,7 +279,7 @@ def mock_rate_limiter():
         return None
 
     async def _allow_check(*args, **kwargs):
-        return None
+        return False    # allowed, checked against Redis (not degraded)
 
     # Override the FastAPI Depends()-captured function via dependency_overrides
     app.dependency_overrides[_rate_limit_auth_dep] = _allow_auth
@@ -54,3 +54,39 @@ def test_process_delegated_agent_task_has_soft_time_limit():
         "process_delegated_agent_task is missing soft_time_limit. "
         "Without it, a stuck agent task will loop forever and block the Celery worker."
     )
+
+
+
+async def test_llm_clients_share_one_http_pool_per_sdk():
+    """Every AnthropicClient / KimiClient on a loop reuses the same pooled transport."""
+    import anthropic
+    import openai
+    from app.llm.anthropic_client import AnthropicClient
+    from app.llm.http_client import close_shared_http_clients, get_shared_http_client
+    from app.llm.kimi_client import KimiClient
+
+    config = {"llm": {"claude": {"api_key": "sk-test"}, "kimi": {"api_key": "sk-test"}}}
+    claude_pool = get_shared_http_client(anthropic)
+    kimi_pool = get_shared_http_client(openai)
+    try:
+        assert AnthropicClient(config)._client._client is claude_pool
+        assert AnthropicClient(config)._client._client is claude_pool
+        assert KimiClient(config)._client._client is kimi_pool
+    finally:
+        await close_shared_http_clients()
+    assert claude_pool.is_closed and kimi_pool.is_closed
+
+
+def test_shared_http_client_not_created_outside_event_loop():
+    import anthropic
+    from app.llm.http_client import get_shared_http_client
+
+    assert get_shared_http_client(anthropic) is None
+
+
+def test_kimi_client_bounds_pool_and_connect_waits():
+    """KimiClient uses the same granular timeout as AnthropicClient on the shared pool."""
+    from app.llm.kimi_client import KimiClient
+
+    timeout = KimiClient({"llm": {"kimi": {"api_key": "sk-test"}}})._client.timeout
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (10.0, 600.0, 30.0, 10.0)
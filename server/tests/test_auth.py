@@ -350,3 +350,27 @@ class TestHealthCheck:
         assert "status" in data
         assert "version" in data
         assert data["version"] == "1.0.0"
+
+    async def test_health_probes_db_and_redis_concurrently(self, client):
+        """Each probe waits for the other to start — only completes if they overlap."""
+        import asyncio
+        from unittest.mock import patch
+
+        db_started, redis_started = asyncio.Event(), asyncio.Event()
+
+        async def db_probe():
+            db_started.set()
+            await asyncio.wait_for(redis_started.wait(), 1)
+            return True
+
+        async def redis_probe():
+            redis_started.set()
+            await asyncio.wait_for(db_started.wait(), 1)
+            return False
+
+        with patch("app.main.check_db_connection", new=db_probe), \
+             patch("app.main.ping_redis", new=redis_probe):
+            response = await client.get("/health")
+
+        assert response.json()["status"] == "degraded"
+        assert response.json()["services"] == {"database": "ok", "redis": "unavailable"}
@@ -7,6 +7,12 @@ Covers:
   3. tick() triggers reload when _DB_RELOAD_INTERVAL has elapsed
   4. tick() does NOT call load_db_jobs when interval has not elapsed
   5. _reload_db_jobs() is a no-op (no sync) when DB jobs are unchanged
+  6. _reload_db_jobs() survives DB errors
+  7. _parse_cron() caches by expression and pre-filters malformed fields
+  8. load_db_jobs() queries through the sync session (no asyncio.run)
+  9. STATIC_BEAT_SCHEDULE rejects in-place mutation
+ 10. Beat-fired tasks skip the result backend (ignore_result)
+ 11. Task payloads round-trip through the configured (orjson) serializer
 """
 
 import time
@@ -251,3 +257,115 @@ class TestReloadDbJobsErrorHandling:
             scheduler._reload_db_jobs()
 
         scheduler.sync.assert_not_called()
+
+
+# ── 7. Cron parsing is cached ─────────────────────────────────────────────────
+
+class TestParseCronCache:
+    def test_same_expression_returns_same_crontab(self):
+        from app.tasks.beat_schedule import _parse_cron
+
+        first = _parse_cron("0 1 * * 1-5")
+        assert first is not None
+        assert _parse_cron("0 1 * * 1-5") is first
+
+    def test_invalid_expression_still_none(self):
+        from app.tasks.beat_schedule import _parse_cron
+
+        assert _parse_cron("not a cron") is None
+        assert _parse_cron("not a cron") is None
+
+    def test_malformed_fields_rejected_without_crontab(self):
+        from app.tasks.beat_schedule import _parse_cron
+
+        with patch("app.tasks.beat_schedule.crontab") as crontab:
+            assert _parse_cron("0 9 * * 1;") is None
+            assert _parse_cron("0 9 ** * mon") is None
+        crontab.assert_not_called()
+
+    def test_names_steps_and_lists_accepted(self):
+        from app.tasks.beat_schedule import _parse_cron
+
+        assert _parse_cron("*/15 0-6/2 1,15 jan-jun mon-fri") is not None
+
+
+# ── 8. load_db_jobs reads through the sync session ────────────────────────────
+
+class TestLoadDbJobs:
+    def _row(self, job_id, schedule):
+        from types import SimpleNamespace
+        return SimpleNamespace(
+            id=job_id, user_id="u1", name="Weekly", agent="sales", message="go",
+            workflow_name=None, schedule=schedule, deliver_to={},
+        )
+
+    def test_rows_become_beat_entries_without_event_loop(self):
+        from app.tasks.beat_schedule import load_db_jobs
+
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.execute.return_value.fetchall.return_value = [
+            self._row("a", "0 1 * * 1"),
+            self._row("b", "bad"),
+        ]
+
+        with patch("app.core.database.SyncSessionLocal", return_value=session), \
+                patch("asyncio.run") as run:
+            jobs = load_db_jobs()
+
+        run.assert_not_called()
+        assert list(jobs) == ["db-job-a"]
+        assert session.execute.call_args.args[1] == {"lim": 5000}
+        assert jobs["db-job-a"]["args"][0]["_job_id"] == "a"
+        assert jobs["db-job-a"]["options"] == {"ignore_result": True}
+
+    def test_db_error_returns_empty(self):
+        from app.tasks.beat_schedule import load_db_jobs
+
+        with patch("app.core.database.SyncSessionLocal", side_effect=Exception("down")):
+            assert load_db_jobs() == {}
+
+
+# ── 9. Static schedule is read-only ───────────────────────────────────────────
+
+class TestStaticScheduleReadOnly:
+    def test_static_schedule_cannot_be_mutated(self):
+        from app.tasks.beat_schedule import STATIC_BEAT_SCHEDULE
+
+        with pytest.raises(TypeError):
+            STATIC_BEAT_SCHEDULE["rogue"] = {}
+        assert "system-health-check" in STATIC_BEAT_SCHEDULE
+
+
+# ── 10. Beat-fired tasks skip the result backend ──────────────────────────────
+
+class TestBeatResultsIgnored:
+    def test_static_entries_ignore_result_and_keep_options(self):
+        from app.tasks.beat_schedule import STATIC_BEAT_SCHEDULE
+
+        assert all(e["options"]["ignore_result"] for e in STATIC_BEAT_SCHEDULE.values())
+        assert STATIC_BEAT_SCHEDULE["system-health-check"]["options"]["expires"] == 240
+        assert STATIC_BEAT_SCHEDULE["sales-daily-crm-digest"]["options"]["queue"] == "sales"
+
+
+# ── 11. Task payloads round-trip through the configured serializer ────────────
+
+class TestTaskSerializer:
+    def test_beat_payload_round_trips(self):
+        import datetime
+        from kombu.serialization import dumps, loads, prepare_accept_content
+        from app.tasks.beat_schedule import STATIC_BEAT_SCHEDULE
+        from app.tasks.celery_app import celery_app
+
+        conf = celery_app.conf
+        accept = prepare_accept_content(conf.accept_content)
+        payload = dict(STATIC_BEAT_SCHEDULE["weekly-kpi-report"]["args"][0], message="Résumé ✓")
+        body = ((payload,), {}, {"callbacks": None})
+
+        content_type, encoding, data = dumps(body, serializer=conf.task_serializer)
+        decoded = loads(data, content_type, encoding, accept=accept)
+
+        assert decoded == [[payload], {}, {"callbacks": None}]
+        stamp = datetime.datetime(2026, 1, 5, 9, 30)
+        _, _, data = dumps({"at": stamp}, serializer=conf.task_serializer)
+        assert loads(data, content_type, encoding, accept=accept)["at"].startswith("2026-01-05")
@@ -318,6 +318,59 @@ class TestRouterUnit:
 
         assert result["success"] is True
 
+    @pytest.mark.parametrize("event,agent", [
+        ("order_completed", "finance"),
+        ("stripe.order_completed.v2", "finance"),
+        ("hr:employee_offboarded", "hr"),
+        ("invoice_paid", None),
+        ("", None),
+    ])
+    async def test_webhook_event_keyword_lookup(self, event, agent):
+        from app.router import _route_webhook
+
+        with patch("app.router._execute_by_name", new_callable=AsyncMock,
+                   return_value=CANNED_AGENT_RESPONSE) as execute:
+            result = await _route_webhook({"event": event}, TEST_CONFIG)
+
+        if agent is None:
+            execute.assert_not_called()
+            assert result["success"] is False
+        else:
+            assert execute.await_args.args[0] == agent
+
+    async def test_execute_by_name_accepts_mixed_case(self):
+        from app.router import _execute_by_name
+
+        class SalesAgent:
+            def __init__(self, config):
+                pass
+
+            async def execute(self, task):
+                return {k: v for k, v in CANNED_AGENT_RESPONSE.items() if k != "agent_used"}
+
+        with patch("app.router.AGENT_MAP", {"sales": SalesAgent}), \
+                patch("app.router.set_user_context"):
+            result = await _execute_by_name("Sales", {"message": ""}, TEST_CONFIG)
+
+        assert result["success"] is True
+        assert result["agent_used"] == "sales"
+
+    async def test_execute_by_name_reuses_agent_instance(self):
+        from app.router import _execute_by_name
+        from unittest.mock import MagicMock
+
+        instance = AsyncMock()
+        instance.execute = AsyncMock(return_value=CANNED_AGENT_RESPONSE)
+        AgentClass = MagicMock(return_value=instance)
+
+        with patch("app.router.AGENT_MAP", {"sales": AgentClass}), \
+                patch("app.router.set_user_context"):
+            await _execute_by_name("sales", {"message": ""}, TEST_CONFIG)
+            await _execute_by_name("sales", {"message": ""}, dict(TEST_CONFIG))
+            await _execute_by_name("sales", {"message": ""}, {**TEST_CONFIG, "llm": {}})
+
+        assert AgentClass.call_count == 2  # equal config reused; changed config rebuilds
+
 
 # ── Finance workflow end-to-end (mocked) ──────────────────────────────────────
 
@@ -679,3 +732,103 @@ class TestSchedulerKeywords:
     def test_generic_lead_message_not_scheduler(self):
         """Plain lead prospecting message must NOT match scheduler keywords."""
         assert self._is_scheduler("find me new leads in Singapore F&B") is False
+
+
+# ── WebSocket push backplane ──────────────────────────────────────────────────
+
+class TestWSBackplane:
+    """One shared Redis subscriber per worker fans notifications out to local sockets."""
+
+    def _redis(self, published: list):
+        import asyncio
+
+        class FakePubSub:
+            def __init__(self):
+                self.channels: set[str] = set()
+                self.queue: asyncio.Queue = asyncio.Queue()
+
+            async def subscribe(self, *channels):
+                self.channels.update(channels)
+
+            async def unsubscribe(self, *channels):
+                self.channels.difference_update(channels)
+
+            async def listen(self):
+                while True:
+                    yield await self.queue.get()
+
+            async def aclose(self):
+                pass
+
+        pubsub = FakePubSub()
+        redis = MagicMock()
+        redis.pubsub = MagicMock(return_value=pubsub)
+        redis.publish = AsyncMock(side_effect=lambda ch, data: published.append((ch, data)) or 0)
+        return redis, pubsub
+
+    async def test_connect_subscribes_once_and_forwards_notifications(self):
+        import asyncio
+        from app.output.stream_handler import WSConnectionManager
+
+        redis, pubsub = self._redis([])
+        manager = WSConnectionManager()
+        ws_a, ws_b = AsyncMock(), AsyncMock()
+
+        with patch("app.core.redis_client.get_redis", return_value=redis):
+            await manager.connect(ws_a, "a")
+            await manager.connect(ws_b, "b")
+            assert redis.pubsub.call_count == 1
+            assert pubsub.channels == {"user:a:notifications", "user:b:notifications"}
+
+            await pubsub.queue.put(
+                {"type": "message", "channel": "user:b:notifications", "data": '{"x": 1}'}
+            )
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            ws_b.send_text.assert_awaited_once_with('{"x": 1}')
+            ws_a.send_text.assert_not_called()
+
+            await manager.disconnect("a", ws_a)
+            assert pubsub.channels == {"user:b:notifications"}
+            await manager.close()
+
+    async def test_send_to_user_on_another_worker_publishes(self):
+        from app.output.stream_handler import WSConnectionManager
+
+        published: list = []
+        redis, _ = self._redis(published)
+        manager = WSConnectionManager()
+
+        with patch("app.core.redis_client.get_redis", return_value=redis):
+            assert await manager.send("elsewhere", {"type": "status"}) is False
+
+        assert published == [("user:elsewhere:notifications", '{"type":"status"}')]
+
+    async def test_local_send_uses_one_text_frame(self):
+        from app.output.stream_handler import WSConnectionManager
+
+        redis, _ = self._redis([])
+        manager = WSConnectionManager()
+        ws = AsyncMock()
+
+        with patch("app.core.redis_client.get_redis", return_value=redis):
+            await manager.connect(ws, "u")
+            assert await manager.send("u", {"type": "transcript", "text": "你好"}) is True
+            await manager.close()
+
+        ws.send_text.assert_awaited_once_with('{"type":"transcript","text":"你好"}')
+        ws.send_json.assert_not_called()
+
+    async def test_stale_disconnect_keeps_replacement_socket(self):
+        from app.output.stream_handler import WSConnectionManager
+
+        redis, _ = self._redis([])
+        manager = WSConnectionManager()
+        old, new = AsyncMock(), AsyncMock()
+
+        with patch("app.core.redis_client.get_redis", return_value=redis):
+            await manager.connect(old, "u")
+            await manager.connect(new, "u")
+            await manager.disconnect("u", old)     # old socket's handler exits late
+            assert manager.is_connected("u")
+            await manager.close()
@@ -272,6 +272,41 @@ class TestXlsxOps:
         assert result["output"]["row_count"] == 5
 
 
+class TestCSVRead:
+    """Tests for CSVOps.read_csv — parsing is identical with or without pyarrow."""
+
+    @pytest.mark.asyncio
+    async def test_read_csv_skips_malformed_rows(self, doc_config, tmp_path):
+        from app.tools.document.csv_ops import CSVOps
+
+        csv_path = tmp_path / "sales.csv"
+        csv_path.write_text("region,amount\nHK,10\nbroken,row,extra\nSG,30\n")
+
+        result = await CSVOps(doc_config)._read_csv(file_path=str(csv_path))
+
+        assert result.get("success") is True
+        output = result["output"]
+        assert output["headers"] == ["region", "amount"]
+        assert output["rows"] == [["HK", 10], ["SG", 30]]
+        assert output["numeric_summary"]["amount"]["mean"] == 20.0
+
+    @pytest.mark.asyncio
+    async def test_short_rows_kept_as_with_pandas(self, doc_config, tmp_path):
+        import pandas as pd
+        from app.tools.document.csv_ops import CSVOps
+
+        csv_path = tmp_path / "ragged.csv"
+        csv_path.write_text("region,amount,owner\nHK,10,amy\nTW\nSG,30\n")
+
+        result = await CSVOps(doc_config)._read_csv(file_path=str(csv_path))
+
+        expected = pd.read_csv(csv_path, on_bad_lines="skip")
+        output = result["output"]
+        assert output["total_rows"] == len(expected) == 3
+        assert output["rows"][1] == ["TW", None, None]
+        assert output["numeric_summary"]["amount"]["mean"] == 20.0
+
+
 # ── PDF Tests ──────────────────────────────────────────────────────────────────
 
 class TestPDFOps:
@@ -446,3 +481,118 @@ class TestSkillOkGuardFallback:
             assert "if not skill_ok" in source, (
                 f"{name}.py must have 'if not skill_ok:' fallback block after the try/except."
             )
+
+
+# ── ContentGenerationSkill brand/product context cache ────────────────────────
+
+class TestContentGenerationContextCache:
+    def _skill(self):
+        from app.skills.available.content_generation import ContentGenerationSkill
+
+        with patch("app.tools.mezzofy.knowledge_ops.KnowledgeOps"), \
+             patch("app.tools.mezzofy.data_ops.MezzofyDataOps"):
+            skill = ContentGenerationSkill({})
+        skill._knowledge.execute = AsyncMock(return_value={"success": True, "output": "Brand voice"})
+        skill._data.execute = AsyncMock(return_value={"success": True, "output": ["Coupon Exchange"]})
+        return skill
+
+    async def test_context_loaded_once_for_concurrent_and_repeat_calls(self):
+        import asyncio
+
+        skill = self._skill()
+        llm = MagicMock()
+        llm.chat = AsyncMock(return_value={"content": "Copy"})
+
+        with patch("app.llm.llm_manager.get", return_value=llm):
+            results = await asyncio.gather(*(skill.generate_content("blog", "Loyalty") for _ in range(3)))
+            await skill.generate_content("social", "Loyalty")
+
+        assert all(r["success"] for r in results)
+        skill._knowledge.execute.assert_awaited_once_with("get_brand_guidelines")
+        skill._data.execute.assert_awaited_once_with("get_products")
+        assert "Brand voice" in llm.chat.await_args.kwargs["messages"][0]["content"]
+
+    async def test_failed_load_falls_back_and_is_retried(self):
+        skill = self._skill()
+        skill._knowledge.execute = AsyncMock(side_effect=[
+            {"success": False, "error": "KB offline"},
+            {"success": True, "output": "Brand voice"},
+        ])
+
+        from app.skills.available.content_generation import _DEFAULT_BRAND_GUIDELINES
+        assert await skill._get_brand() == _DEFAULT_BRAND_GUIDELINES
+        assert await skill._get_brand() == "Brand voice"
+
+    async def test_product_context_truncated_like_str(self):
+        catalog = {"products": [{"name": f"Plan {i}", "features": ["a", "b"], "price": i * 9.5} for i in range(500)]}
+        skill = self._skill()
+        skill._data.execute = AsyncMock(return_value={"success": True, "output": catalog})
+
+        assert await skill._get_products() == str(catalog)[:1000]
+
+    async def test_raising_load_falls_back_without_failing_the_other(self):
+        skill = self._skill()
+        skill._knowledge.execute = AsyncMock(side_effect=ConnectionError("KB down"))
+        llm = MagicMock()
+        llm.chat = AsyncMock(return_value={"content": "Copy"})
+
+        with patch("app.llm.llm_manager.get", return_value=llm):
+            result = await skill.generate_content("blog", "Loyalty")
+
+        from app.skills.available.content_generation import _DEFAULT_BRAND_GUIDELINES
+        prompt = llm.chat.await_args.kwargs["messages"][0]["content"]
+        assert result["success"] is True
+        assert _DEFAULT_BRAND_GUIDELINES in prompt and "Coupon Exchange" in prompt
+
+
+# ── Bounded str() of tool output ──────────────────────────────────────────────
+
+class TestTruncateRepr:
+    def test_matches_str_slice(self):
+        from app.skills.truncation import truncate_repr
+
+        data = [{"name": "Café ☕", "tags": ["a", None, 1.5], "nested": {"k": (1, 2)}}] * 50
+        for limit in (0, 1, 17, 500, 10_000):
+            assert truncate_repr(data, limit) == str(data)[:limit]
+        assert truncate_repr("plain text", 5) == "plain"
+
+    def test_stops_rendering_at_limit(self):
+        from app.skills.truncation import truncate_repr
+
+        class Exploding:
+            def __repr__(self):
+                raise AssertionError("rendered past the limit")
+
+        assert truncate_repr(["x" * 100, Exploding()], 50) == "['" + "x" * 48
+
+
+# ── PitchDeckGenerationSkill data fetches ─────────────────────────────────────
+
+class TestPitchDeckDataFetches:
+    async def test_fetches_run_concurrently_in_slide_order(self):
+        import asyncio
+        from app.skills.available.pitch_deck_generation import PitchDeckGenerationSkill
+
+        running, peak = 0, 0
+
+        async def execute(action, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if action == "get_case_studies":
+                raise ConnectionError("down")
+            return {"success": True, "output": f"{action} data"}
+
+        with patch("app.tools.document.pptx_ops.PPTXOps"), \
+             patch("app.tools.mezzofy.data_ops.MezzofyDataOps"):
+            skill = PitchDeckGenerationSkill({})
+        skill._data.execute = execute
+
+        sections = await skill._build_deck_content("Acme", "Retail", None, True, True)
+
+        assert peak == 3
+        titles = [s["title"] for s in sections]
+        assert titles[3:] == ["Product Features", "Pricing", "Next Steps"]
+        assert sections[4]["content"] == "get_pricing data"
@@ -325,14 +325,19 @@ class TestImageProcessingInUpload:
 
     async def test_image_upload_returns_image_analysis(self, client, mock_get_db):
         """Image upload runs handle_image and returns ocr_text + description."""
+        from app.input.enriched import EnrichedInput
+
         fake_artifact = {"id": str(uuid.uuid4()), "download_url": "/files/img1"}
-        fake_image_result = {
-            "media_content": {
+        fake_image_result = EnrichedInput(
+            input_type="image",
+            extracted_text="",
+            media_content={
                 "filename": "photo.jpg",
                 "ocr_text": "Invoice #1042 Total: $250.00",
                 "description": "A photo of a printed invoice",
-            }
-        }
+            },
+            input_summary="Image: photo.jpg",
+        )
         with patch("app.api.files.get_user_artifacts_dir", return_value=Path("/tmp/artifacts")), \
              patch("pathlib.Path.mkdir"), \
              patch("pathlib.Path.write_bytes"), \
@@ -16,6 +16,8 @@ Tests cover:
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from app.input.enriched import EnrichedInput
+
 pytestmark = pytest.mark.unit
 
 
@@ -83,6 +85,21 @@ class TestValidateURL:
         err = self._validate("http://LOCALHOST/admin")
         assert err != ""
 
+    @pytest.mark.parametrize("url", [
+        "http://2130706433/",              # decimal 127.0.0.1
+        "http://0x7f.1/",                  # hex shorthand
+        "http://0177.0.0.1/",              # octal
+        "http://[::ffff:127.0.0.1]/",      # IPv4-mapped IPv6
+        "http://[fd00::1]/",               # IPv6 ULA
+        "http://100.64.0.1/",              # CGNAT
+        "http://172.31.255.255/",
+    ])
+    def test_obfuscated_and_private_ip_forms_blocked(self, url):
+        assert self._validate(url).startswith("blocked private network")
+
+    def test_numeric_looking_domain_allowed(self):
+        assert self._validate("https://1e100.net/") == ""
+
 
 # ── handle_url unit tests ─────────────────────────────────────────────────────
 
@@ -94,7 +111,7 @@ class TestHandleURL:
         mock_scraping = AsyncMock()
         mock_scraping.execute = AsyncMock(return_value={
             "success": True,
-            "output": "Page title\n\nSome page content about widgets.",
+            "output": {"text": "Page title\n\nSome page content about widgets.", "url": "https://www.example.com/page"},
         })
 
         task = {
@@ -107,10 +124,10 @@ class TestHandleURL:
         with patch("app.tools.web.scraping_ops.ScrapingOps", return_value=mock_scraping):
             result = await handle_url(task)
 
-        assert result["input_type"] == "url"
-        assert "extracted_text" in result
-        assert result["extracted_text"] != ""
-        mock_scraping.execute.assert_called_once()
+        assert result.input_type == "url"
+        assert result.extracted_text
+        assert "Some page content about widgets." in result.extracted_text
+        mock_scraping.execute.assert_called_once_with("scrape_url", url="https://www.example.com/page")
 
     async def test_invalid_url_returns_rejection(self):
         """handle_url returns rejection message for blocked URLs."""
@@ -123,8 +140,8 @@ class TestHandleURL:
         }
         result = await handle_url(task)
 
-        assert result["input_type"] == "url"
-        assert "rejected" in result.get("extracted_text", "").lower()
+        assert result.input_type == "url"
+        assert "rejected" in result.extracted_text.lower()
 
     async def test_scrape_exception_handled_gracefully(self):
         """handle_url handles scraping tool exceptions gracefully."""
@@ -144,8 +161,8 @@ class TestHandleURL:
             result = await handle_url(task)
 
         # Should return partial result, not raise
-        assert result["input_type"] == "url"
-        assert "extracted_text" in result
+        assert result.input_type == "url"
+        assert result.extracted_text
 
     async def test_url_content_truncated_to_max_chars(self):
         """Content longer than _MAX_CONTENT_CHARS (6000) is truncated."""
@@ -153,7 +170,7 @@ class TestHandleURL:
 
         long_content = "A" * (_MAX_CONTENT_CHARS + 1000)
         mock_scraping = AsyncMock()
-        mock_scraping.execute = AsyncMock(return_value={"success": True, "output": long_content})
+        mock_scraping.execute = AsyncMock(return_value={"success": True, "output": {"text": long_content}})
 
         task = {
             "_config": {},
@@ -166,7 +183,41 @@ class TestHandleURL:
             result = await handle_url(task)
 
         # Extracted text must be capped at max chars
-        assert len(result.get("extracted_text", "")) <= _MAX_CONTENT_CHARS + 100  # small buffer for prefix
+        assert len(result.extracted_text) <= _MAX_CONTENT_CHARS + 100  # small buffer for prefix
+
+    async def test_leading_whitespace_stripped_without_losing_content(self):
+        from app.input.url_handler import _MAX_CONTENT_CHARS, handle_url
+
+        mock_scraping = AsyncMock()
+        page = "\n" * 100 + "x" * (_MAX_CONTENT_CHARS * 10)
+        mock_scraping.execute = AsyncMock(return_value={"success": True, "output": {"text": page}})
+
+        task = {"_config": {}, "url": "https://www.example.com", "message": "https://www.example.com"}
+        with patch("app.tools.web.scraping_ops.ScrapingOps", return_value=mock_scraping):
+            result = await handle_url(task)
+
+        assert result.media_content["content"] == "x" * _MAX_CONTENT_CHARS
+
+
+# ── ScrapingOps shared connector ──────────────────────────────────────────────
+
+class TestScrapingSharedConnector:
+    async def test_connector_reused_with_dns_cache_until_closed(self):
+        import aiohttp
+        from app.tools.web import scraping_ops
+
+        with patch("aiohttp.TCPConnector", wraps=aiohttp.TCPConnector) as connector_cls:
+            first = scraping_ops._shared_connector()
+        try:
+            assert scraping_ops._shared_connector() is first
+            assert connector_cls.call_args.kwargs["ttl_dns_cache"] == scraping_ops._DNS_CACHE_TTL_SECONDS
+        finally:
+            await scraping_ops.close_shared_connector()
+
+        assert first.closed
+        replacement = scraping_ops._shared_connector()
+        assert replacement is not first
+        await scraping_ops.close_shared_connector()
 
 
 # ── process_input routing tests ───────────────────────────────────────────────
@@ -179,7 +230,7 @@ class TestInputRouter:
 
         task = {"input_type": "text", "message": "Hello world", "_config": {}}
         with patch("app.input.text_handler.handle_text", new_callable=AsyncMock,
-                   return_value={**task, "extracted_text": "Hello world"}) as mock_text:
+                   return_value=EnrichedInput("text", "Hello world", None, "Text")) as mock_text:
             result = await process_input(task)
 
         mock_text.assert_called_once_with(task)
@@ -189,7 +240,7 @@ class TestInputRouter:
         from app.input.input_router import process_input
 
         task = {"input_type": "url", "url": "https://example.com", "_config": {}}
-        enriched = {**task, "extracted_text": "Page content", "media_content": None, "input_summary": "URL"}
+        enriched = EnrichedInput("url", "Page content", None, "URL")
         with patch("app.input.url_handler.handle_url", new_callable=AsyncMock, return_value=enriched) as mock_url:
             result = await process_input(task)
 
@@ -199,7 +250,7 @@ class TestInputRouter:
         from app.input.input_router import process_input
 
         task = {"input_type": "image", "_config": {}}
-        enriched = {**task, "extracted_text": "image content", "media_content": {}, "input_summary": "image"}
+        enriched = EnrichedInput("image", "image content", {}, "image")
         with patch("app.input.image_handler.handle_image", new_callable=AsyncMock, return_value=enriched) as mock_img:
             result = await process_input(task, file_bytes=b"jpeg_data", filename="photo.jpg")
 
@@ -209,7 +260,7 @@ class TestInputRouter:
         from app.input.input_router import process_input
 
         task = {"input_type": "audio", "_config": {}}
-        enriched = {**task, "extracted_text": "transcript", "media_content": {}, "input_summary": "audio"}
+        enriched = EnrichedInput("audio", "transcript", {}, "audio")
         with patch("app.input.audio_handler.handle_audio", new_callable=AsyncMock, return_value=enriched) as mock_aud:
             result = await process_input(task, file_bytes=b"mp3_data", filename="audio.mp3")
 
@@ -219,12 +270,63 @@ class TestInputRouter:
         from app.input.input_router import process_input
 
         task = {"input_type": "file", "_config": {}}
-        enriched = {**task, "extracted_text": "doc content", "media_content": {}, "input_summary": "file"}
+        enriched = EnrichedInput("file", "doc content", {}, "file")
         with patch("app.input.file_handler.handle_file", new_callable=AsyncMock, return_value=enriched) as mock_file:
             result = await process_input(task, file_bytes=b"pdf_data", filename="doc.pdf")
 
         mock_file.assert_called_once()
 
+    async def test_media_handler_gets_default_filename(self):
+        from app.input.input_router import process_input
+
+        task = {"input_type": "video", "_config": {}}
+        with patch("app.input.video_handler.handle_video", new_callable=AsyncMock,
+                   return_value=EnrichedInput("video", "", {}, "video")) as mock_vid:
+            await process_input(task, file_bytes=b"mp4_data")
+
+        mock_vid.assert_called_once_with(task, b"mp4_data", "video.mp4")
+
+    async def test_handler_module_imported_once(self):
+        from app.input import input_router
+
+        task = {"input_type": "text", "message": "hi", "_config": {}}
+        await input_router.process_input(task)
+        with patch("importlib.import_module") as mock_import:
+            await input_router.process_input(task)
+
+        mock_import.assert_not_called()
+        assert "text" in input_router._HANDLER_MODULES
+
+    async def test_media_handlers_bounded_but_text_not(self):
+        import asyncio
+        from app.input import input_router
+
+        release = asyncio.Event()
+        in_flight = 0
+        peak = 0
+
+        async def slow_url(task):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return EnrichedInput("url", "", None, "URL")
+
+        url_task = {"input_type": "url", "_config": {}}
+        text_task = {"input_type": "text", "message": "hi", "_config": {}}
+        with patch.object(input_router, "_INPUT_SEM", asyncio.Semaphore(1)), \
+             patch("app.input.url_handler.handle_url", side_effect=slow_url):
+            pending = [asyncio.create_task(input_router.process_input(url_task)) for _ in range(3)]
+            await asyncio.sleep(0)
+            # A text message is not queued behind the slow URL fetches
+            result = await asyncio.wait_for(input_router.process_input(text_task), timeout=1)
+            release.set()
+            await asyncio.gather(*pending)
+
+        assert result["extracted_text"] == "hi"
+        assert peak == 1
+
     async def test_speech_input_passthrough(self):
         """speech input_type is handled by WebSocket — process_input passes through."""
         from app.input.input_router import process_input
@@ -243,6 +345,7 @@ class TestInputRouter:
         task = {"input_type": "camera", "message": "camera frame", "_config": {}}
         result = await process_input(task)
 
+        assert result is task                       # updated in place, not copied
         assert result["extracted_text"] == "camera frame"
         assert "camera" in result["input_summary"]
 
@@ -253,13 +356,15 @@ class TestInputRouter:
         task = {"input_type": "hologram", "message": "sci-fi content", "_config": {}}
         result = await process_input(task)
 
+        assert result is task
         assert result["extracted_text"] == "sci-fi content"
+        assert result["input_summary"] == "Unknown input type: hologram"
 
     async def test_video_input_routes_to_video_handler(self):
         from app.input.input_router import process_input
 
         task = {"input_type": "video", "_config": {}}
-        enriched = {**task, "extracted_text": "video frames", "media_content": {}, "input_summary": "video"}
+        enriched = EnrichedInput("video", "video frames", {}, "video")
         with patch("app.input.video_handler.handle_video", new_callable=AsyncMock, return_value=enriched) as mock_vid:
             result = await process_input(task, file_bytes=b"mp4_data", filename="video.mp4")
 
@@ -276,8 +381,8 @@ class TestTextHandler:
         task = {"message": "Hello world", "input_type": "text", "_config": {}}
         result = await handle_text(task)
 
-        assert result["extracted_text"] == "Hello world"
-        assert result["input_type"] == "text"
+        assert result.extracted_text == "Hello world"
+        assert result.input_type == "text"
 
     async def test_text_handler_empty_message(self):
         from app.input.text_handler import handle_text
@@ -285,10 +390,11 @@ class TestTextHandler:
         task = {"message": "", "input_type": "text", "_config": {}}
         result = await handle_text(task)
 
-        assert "extracted_text" in result
+        assert result.extracted_text == ""
 
-    async def test_text_handler_preserves_task_fields(self):
-        """Text handler keeps all original task fields."""
+    async def test_text_handler_returns_only_new_fields(self):
+        """Text handler returns only its own fields; process_input merges them into the task."""
+        from app.input.input_router import process_input
         from app.input.text_handler import handle_text
 
         task = {
@@ -298,10 +404,16 @@ class TestTextHandler:
             "session_id": "abc-123",
             "role": "sales_rep",
         }
-        result = await handle_text(task)
+        enriched = await handle_text(task)
+        assert isinstance(enriched, EnrichedInput)
+        assert "session_id" not in enriched.__slots__
+
+        result = await process_input(task)
 
+        assert result is task                       # updated in place, not copied
         assert result["session_id"] == "abc-123"
         assert result["role"] == "sales_rep"
+        assert result["extracted_text"] == "test"
 
 
 # ── image_handler regression tests (BUG-003 / BUG-004) ───────────────────────
@@ -407,12 +519,35 @@ class TestImageHandlerBug003:
         with patch("app.tools.media.image_ops.ImageOps", return_value=mock_image_ops):
             result = await handle_image(task, file_bytes, "receipt.jpg")
 
-        extracted = result["extracted_text"]
+        extracted = result.extracted_text
         assert "A photo of a restaurant receipt" in extracted
         assert "TOTAL: $150.00" in extracted
         assert "what is the total?" in extracted
 
 
+class TestImageHandlerConcurrentFallback:
+    """OCR and vision run concurrently in the fallback path; one failing must not drop the other."""
+
+    async def test_ocr_exception_still_returns_vision_description(self):
+        from app.input.image_handler import handle_image
+
+        async def fake_execute(operation, **kwargs):
+            if operation == "ocr_image":
+                raise RuntimeError("tesseract not installed")
+            return {"success": True, "output": "A whiteboard diagram"}
+
+        mock_image_ops = AsyncMock()
+        mock_image_ops.execute = fake_execute
+
+        task = {"_config": {}, "message": ""}
+
+        with patch("app.tools.media.image_ops.ImageOps", return_value=mock_image_ops):
+            result = await handle_image(task, b"img", "board.jpg")
+
+        assert "A whiteboard diagram" in result.extracted_text
+        assert result.media_content["ocr_text"] == ""
+
+
 class TestManagementAgentBug004:
     """
     Regression tests for BUG-004: ManagementAgent must use extracted_text
@@ -643,9 +778,9 @@ class TestPDFFilesAPI:
         ):
             result = await handle_file(task, b"%PDF fake bytes", "report.pdf")
 
-        assert result.get("anthropic_file_id") == fake_file_id
-        assert result.get("extracted_text") == "Summarize this"
-        assert result.get("input_type") == "file"
+        assert result.anthropic_file_id == fake_file_id
+        assert result.extracted_text == "Summarize this"
+        assert result.input_type == "file"
 
     async def test_handle_file_pdf_default_message_when_no_user_message(self):
         """extracted_text defaults to 'Please analyze this document.' when message is empty."""
@@ -659,7 +794,7 @@ class TestPDFFilesAPI:
         ):
             result = await handle_file(task, b"%PDF fake bytes", "doc.pdf")
 
-        assert result.get("extracted_text") == "Please analyze this document."
+        assert result.extracted_text == "Please analyze this document."
 
     async def test_handle_file_pdf_falls_back_to_pypdf_when_upload_fails(self):
         """When Files API upload returns None, handle_file falls through to pypdf."""
@@ -681,9 +816,9 @@ class TestPDFFilesAPI:
             result = await handle_file(task, b"%PDF fake bytes", "fallback.pdf")
 
         # Must NOT have anthropic_file_id — used the pypdf fallback
-        assert "anthropic_file_id" not in result
+        assert result.anthropic_file_id is None
         # Must contain the extracted pypdf text
-        assert "Fallback pypdf text" in result.get("extracted_text", "")
+        assert "Fallback pypdf text" in result.extracted_text
 
     async def test_handle_file_pdf_input_summary_contains_files_api(self):
         """input_summary mentions Files API when upload succeeds."""
@@ -697,7 +832,7 @@ class TestPDFFilesAPI:
         ):
             result = await handle_file(task, b"%PDF", "whitepaper.pdf")
 
-        assert "Files API" in result.get("input_summary", "")
+        assert "Files API" in result.input_summary
 
 
 # ── file_handler Office format tests ──────────────────────────────────────────
@@ -816,3 +951,350 @@ class TestFileHandler:
 
         assert "legacy PowerPoint 97-2003" in result
         assert ".pptx" in result
+
+    async def test_text_file_decoded_from_bytes_without_temp_file(self):
+        """.txt/.md uploads are decoded in memory — no NamedTemporaryFile is created."""
+        from app.input.file_handler import handle_file
+
+        task = {"_config": {}, "message": "summarise"}
+        with patch("tempfile.NamedTemporaryFile") as mock_tmp:
+            result = await handle_file(task, "Meeting notes — café".encode(), "notes.md")
+
+        mock_tmp.assert_not_called()
+        assert "Meeting notes — café" in result.extracted_text
+        assert result.media_content["extracted_chars"] == len("Meeting notes — café")
+
+
+# ── audio/video upload handler tests ──────────────────────────────────────────
+
+class TestMediaUploadHandlers:
+    """Audio/video uploads are passed to the media ops as bytes, not temp-file paths."""
+
+    async def test_audio_upload_passes_bytes_and_reads_text(self):
+        from app.input.audio_handler import handle_audio
+
+        mock_ops = AsyncMock()
+        mock_ops.execute = AsyncMock(return_value={
+            "success": True,
+            "output": {"text": " Hello there ", "language": "en", "duration": 1.2},
+        })
+
+        with patch("app.tools.media.audio_ops.AudioOps", return_value=mock_ops):
+            result = await handle_audio({"_config": {}}, b"ID3 audio", "memo.m4a")
+
+        kwargs = mock_ops.execute.call_args.kwargs
+        assert "audio_path" not in kwargs
+        assert kwargs["audio_bytes"] == b"ID3 audio"
+        assert kwargs["file_extension"] == "m4a"
+        assert result.media_content["transcript"] == "Hello there"
+        assert result.media_content["language"] == "en"
+
+    async def test_video_upload_passes_bytes_and_reads_summary(self):
+        from app.input.video_handler import handle_video
+
+        mock_ops = AsyncMock()
+        mock_ops.execute = AsyncMock(return_value={
+            "success": True,
+            "output": {"visual_summary": "A demo", "transcript": "Welcome", "frames_analyzed": 3},
+        })
+
+        with patch("app.tools.media.video_ops.VideoOps", return_value=mock_ops):
+            result = await handle_video({"_config": {}}, b"\x00\x00\x00\x18ftypmp42", "demo.mp4")
+
+        kwargs = mock_ops.execute.call_args.kwargs
+        assert "video_path" not in kwargs
+        assert kwargs["video_bytes"] == b"\x00\x00\x00\x18ftypmp42"
+        assert "[Video description: A demo]" in result.extracted_text
+        assert "[Audio transcript: Welcome]" in result.extracted_text
+
+
+class TestVideoOpsAnalyze:
+    """analyze_video runs the vision and transcription branches concurrently."""
+
+    async def test_vision_and_audio_branches_overlap(self):
+        import asyncio
+        import os
+        from app.tools.media.video_ops import VideoOps
+
+        started: list[str] = []
+        both_running = asyncio.Event()
+        seen_paths: list[str] = []
+
+        async def branch(name, result, video_path):
+            seen_paths.append(video_path)
+            started.append(name)
+            if len(started) == 2:
+                both_running.set()
+            await asyncio.wait_for(both_running.wait(), timeout=1)
+            return result
+
+        async def describe(video_path):
+            return await branch("vision", ("A product demo", 5), video_path)
+
+        async def transcribe(video_path):
+            return await branch("audio", "Welcome to the demo", video_path)
+
+        ops = VideoOps({})
+        with patch.object(ops, "_describe_key_frames", new=describe), \
+             patch.object(ops, "_transcribe_video_audio", new=transcribe):
+            result = await ops.execute("analyze_video", video_bytes=b"\x00\x00\x00\x18ftypmp42")
+
+        assert result["success"] is True
+        assert result["output"] == {
+            "visual_summary": "A product demo",
+            "transcript": "Welcome to the demo",
+            "frames_analyzed": 5,
+        }
+        assert seen_paths[0] == seen_paths[1]           # one scratch file for both branches
+        assert not os.path.exists(seen_paths[0])
+
+    async def test_key_frames_described_over_shared_http_pool(self):
+        import anthropic
+        from app.llm.http_client import get_shared_http_client
+        from app.tools.media.video_ops import VideoOps
+
+        response = MagicMock(content=[MagicMock(text="A product demo")])
+        with patch("app.tools.media.video_ops._sample_key_frames", return_value=["ZnJhbWU="]), \
+             patch("anthropic.AsyncAnthropic") as client_cls:
+            client_cls.return_value.messages.create = AsyncMock(return_value=response)
+            summary, frames = await VideoOps({})._describe_key_frames("/tmp/demo.mp4")
+
+        assert (summary, frames) == ("A product demo", 1)
+        assert client_cls.call_args.kwargs["http_client"] is get_shared_http_client(anthropic)
+
+
+class TestMediaTempfile:
+    """Media scratch files use /dev/shm only when they are small and fit."""
+
+    def _statvfs(self, free_bytes):
+        return MagicMock(f_bavail=free_bytes // 4096, f_frsize=4096)
+
+    def test_small_file_with_room_goes_to_shm(self, tmp_path):
+        import os
+        from app.tools.media import tmp_dir
+
+        with patch.object(tmp_dir, "MEDIA_TMP_DIR", str(tmp_path)), \
+             patch("os.statvfs", return_value=self._statvfs(60 * 1024 * 1024)):
+            with tmp_dir.media_tempfile(suffix=".wav", size=1024) as tmp:
+                path = tmp.name
+        os.unlink(path)
+        assert os.path.dirname(path) == str(tmp_path)
+
+    @pytest.mark.parametrize("size, free", [
+        (50 * 1024 * 1024, 60 * 1024 * 1024),   # upload larger than the tmpfs threshold
+        (4 * 1024 * 1024, 10 * 1024 * 1024),    # small, but /dev/shm nearly full
+        (None, 60 * 1024 * 1024),               # size unknown (derived outputs follow)
+    ])
+    def test_falls_back_to_default_temp_dir(self, tmp_path, size, free):
+        import os
+        import tempfile
+        from app.tools.media import tmp_dir
+
+        with patch.object(tmp_dir, "MEDIA_TMP_DIR", str(tmp_path)), \
+             patch("os.statvfs", return_value=self._statvfs(free)):
+            with tmp_dir.media_tempfile(suffix=".mp4", size=size) as tmp:
+                path = tmp.name
+        os.unlink(path)
+        assert os.path.dirname(path) == tempfile.gettempdir()
+
+
+# ── camera_handler tests ──────────────────────────────────────────────────────
+
+class TestCameraHandler:
+    """camera_handler shares the image_bytes contract with image_handler (no temp files)."""
+
+    async def test_camera_frame_passes_image_bytes_not_path(self):
+        import base64
+        from app.input.camera_handler import handle_camera_frame
+
+        frame_b64 = base64.b64encode(b"\xff\xd8\xff frame").decode()
+        mock_image_ops = AsyncMock()
+        mock_image_ops.execute = AsyncMock(return_value={"success": True, "output": "A desk"})
+
+        with patch("app.tools.media.image_ops.ImageOps", return_value=mock_image_ops):
+            result = await handle_camera_frame(frame_b64, {})
+
+        kwargs = mock_image_ops.execute.call_args.kwargs
+        assert "image_path" not in kwargs
+        assert kwargs["image_bytes"] == frame_b64
+        assert result == {"success": True, "description": "A desk"}
+
+    async def test_camera_frame_invalid_base64_rejected(self):
+        from app.input.camera_handler import handle_camera_frame
+
+        result = await handle_camera_frame("not base64!", {})
+
+        assert result["success"] is False
+
+
+# ── speech_handler tests ──────────────────────────────────────────────────────
+
+def _pcm_b64(seconds: float) -> str:
+    """Base64 of `seconds` of silent 16 kHz int16 PCM."""
+    import base64
+    return base64.b64encode(b"\x00\x00" * int(16000 * seconds)).decode()
+
+
+def _wav(pcm: bytes, sample_rate: int = 16000, channels: int = 1, bits: int = 16) -> bytes:
+    """Minimal RIFF/WAVE file around `pcm`."""
+    import struct
+    block = channels * bits // 8
+    fmt = struct.pack("<HHIIHH", 1, channels, sample_rate, sample_rate * block, block, bits)
+    return (
+        b"RIFF" + struct.pack("<I", 36 + len(pcm)) + b"WAVE"
+        + b"fmt " + struct.pack("<I", 16) + fmt
+        + b"data" + struct.pack("<I", len(pcm)) + pcm
+    )
+
+
+def _words(*items):
+    """transcribe_pcm result with (start, end, word) tuples relative to the buffer."""
+    return {
+        "success": True,
+        "output": {
+            "text": "".join(w for _, _, w in items).strip(),
+            "words": [{"start": s, "end": e, "word": w} for s, e, w in items],
+        },
+    }
+
+
+class TestSpeechSessionStreaming:
+    """SpeechSession commits words two consecutive hypotheses agree on (LocalAgreement-2)."""
+
+    async def test_partial_transcript_emitted_once_hypotheses_agree(self):
+        from app.input.speech_handler import SpeechSession
+
+        partials: list[str] = []
+
+        async def on_partial(text):
+            partials.append(text)
+
+        hypotheses = [
+            _words((0.0, 0.4, " Hello")),
+            _words((0.0, 0.4, " Hello"), (0.5, 0.9, " world")),
+        ]
+        mock_ops = MagicMock()
+        mock_ops.transcribe_pcm = AsyncMock(side_effect=hypotheses)
+
+        session = SpeechSession({}, on_partial=on_partial)
+        session.start()
+        with patch("app.tools.media.audio_ops.AudioOps", return_value=mock_ops):
+            session.add_chunk(_pcm_b64(1.0))
+            await session._update_task
+            assert partials == []           # first hypothesis is never committed
+            session.add_chunk(_pcm_b64(1.0))
+            await session._update_task
+
+        assert partials == ["Hello"]
+        assert session.confirmed_text == "Hello"
+
+    async def test_end_transcribes_only_the_tail(self):
+        from app.input.speech_handler import SpeechSession
+
+        mock_ops = MagicMock()
+        mock_ops.transcribe_pcm = AsyncMock(side_effect=[
+            _words((0.0, 0.4, " Book"), (0.5, 0.8, " a")),
+            _words((0.0, 0.4, " Book"), (0.5, 0.8, " a"), (0.9, 1.2, " room")),
+            # Tail pass: buffer was trimmed at 0.8 s; Whisper repeats " a" at the head
+            _words((0.0, 0.2, " a"), (0.1, 0.4, " room"), (0.5, 0.9, " tomorrow")),
+        ])
+
+        session = SpeechSession({})
+        session.start()
+        with patch("app.tools.media.audio_ops.AudioOps", return_value=mock_ops):
+            session.add_chunk(_pcm_b64(1.0))
+            await session._update_task
+            session.add_chunk(_pcm_b64(1.0))
+            await session._update_task
+            transcript = await session.end_and_transcribe()
+
+        assert transcript == "Book a room tomorrow"
+        assert not session.is_active
+
+    async def test_container_audio_skips_streaming_updates(self):
+        import base64
+        from app.input.speech_handler import SpeechSession
+
+        mock_ops = MagicMock()
+        mock_ops.transcribe_pcm = AsyncMock()
+
+        session = SpeechSession({})
+        session.start()
+        with patch("app.tools.media.audio_ops.AudioOps", return_value=mock_ops):
+            session.add_chunk(base64.b64encode(b"OggS" + b"\x00" * 64000).decode())
+
+        mock_ops.transcribe_pcm.assert_not_called()
+        assert session._update_task is None
+
+    async def test_container_audio_transcribed_from_bytes(self):
+        import base64
+        from app.input.speech_handler import SpeechSession
+
+        mock_ops = MagicMock()
+        mock_ops.execute = AsyncMock(return_value={
+            "success": True, "output": {"text": "Call me back", "language": "en"},
+        })
+
+        session = SpeechSession({})
+        session.start()
+        chunk = b"OggS" + b"\x00" * 64
+        with patch("app.tools.media.audio_ops.AudioOps", return_value=mock_ops):
+            session.add_chunk(base64.b64encode(chunk).decode())
+            transcript = await session.end_and_transcribe()
+
+        kwargs = mock_ops.execute.call_args.kwargs
+        assert kwargs["audio_bytes"] == chunk
+        assert kwargs["file_extension"] == "ogg"
+        assert transcript == "Call me back"
+
+    def test_wav_chunks_stripped_downmixed_and_resampled(self):
+        import base64
+        import numpy as np
+        from app.input.speech_handler import SpeechSession
+
+        # 0.5 s of 48 kHz stereo per chunk, each chunk carrying its own WAV header
+        frames = np.full((24000, 2), 1000, dtype="<i2").tobytes()
+        session = SpeechSession({})
+        session.start()
+        for _ in range(2):
+            session.add_chunk(base64.b64encode(_wav(frames, 48000, 2)).decode())
+
+        samples = session._buffered_samples()
+        assert session._format == "pcm"
+        assert abs(len(samples) - 16000) <= 1          # 1 s at 16 kHz mono
+        assert (samples == 1000).all()                 # no header bytes in the signal
+
+    def test_pcm_buffer_preallocated_and_compacted_in_place(self):
+        import base64
+        import numpy as np
+        from app.input import speech_handler
+        from app.input.speech_handler import SpeechSession
+
+        session = SpeechSession({})
+        session.start()
+        with patch.object(speech_handler, "_PCM_CAPACITY_SECONDS", 1):
+            session.add_chunk(base64.b64encode(np.arange(12000, dtype="<i2").tobytes()).decode())
+            buffer = session._pcm
+            session._trim_buffer(0.5)                   # drop the first 8000 samples
+            session.add_chunk(base64.b64encode(np.arange(12000, 20000, dtype="<i2").tobytes()).decode())
+
+            assert session._pcm is buffer               # slid to the front, not reallocated
+            assert (session._buffered_samples() == np.arange(8000, 20000)).all()
+
+            session.add_chunk(base64.b64encode(np.arange(20000, 30000, dtype="<i2").tobytes()).decode())
+            assert len(session._pcm) == 32000           # grown by doubling
+            assert (session._buffered_samples() == np.arange(8000, 30000)).all()
+
+        session.start()
+        assert len(session._buffered_samples()) == 0    # buffer kept for the next utterance
+
+    def test_non_16bit_wav_uses_container_fallback(self):
+        import base64
+        from app.input.speech_handler import SpeechSession
+
+        session = SpeechSession({})
+        session.start()
+        session.add_chunk(base64.b64encode(_wav(b"\x80" * 800, 8000, 1, bits=8)).decode())
+
+        assert session._format == "wav"
+        assert session._buffered_samples() is None
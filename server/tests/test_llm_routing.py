@@ -6,12 +6,14 @@ Tests cover:
   - LLMManager.select_provider() routes English content to Claude (default)
   - Failover: Claude timeout → Kimi picks up
   - Failover: Kimi timeout → Claude picks up
+  - Circuit breaker skips a backend that keeps failing (client 4xx errors don't count)
   - Token usage is tracked in llm_usage table
   - LLMManager singleton init() / get() pattern
   - AnthropicClient builds correct tool_call loop (≤5 iterations)
 """
 
 import uuid
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -32,8 +34,10 @@ class TestLLMProviderSelection:
              patch("app.llm.llm_manager.ToolExecutor"):
             mock_claude = MagicMock()
             mock_claude.model_name = "claude-sonnet-4-6"
+            mock_claude.supports_tool_streaming = False
             mock_kimi = MagicMock()
             mock_kimi.model_name = "moonshot-v1-128k"
+            mock_kimi.supports_tool_streaming = False
             mock_claude_cls.return_value = mock_claude
             mock_kimi_cls.return_value = mock_kimi
             manager = LLMManager(TEST_CONFIG)
@@ -81,6 +85,28 @@ class TestLLMProviderSelection:
         assert manager._contains_chinese("请生成报告") is True
         assert manager._contains_chinese("Generate report") is False
         assert manager._contains_chinese("") is False
+        assert manager._contains_chinese("Café résumé — “quoted”") is False
+
+    @pytest.mark.parametrize("message,department,expected", [
+        ("Research the Chinese Market for vouchers", "sales", True),
+        ("Expansion plan for APAC", "marketing", True),
+        ("Quarterly report", "Asia", True),
+        ("Quarterly report", "finance", False),
+    ])
+    def test_apac_market_task_routes_to_kimi(self, message, department, expected):
+        manager = self._get_manager()
+        selected = manager.select_model(message, {"department": department})
+        assert (selected is manager.kimi) is expected
+
+    @pytest.mark.parametrize("text", [
+        "レポート",               # Katakana
+        "ひらがな",               # Hiragana
+        "ﾚﾎﾟｰﾄ",                  # Halfwidth Katakana
+        "\U00020000 report",      # CJK Extension B
+    ])
+    def test_contains_chinese_detects_kana_and_extension_ideographs(self, text):
+        manager = self._get_manager()
+        assert manager._contains_chinese(text) is True
 
 
 # ── LLMManager singleton ──────────────────────────────────────────────────────
@@ -133,6 +159,7 @@ class TestLLMFailover:
 
         mock_claude = AsyncMock()
         mock_claude.model_name = "claude-sonnet-4-6"
+        mock_claude.supports_tool_streaming = False
         if claude_error:
             mock_claude.chat = AsyncMock(side_effect=claude_error)
         else:
@@ -140,6 +167,7 @@ class TestLLMFailover:
 
         mock_kimi = AsyncMock()
         mock_kimi.model_name = "moonshot-v1-128k"
+        mock_kimi.supports_tool_streaming = False
         if kimi_error:
             mock_kimi.chat = AsyncMock(side_effect=kimi_error)
         else:
@@ -198,6 +226,166 @@ class TestLLMFailover:
             )
 
 
+# ── Circuit breaker ───────────────────────────────────────────────────────────
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_half_opens_after_cooldown(self):
+        from app.llm.circuit_breaker import CircuitBreaker, CircuitOpen
+
+        breaker = CircuitBreaker("claude", failure_threshold=3, recovery_timeout=30.0)
+        with patch("app.llm.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+            breaker.record_success()          # success resets the consecutive count
+            for _ in range(3):
+                breaker.before_call()
+                breaker.record_failure()
+            assert breaker.is_open()
+            with pytest.raises(CircuitOpen):
+                breaker.before_call()
+
+        with patch("app.llm.circuit_breaker.time.monotonic", return_value=131.0):
+            breaker.before_call()             # one trial call is let through
+            with pytest.raises(CircuitOpen):
+                breaker.before_call()         # ...but only one
+            breaker.record_success()
+            assert breaker.state == "closed"
+
+    async def test_open_claude_breaker_skips_straight_to_kimi(self):
+        manager = TestLLMFailover()._make_manager(
+            claude_error=TimeoutError("Claude timed out"),
+            kimi_response={"content": "Kimi ok"},
+        )
+        messages = [{"role": "user", "content": "Generate a report"}]
+
+        for _ in range(manager._claude_breaker.failure_threshold):
+            await manager.chat(messages=messages)
+        assert manager.claude.chat.await_count == manager._claude_breaker.failure_threshold
+
+        # Breaker is open: routed to Kimi without another Claude attempt
+        assert manager.select_model("Generate a report") is manager.kimi
+        result = await manager.chat(messages=messages)
+        assert result == {"content": "Kimi ok"}
+        assert manager.claude.chat.await_count == manager._claude_breaker.failure_threshold
+
+
+    async def test_client_errors_do_not_trip_breaker(self):
+        class StatusError(Exception):
+            def __init__(self, status_code):
+                super().__init__(f"HTTP {status_code}")
+                self.status_code = status_code
+
+        manager = TestLLMFailover()._make_manager(claude_error=StatusError(400))
+        breaker = manager._claude_breaker
+        messages = [{"role": "user", "content": "Generate a report"}]
+
+        for _ in range(breaker.failure_threshold + 1):
+            with pytest.raises(StatusError):
+                await manager._guarded_chat(manager.claude, messages)
+        assert breaker.state == "closed"
+
+        manager.claude.chat.side_effect = StatusError(503)
+        for _ in range(breaker.failure_threshold):
+            with pytest.raises(StatusError):
+                await manager._guarded_chat(manager.claude, messages)
+        assert breaker.state == "open"
+
+
+class TestResponseCache:
+    def _redis(self):
+        store: dict = {}
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=lambda key: store.get(key))
+        redis.setex = AsyncMock(side_effect=lambda key, ttl, value: store.__setitem__(key, value))
+        return redis, store
+
+    async def test_cacheable_chat_served_from_redis_on_repeat(self):
+        manager = TestLLMFailover()._make_manager(claude_response={"content": "Every Monday"})
+        redis, store = self._redis()
+        messages = [{"role": "user", "content": "Explain '0 1 * * 1'"}]
+
+        with patch("app.core.redis_client.get_redis", return_value=redis):
+            first = await manager.chat(messages=messages, task_context={"cacheable": True})
+            second = await manager.chat(messages=messages, task_context={"cacheable": True})
+
+        assert first == second == {"content": "Every Monday"}
+        manager.claude.chat.assert_awaited_once()
+        assert len(store) == 1 and next(iter(store)).startswith("llm:resp:")
+
+    async def test_cache_entries_scoped_to_user_unless_shared(self):
+        manager = TestLLMFailover()._make_manager(claude_response={"content": "Your pipeline"})
+        redis, store = self._redis()
+        messages = [{"role": "user", "content": "Summarise my pipeline"}]
+
+        with patch("app.core.redis_client.get_redis", return_value=redis):
+            for user_id in ("u1", "u2"):
+                await manager.chat(messages=messages, task_context={"cacheable": True, "user_id": user_id})
+            assert manager.claude.chat.await_count == 2      # no cross-user hit
+
+            for user_id in ("u1", "u2"):
+                await manager.chat(
+                    messages=messages,
+                    task_context={"cacheable": True, "cache_shared": True, "user_id": user_id},
+                )
+            assert manager.claude.chat.await_count == 3      # shared entry reused
+
+        assert len(store) == 3
+
+    async def test_chat_without_opt_in_skips_cache(self):
+        manager = TestLLMFailover()._make_manager()
+        redis, store = self._redis()
+
+        with patch("app.core.redis_client.get_redis", return_value=redis):
+            for _ in range(2):
+                await manager.chat(messages=[{"role": "user", "content": "hi"}], task_context={})
+
+        assert manager.claude.chat.await_count == 2
+        redis.get.assert_not_called()
+        assert store == {}
+
+
+class TestToolLoopFailover:
+    async def test_tool_loop_stays_on_fallback_after_failover(self):
+        manager = TestLLMFailover()._make_manager(claude_error=TimeoutError("Claude timed out"))
+        manager.kimi.chat = AsyncMock(side_effect=[
+            {"content": "", "tool_calls": [{"id": "c1", "name": "search", "arguments": {}}], "usage": {}},
+            {"content": "done", "tool_calls": None, "usage": {}},
+        ])
+        manager.tool_executor.get_definitions = MagicMock(return_value=[])
+        manager.tool_executor.execute = AsyncMock(return_value={"success": True, "output": "ok"})
+        manager._track_usage = MagicMock()
+
+        result = await manager.execute_with_tools({"message": "Find it", "user_id": "u1"})
+
+        assert result["success"] is True
+        assert result["usage"]["model"] == "moonshot-v1-128k"
+        assert manager.claude.chat.await_count == 1   # not retried on the second iteration
+
+
+class TestLLMBulkhead:
+    async def test_in_flight_calls_capped_per_backend(self):
+        import asyncio
+
+        manager = TestLLMFailover()._make_manager()
+        manager._concurrency["claude"] = 2
+        in_flight = peak = 0
+
+        async def slow_chat(messages, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"content": "ok"}
+
+        manager.claude.chat = slow_chat
+        await asyncio.gather(*(
+            manager.chat(messages=[{"role": "user", "content": "Generate a report"}])
+            for _ in range(6)
+        ))
+
+        assert peak == 2
+
+
 # ── LLMManager tool loop ──────────────────────────────────────────────────────
 
 class TestToolLoop:
@@ -231,8 +419,10 @@ class TestToolLoop:
             mock_claude = AsyncMock()
             mock_claude.model_name = "claude-sonnet-4-6"
             mock_claude.chat = AsyncMock(side_effect=mock_chat)
+            mock_claude.supports_tool_streaming = False
             mock_kimi = AsyncMock()
             mock_kimi.model_name = "moonshot-v1-128k"
+            mock_kimi.supports_tool_streaming = False
             mock_executor_cls.return_value = mock_tool_executor
             mock_claude_cls.return_value = mock_claude
             mock_kimi_cls.return_value = mock_kimi
@@ -383,3 +573,543 @@ class TestSystemPromptFileAttachment:
         }
         prompt = manager._build_system_prompt(task)
         assert "ATTACHED DOCUMENT" not in prompt
+
+
+    def test_static_prompt_cached_per_department_role_source(self):
+        """Only the session lines (date, time, user ID) are rebuilt per call."""
+        from app.llm import llm_manager
+
+        manager = self._make_manager()
+        llm_manager._static_system_prompt.cache_clear()
+        task = {"department": "sales", "role": "sales_rep", "source": "mobile"}
+        first = manager._build_system_prompt({**task, "user_id": "u1"})
+        second = manager._build_system_prompt({**task, "user_id": "u2"})
+
+        info = llm_manager._static_system_prompt.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert "Current user ID: u1\n(Use this exact value" in first
+        assert "Current user ID: u2" in second
+        assert "Department context: sales\nUser role: sales_rep\nTask source: mobile\n" in second
+
+    def test_system_blocks_put_cacheable_static_text_first(self):
+        """Static template (and brand guidelines) carry cache_control; session lines come last."""
+        manager = self._make_manager()
+        blocks = manager._build_system_blocks({
+            "department": "sales", "role": "sales_rep", "source": "mobile",
+            "user_id": "u1", "message": "Draft a PDF proposal",
+        })
+
+        assert [b.get("cache_control") for b in blocks] == [{"type": "ephemeral"}] * 2 + [None]
+        assert "Brand Guidelines" in blocks[1]["text"]
+        assert "Current user ID: u1" in blocks[-1]["text"]
+        assert "Current date" not in blocks[0]["text"]
+
+    async def test_claude_gets_blocks_and_kimi_gets_flat_string(self):
+        manager = self._make_manager()
+        manager.claude.chat = AsyncMock(side_effect=RuntimeError("overloaded"))
+        manager.kimi.chat = AsyncMock(return_value={"content": "ok"})
+        task = {"department": "sales", "role": "sales_rep", "source": "mobile"}
+
+        await manager.chat([{"role": "user", "content": "Hello"}], task_context=task)
+
+        claude_system = manager.claude.chat.call_args.kwargs["system"]
+        kimi_system = manager.kimi.chat.call_args.kwargs["system"]
+        assert isinstance(claude_system, list)
+        assert kimi_system == "".join(b["text"] for b in claude_system)
+
+# ── Stream coalescing ─────────────────────────────────────────────────────────
+
+async def _deltas(*items):
+    """Async source of (text, delay_before_s) token deltas."""
+    import asyncio
+    for text, delay in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield text
+
+
+class TestStreamCoalescing:
+    async def test_burst_of_tokens_flushed_at_char_limit(self):
+        from app.llm.streaming import coalesce_deltas
+
+        chunks = [c async for c in coalesce_deltas(_deltas(*[("ab", 0)] * 64))]
+
+        assert "".join(chunks) == "ab" * 64
+        assert len(chunks) == 2
+        assert all(len(c) == 64 for c in chunks)
+
+    async def test_idle_stream_flushes_after_deadline(self):
+        from app.llm.streaming import coalesce_deltas
+
+        chunks = [
+            c async for c in coalesce_deltas(
+                _deltas(("Hello", 0), (" world", 0.1), ("!", 0)), max_delay=0.02
+            )
+        ]
+
+        assert chunks == ["Hello", " world!"]
+
+    async def test_buffered_text_delivered_before_error(self):
+        from app.llm.streaming import coalesce_deltas
+
+        async def failing():
+            yield "partial"
+            raise RuntimeError("stream dropped")
+
+        received = []
+        with pytest.raises(RuntimeError):
+            async for chunk in coalesce_deltas(failing()):
+                received.append(chunk)
+
+        assert received == ["partial"]
+
+
+class TestToolDefinitionSubsets:
+    def _executor(self):
+        from app.tools.tool_executor import ToolExecutor
+
+        executor = ToolExecutor(TEST_CONFIG)
+        executor._definitions = [{"name": n, "description": "", "parameters": {}} for n in "abc"]
+        executor._loaded = True
+        return executor
+
+    def test_subset_is_built_once_and_keeps_registry_order(self):
+        executor = self._executor()
+
+        first = executor.get_definitions(["c", "a"])
+        assert [t["name"] for t in first] == ["a", "c"]
+        assert executor.get_definitions(("a", "c")) is first
+
+    def test_no_names_returns_full_list(self):
+        executor = self._executor()
+        assert executor.get_definitions(None) is executor.get_all_definitions()
+        assert executor.get_definitions([]) is executor.get_all_definitions()
+
+
+class TestToolArgumentValidation:
+    async def test_invalid_arguments_rejected_before_dispatch(self):
+        pytest.importorskip("fastjsonschema")
+        from app.tools.tool_executor import ToolExecutor
+
+        executor = ToolExecutor(TEST_CONFIG)
+        ops = MagicMock()
+        ops.execute = AsyncMock(return_value={"success": True, "output": "sent"})
+        executor._registry["send"] = ops
+        executor._compile_validator("send", {
+            "type": "object",
+            "properties": {"to": {"type": "string"}},
+            "required": ["to"],
+        })
+        executor._loaded = True
+
+        bad = await executor.execute("send", to=42)
+        assert bad["success"] is False
+        assert "Invalid arguments for 'send'" in bad["error"]
+        ops.execute.assert_not_called()
+
+        assert await executor.execute("send", to="a@b.co") == {"success": True, "output": "sent"}
+
+
+# ── Tool definition formatting cache ──────────────────────────────────────────
+
+class TestToolFormatCache:
+    _TOOLS = [
+        {"name": "get_weather", "description": "Weather", "parameters": {"type": "object"}},
+        {"type": "web_search_20250305", "name": "web_search"},
+    ]
+
+    def test_anthropic_format_reused_for_same_list(self):
+        from app.llm.anthropic_client import AnthropicClient
+
+        client = AnthropicClient(TEST_CONFIG)
+        tools = list(self._TOOLS)
+        first = client._format_tools(tools)
+
+        assert client._format_tools(tools) is first
+        assert first[0]["input_schema"] == {"type": "object"}
+        assert first[1] is tools[1]
+
+    def test_kimi_format_rebuilt_when_list_changes(self):
+        from app.llm.kimi_client import KimiClient
+
+        client = KimiClient(TEST_CONFIG)
+        tools = list(self._TOOLS[:1])
+        first = client._format_tools(tools)
+        tools.append({"name": "send_email", "description": "Email", "parameters": {}})
+        second = client._format_tools(tools)
+
+        assert second is not first
+        assert [t["function"]["name"] for t in second] == ["get_weather", "send_email"]
+        assert client._format_tools(list(tools)) is not second   # equal but distinct list
+
+
+# ── Tool result serialisation ─────────────────────────────────────────────────
+
+class TestToolResultJSON:
+    _OUTPUT = {"rows": [{"id": 1, "amount": Decimal("9.50")}], "city": "香港"}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dict_output_serialised_identically_by_both_backends(self, use_orjson):
+        from app.llm import json_codec
+        from app.llm.kimi_client import KimiClient
+
+        client = KimiClient(TEST_CONFIG)
+        backend = json_codec.orjson if use_orjson else None
+        with patch.object(json_codec, "orjson", backend):
+            msg = client._build_tool_result_message("call_1", "query_db", {
+                "success": True, "output": self._OUTPUT,
+            })
+
+        assert msg["content"] == '{"rows":[{"id":1,"amount":"9.50"}],"city":"香港"}'
+
+    def test_anthropic_tool_result_uses_same_encoding(self):
+        from app.llm.anthropic_client import AnthropicClient
+
+        client = AnthropicClient(TEST_CONFIG)
+        msg = client._build_tool_result_message("toolu_1", "query_db", {
+            "success": True, "output": self._OUTPUT,
+        })
+
+        assert '"city":"香港"' in str(msg["content"])
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_indented_output_identical_by_both_backends(self, use_orjson):
+        from app.llm import json_codec
+
+        backend = json_codec.orjson if use_orjson else None
+        with patch.object(json_codec, "orjson", backend):
+            text = json_codec.dumps(self._OUTPUT, indent=True)
+
+        assert text == (
+            '{\n  "rows": [\n    {\n      "id": 1,\n      "amount": "9.50"\n    }\n  ],\n'
+            '  "city": "香港"\n}'
+        )
+
+
+class TestKimiMessagePrelude:
+    async def test_system_prompt_prepended_without_mutating_history(self):
+        from app.llm.kimi_client import KimiClient
+
+        client = KimiClient(TEST_CONFIG)
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="ok", tool_calls=None), finish_reason="stop")]
+        client._client = MagicMock()
+        client._client.chat.completions.create = AsyncMock(return_value=response)
+
+        history = [{"role": "user", "content": "hi"}]
+        await client.chat(history, tools=[{"name": "t", "description": "d"}], system="Be brief")
+        await client.chat(history, tools=[{"name": "t", "description": "d"}])
+
+        first, second = client._client.chat.completions.create.call_args_list
+        assert first.kwargs["messages"] == [
+            {"role": "system", "content": "Be brief"}, {"role": "user", "content": "hi"},
+        ]
+        assert second.kwargs["messages"] is history
+        assert history == [{"role": "user", "content": "hi"}]
+
+
+class TestAnthropicParseResponse:
+    def test_text_blocks_around_tool_use_joined_in_order(self):
+        from app.llm.anthropic_client import AnthropicClient
+
+        blocks = [
+            MagicMock(type="text", text="Checking "),
+            MagicMock(type="tool_use", id="toolu_1", input={"q": "x"}),
+            MagicMock(type="text", text="the calendar."),
+        ]
+        blocks[1].name = "list_events"
+        response = MagicMock(content=blocks, stop_reason="tool_use", model="claude-test")
+        response.usage.input_tokens, response.usage.output_tokens = 10, 5
+
+        parsed = AnthropicClient(TEST_CONFIG)._parse_response(response)
+
+        assert parsed["content"] == "Checking the calendar."
+        assert parsed["tool_calls"] == [{"id": "toolu_1", "name": "list_events", "arguments": {"q": "x"}}]
+
+
+class TestStreamedToolCalls:
+    def _stream(self, events, final=None, error=None):
+        """Stand-in for AsyncAnthropic.messages.stream(): yields events, then final or error."""
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def __aiter__(self):
+                for event in events:
+                    yield event
+                if error is not None:
+                    raise error
+
+            async def get_final_message(self):
+                return final
+
+        return MagicMock(return_value=Stream())
+
+    def _tool_block_stop(self, tool_id, name, args):
+        block = MagicMock(type="tool_use", id=tool_id, input=args)
+        block.name = name
+        return MagicMock(type="content_block_stop", content_block=block)
+
+    async def test_tool_use_yielded_before_final_response(self):
+        from app.llm.anthropic_client import AnthropicClient
+
+        block = self._tool_block_stop("toolu_1", "search", {"q": "x"}).content_block
+        final = MagicMock(content=[block], stop_reason="tool_use", model="claude-test")
+        final.usage.input_tokens, final.usage.output_tokens = 10, 5
+        client = AnthropicClient(TEST_CONFIG)
+        client._client = MagicMock()
+        client._client.messages.stream = self._stream(
+            [MagicMock(type="text"), self._tool_block_stop("toolu_1", "search", {"q": "x"})], final
+        )
+
+        events = [e async for e in client.stream_with_tools([{"role": "user", "content": "hi"}])]
+
+        assert events[0] == ("tool_use", {"id": "toolu_1", "name": "search", "arguments": {"q": "x"}})
+        assert events[1][0] == "response"
+        assert events[1][1]["tool_calls"] == [events[0][1]]
+
+    async def test_stream_failure_after_tool_use_is_not_replayed(self):
+        from app.llm.anthropic_client import AnthropicClient
+
+        start = MagicMock(type="message_start")
+        start.message.usage.input_tokens, start.message.usage.output_tokens = 120, 1
+        text = MagicMock(type="content_block_delta")
+        text.delta.type, text.delta.text = "text_delta", "Sending it now."
+        delta = MagicMock(type="message_delta")
+        delta.usage.output_tokens = 40
+
+        client = AnthropicClient(TEST_CONFIG)
+        client._client = MagicMock()
+        client._client.messages.stream = self._stream(
+            [start, text, self._tool_block_stop("toolu_1", "send_email", {}), delta],
+            error=ConnectionError("reset"),
+        )
+        client.chat = AsyncMock()
+
+        events = [e async for e in client.stream_with_tools([{"role": "user", "content": "hi"}])]
+
+        client.chat.assert_not_called()
+        response = events[-1][1]
+        assert response["tool_calls"] == [{"id": "toolu_1", "name": "send_email", "arguments": {}}]
+        assert response["content"] == "Sending it now."
+        assert response["usage"] == {"input_tokens": 120, "output_tokens": 40}
+
+    async def test_tool_loop_starts_tools_while_turn_streams(self):
+        import asyncio
+
+        manager = TestLLMProviderSelection()._get_manager()
+        manager.tool_executor.get_definitions = MagicMock(return_value=[])
+        manager._track_usage = MagicMock()
+        tool_started = asyncio.Event()
+
+        async def execute(name, **kwargs):
+            tool_started.set()
+            return {"success": True, "output": "ok"}
+
+        turns = iter([
+            [("tool_use", {"id": "t1", "name": "search", "arguments": {}})],
+            [],
+        ])
+
+        async def stream_with_tools(messages, **kwargs):
+            tool_calls = []
+            for event in next(turns):
+                tool_calls.append(event[1])
+                yield event
+            if tool_calls:
+                # The tool is already running before the turn has finished
+                await asyncio.wait_for(tool_started.wait(), 1)
+            yield "response", {"content": "done", "tool_calls": tool_calls or None, "usage": {}}
+
+        manager.claude.supports_tool_streaming = True
+        manager.claude.stream_with_tools = stream_with_tools
+        manager.tool_executor.execute = AsyncMock(side_effect=execute)
+
+        result = await manager.execute_with_tools({"message": "Find it", "user_id": "u1"})
+
+        assert result["success"] is True
+        assert result["tools_called"] == ["search"]
+        manager.tool_executor.execute.assert_awaited_once_with("search")
+
+
+class TestToolExchangeHistory:
+    def test_tool_results_with_db_values_serialised_for_both_formats(self):
+        manager = TestLLMProviderSelection()._get_manager()
+        tool_calls = [{"id": "call_1", "name": "query_db", "arguments": {"limit": 5}}]
+        tool_results = [(tool_calls[0], {"success": True, "output": {"total": Decimal("12.30")}})]
+
+        claude_history: list[dict] = []
+        kimi_history: list[dict] = []
+        manager._append_tool_exchange(manager.claude, claude_history, tool_calls, tool_results)
+        manager._append_tool_exchange(manager.kimi, kimi_history, tool_calls, tool_results)
+
+        assert claude_history[1]["content"][0]["content"] == '{"total":"12.30"}'
+        assert kimi_history[0]["tool_calls"][0]["function"]["arguments"] == '{"limit":5}'
+        assert kimi_history[1]["content"] == '{"total":"12.30"}'
+
+    def test_exchange_shapes_for_a_multi_tool_turn(self):
+        from app.llm.llm_manager import _claude_exchange, _openai_exchange
+
+        tool_calls = [
+            {"id": "t1", "name": "a", "arguments": {}},
+            {"id": "t2", "name": "b", "arguments": {"x": 1}},
+        ]
+        tool_results = [
+            (tool_calls[0], {"success": True, "output": "done"}),
+            (tool_calls[1], {"success": False, "error": "boom"}),
+        ]
+
+        assistant, results = _claude_exchange(tool_calls, tool_results)
+        assert assistant == {"role": "assistant", "content": [
+            {"type": "tool_use", "id": "t1", "name": "a", "input": {}},
+            {"type": "tool_use", "id": "t2", "name": "b", "input": {"x": 1}},
+        ]}
+        assert results == {"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": "t1", "content": "done"},
+            {"type": "tool_result", "tool_use_id": "t2", "content": "boom"},
+        ]}
+
+        messages = _openai_exchange(tool_calls, tool_results)
+        assert [m["role"] for m in messages] == ["assistant", "tool", "tool"]
+        assert messages[2] == {"role": "tool", "tool_call_id": "t2", "name": "b", "content": "boom"}
+
+
+
+class TestToolCallConcurrency:
+    async def test_tool_calls_from_one_turn_run_concurrently(self):
+        import asyncio
+
+        manager = TestLLMProviderSelection()._get_manager()
+        manager.tool_executor.get_definitions = MagicMock(return_value=[])
+        manager._track_usage = MagicMock()
+        manager.claude.chat = AsyncMock(side_effect=[
+            {
+                "tool_calls": [
+                    {"id": "t1", "name": "search_web", "arguments": {"q": "a"}},
+                    {"id": "t2", "name": "query_crm", "arguments": {"q": "b"}},
+                ],
+                "usage": {},
+            },
+            {"content": "Done", "tool_calls": [], "usage": {}},
+        ])
+
+        both_started = asyncio.Event()
+        running = 0
+
+        async def execute(name, **kwargs):
+            nonlocal running
+            running += 1
+            if running == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return {"success": True, "output": name}
+
+        manager.tool_executor.execute = execute
+        result = await manager.execute_with_tools({"message": "compare", "user_id": "u1"})
+
+        assert result["success"] is True
+        assert result["tools_called"] == ["search_web", "query_crm"]
+
+    async def test_tool_loop_leaves_task_messages_untouched(self):
+        manager = TestLLMProviderSelection()._get_manager()
+        manager.tool_executor.get_definitions = MagicMock(return_value=[])
+        manager._track_usage = MagicMock()
+        manager.claude.chat = AsyncMock(side_effect=[
+            {"tool_calls": [{"id": "t1", "name": "search_web", "arguments": {}}], "usage": {}},
+            {"content": "Done", "tool_calls": [], "usage": {}},
+        ])
+        manager.tool_executor.execute = AsyncMock(return_value={"success": True, "output": "x"})
+        messages = [{"role": "user", "content": "earlier"}]
+
+        await manager.execute_with_tools({"message": "search", "messages": messages})
+
+        assert messages == [{"role": "user", "content": "earlier"}]
+        # Same list grown in place across iterations: user, assistant tool_use, tool_result
+        second_call_history = manager.claude.chat.call_args_list[1].args[0]
+        assert second_call_history is manager.claude.chat.call_args_list[0].args[0]
+        assert len(second_call_history) == 4
+
+    async def test_failed_tool_still_returns_sibling_artifacts(self):
+        manager = TestLLMProviderSelection()._get_manager()
+        manager.tool_executor.get_definitions = MagicMock(return_value=[])
+        manager.claude.chat = AsyncMock(return_value={
+            "tool_calls": [
+                {"id": "t1", "name": "create_pdf", "arguments": {}},
+                {"id": "t2", "name": "send_email", "arguments": {}},
+            ],
+            "usage": {},
+        })
+
+        async def execute(name, **kwargs):
+            if name == "send_email":
+                raise RuntimeError("SMTP down")
+            return {"success": True, "output": {"file_path": "/tmp/r.pdf", "filename": "r.pdf"}}
+
+        manager.tool_executor.execute = execute
+        result = await manager.execute_with_tools({"message": "report", "user_id": "u1"})
+
+        assert result["success"] is False
+        assert "send_email" in result["content"]
+        assert [a["name"] for a in result["artifacts"]] == ["r.pdf"]
+
+
+class TestUsageBatching:
+    async def test_usage_rows_written_in_one_batched_insert(self):
+        import asyncio
+        from app.llm import llm_manager
+
+        manager = TestLLMProviderSelection()._get_manager()
+        session = MagicMock()
+        session.execute = AsyncMock()
+        session.commit = AsyncMock()
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+
+        # AsyncSessionLocal is imported lazily inside flush_usage — patch at source
+        with patch("app.core.database.AsyncSessionLocal", return_value=session_cm), \
+             patch.object(llm_manager, "_USAGE_FLUSH_SECONDS", 0.01):
+            manager._track_usage("claude-sonnet-4-6", "sales", "u1", 10, 5)
+            manager._track_usage("moonshot-v1-128k", "finance", "u2", 20, 7, session_id="s2")
+            session.execute.assert_not_called()     # nothing written per call
+            await asyncio.wait_for(manager._usage_flush, timeout=1)
+
+        session.execute.assert_awaited_once()
+        rows = session.execute.call_args.args[1]
+        assert [r["user_id"] for r in rows] == ["u1", "u2"]
+        assert rows[1]["session_id"] == "s2"
+        assert manager._usage_rows == []
+
+    async def test_pending_usage_flushed_when_timer_cancelled(self):
+        import asyncio
+
+        manager = TestLLMProviderSelection()._get_manager()
+        manager.flush_usage = AsyncMock()
+        manager._track_usage("claude-sonnet-4-6", "sales", "u1", 10, 5)
+        await asyncio.sleep(0)
+
+        manager._usage_flush.cancel()           # e.g. stop_worker_loop() on worker exit
+        with pytest.raises(asyncio.CancelledError):
+            await manager._usage_flush
+
+        manager.flush_usage.assert_awaited_once()
+
+    async def test_flush_task_held_until_done_and_failure_logged(self):
+        import asyncio
+        from app.llm import llm_manager
+
+        manager = TestLLMProviderSelection()._get_manager()
+        manager.flush_usage = AsyncMock(side_effect=RuntimeError("db gone"))
+
+        with patch.object(llm_manager, "_USAGE_FLUSH_ROWS", 1), \
+             patch.object(llm_manager.logger, "warning") as warning:
+            manager._track_usage("claude-sonnet-4-6", "sales", "u1", 10, 5)
+            (task,) = manager._usage_tasks
+            await asyncio.gather(task, return_exceptions=True)
+            await asyncio.sleep(0)              # let the done-callback run
+
+        assert manager._usage_tasks == set()
+        assert "db gone" in warning.call_args.args[0]
@@ -57,3 +57,121 @@ class TestOutlookOpsTools:
         assert "outlook_create_event" in tool_names
         assert "outlook_get_events" in tool_names
         assert "outlook_find_free_slots" in tool_names
+
+
+class TestGraphClientReuse:
+    """_get_graph_client shares one authenticated client per event loop."""
+
+    async def test_client_reused_on_same_loop(self):
+        from unittest.mock import MagicMock, patch
+        from app.tools.communication.outlook_ops import _get_graph_client
+
+        config = {"ms365": {"tenant_id": "t", "client_id": "c", "client_secret": "s"}}
+        with patch("azure.identity.aio.ClientSecretCredential") as cred, \
+                patch("msgraph.GraphServiceClient", side_effect=lambda **kw: MagicMock()):
+            first = _get_graph_client(config)
+            assert _get_graph_client(config) is first
+            other = _get_graph_client({"ms365": {**config["ms365"], "client_id": "c2"}})
+
+        assert other is not first
+        assert cred.call_count == 2
+
+
+class TestBatchSend:
+    """send_messages batches sendMail calls and retries throttled ones."""
+
+    async def test_throttled_messages_rebatched_after_retry_after(self):
+        from unittest.mock import AsyncMock, patch
+        from app.tools.communication.outlook_ops import OutlookOps
+
+        ops = OutlookOps(config={})
+        messages = [{"to": [f"u{i}@example.com"], "subject": "Hi", "body_html": "<p>x</p>"} for i in range(3)]
+        ops._post_batch = AsyncMock(side_effect=[
+            {0: (202, None, None), 1: (429, None, 7.0), 2: (400, "Bad address", None)},
+            {1: (202, None, None)},
+        ])
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            results = await ops.send_messages(messages)
+
+        assert [r["success"] for r in results] == [True, True, False]
+        assert "Bad address" in results[2]["error"]
+        assert [i for i, _ in ops._post_batch.await_args_list[1].args[1]] == [1]
+        sleep.assert_awaited_once_with(7.0)
+
+    async def test_batch_not_sent_falls_back_to_single_sends(self):
+        from unittest.mock import AsyncMock
+        from app.tools.communication.outlook_ops import OutlookOps, _BatchNotSent
+
+        ops = OutlookOps(config={})
+        ops._post_batch = AsyncMock(side_effect=_BatchNotSent("could not connect"))
+        ops._send_email = AsyncMock(return_value={"success": True, "output": {}})
+
+        results = await ops.send_messages([{"to": ["a@example.com"], "subject": "s", "body_html": "b"}] * 2)
+
+        assert all(r["success"] for r in results)
+        assert ops._send_email.await_count == 2
+
+    async def test_unknown_batch_outcome_is_not_resent(self):
+        import httpx
+        from unittest.mock import AsyncMock
+        from app.tools.communication.outlook_ops import OutlookOps
+
+        ops = OutlookOps(config={})
+        ops._post_batch = AsyncMock(side_effect=httpx.ReadTimeout("read timed out"))
+        ops._send_email = AsyncMock()
+
+        results = await ops.send_messages([{"to": ["a@example.com"], "subject": "s", "body_html": "b"}] * 2)
+
+        assert not any(r["success"] for r in results)
+        assert "Delivery unknown" in results[0]["error"]
+        ops._send_email.assert_not_awaited()
+
+    @pytest.mark.parametrize("outcome, not_sent", [
+        ("connect", True),
+        ("read_timeout", False),
+        (401, True),
+        (503, False),
+    ])
+    async def test_post_batch_classifies_failures(self, outcome, not_sent):
+        import httpx
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from app.tools.communication.outlook_ops import OutlookOps, _BatchNotSent
+
+        request = httpx.Request("POST", "https://graph.microsoft.com/v1.0/$batch")
+        http = MagicMock()
+        if outcome == "connect":
+            http.post = AsyncMock(side_effect=httpx.ConnectError("refused", request=request))
+        elif outcome == "read_timeout":
+            http.post = AsyncMock(side_effect=httpx.ReadTimeout("timed out", request=request))
+        else:
+            http.post = AsyncMock(return_value=httpx.Response(outcome, request=request))
+        credential = MagicMock(get_token=AsyncMock(return_value=MagicMock(token="t")))
+
+        ops = OutlookOps(config={})
+        with patch("app.tools.communication.outlook_ops._get_graph_credential", return_value=credential):
+            with pytest.raises(Exception) as exc_info:
+                await ops._post_batch(http, [(0, {"to": ["a@example.com"], "subject": "s", "body_html": "b"})])
+
+        assert isinstance(exc_info.value, _BatchNotSent) is not_sent
+
+    async def test_batch_http_client_reused_on_same_loop(self):
+        from app.tools.communication.outlook_ops import _get_batch_http_client
+
+        first = _get_batch_http_client()
+        assert _get_batch_http_client() is first
+        await first.aclose()
+        assert _get_batch_http_client() is not first
+
+    async def test_close_batch_http_clients(self):
+        from app.tools.communication.outlook_ops import (
+            _get_batch_http_client,
+            close_batch_http_clients,
+        )
+
+        client = _get_batch_http_client()
+        await close_batch_http_clients()
+
+        assert client.is_closed
+        assert _get_batch_http_client() is not client
+        await close_batch_http_clients()
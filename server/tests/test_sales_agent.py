@@ -143,3 +143,301 @@ class TestSalesAgentOtherRouting:
             await agent.execute(_make_task("what is our Q1 revenue target?"))
 
         mock_general.assert_called_once()
+
+
+# ── EmailOutreachSkill templates ──────────────────────────────────────────────
+
+class TestEmailOutreachTemplates:
+    def _skill(self, kb_dir):
+        from app.skills.available.email_outreach import EmailOutreachSkill
+
+        with patch("app.tools.communication.outlook_ops.OutlookOps"):
+            return EmailOutreachSkill({"tools": {"knowledge_base": {"directory": str(kb_dir)}}})
+
+    async def test_builtin_template_escapes_inputs(self, tmp_path):
+        skill = self._skill(tmp_path)
+
+        result = await skill.compose_email(
+            template="proposal",
+            recipient_name="Ann",
+            recipient_email="ann@example.com",
+            company_name="<script>x</script>",
+        )
+
+        out = result["output"]
+        assert "&lt;script&gt;" in out["body_html"] and "<script>" not in out["body_html"]
+        assert out["subject"] == "Mezzofy Proposal for <script>x</script>"
+
+    async def test_file_template_reparsed_only_when_modified(self, tmp_path):
+        import os
+
+        emails = tmp_path / "templates" / "emails"
+        emails.mkdir(parents=True)
+        path = emails / "intro.html"
+        path.write_text("<p>Hi {{ recipient_name }}</p>")
+        skill = self._skill(tmp_path)
+
+        first = skill._get_template("intro")
+        assert skill._get_template("intro") is first
+
+        path.write_text("<p>Hello {{ recipient_name }}</p>")
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 5))
+        assert skill._get_template("intro").render(recipient_name="Bo") == "<p>Hello Bo</p>"
+
+    async def test_rate_limit_bucket_refills_and_refunds_failed_sends(self, tmp_path):
+        skill = self._skill(tmp_path)
+        skill._outlook.execute = AsyncMock(return_value={"success": True})
+
+        for _ in range(30):
+            assert (await skill.send_email("a@example.com", "s", "b"))["success"]
+        blocked = await skill.send_email("a@example.com", "s", "b")
+        assert "rate limit" in blocked["error"]
+
+        skill._last_refill -= 120  # two minutes later → one token back
+        skill._outlook.execute = AsyncMock(return_value={"success": False, "error": "throttled"})
+        await skill.send_email("a@example.com", "s", "b")
+        assert skill._tokens >= 1.0
+
+    async def test_send_batch_grants_remaining_tokens_and_refunds_failures(self, tmp_path):
+        skill = self._skill(tmp_path)
+        skill._tokens = 3.0
+        skill._outlook.send_messages = AsyncMock(return_value=[
+            {"success": True, "output": {}}, {"success": False, "error": "Bad address"}, {"success": True, "output": {}},
+        ])
+
+        results = await skill.send_batch([{"to": f"u{i}@example.com", "subject": "s", "body_html": "b"} for i in range(5)])
+
+        assert [r["success"] for r in results] == [True, False, True, False, False]
+        assert "rate limit" in results[4]["error"]
+        assert len(skill._outlook.send_messages.await_args.args[0]) == 3
+        assert 1.0 <= skill._tokens < 1.1   # the failed send's token came back
+
+
+# ── WebResearchSkill concurrency ──────────────────────────────────────────────
+
+class TestWebResearchConcurrency:
+    def _skill(self, execute):
+        from app.skills.available.web_research import WebResearchSkill
+
+        with patch("app.tools.web.scraping_ops.ScrapingOps"), patch("app.tools.web.browser_ops.BrowserOps"):
+            skill = WebResearchSkill({})
+        skill._scraping.execute = execute
+        return skill
+
+    async def test_page_and_contact_scrapes_run_together(self):
+        import asyncio
+
+        running, peak = 0, 0
+
+        async def execute(action, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"success": True, "output": {"scrape_url": "About us", "extract_contact_info": {"email": "a@b.co"}}[action]}
+
+        result = await self._skill(execute).research_company("Acme", website_url="https://acme.example")
+
+        assert peak == 2
+        assert result["output"]["website_content"] == "About us"
+        assert result["output"]["contact_info"] == {"email": "a@b.co"}
+
+    async def test_failed_fetch_is_logged_and_field_dropped(self, caplog):
+        async def execute(action, **kwargs):
+            if action == "extract_contact_info":
+                raise TimeoutError("contact page hung")
+            return {"success": True, "output": "About us"}
+
+        with caplog.at_level("WARNING", logger="mezzofy.skills.web_research"):
+            result = await self._skill(execute).research_company("Acme", website_url="https://acme.example")
+
+        assert result["output"]["website_content"] == "About us"
+        assert "contact_info" not in result["output"]
+        assert "extract_contact_info failed" in caplog.text
+        assert "contact page hung" in caplog.text
+
+    async def test_research_companies_bounded_and_ordered(self):
+        import asyncio
+
+        running, peak = 0, 0
+
+        async def execute(action, url, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"success": True, "output": url}
+
+        skill = self._skill(execute)
+        companies = [{"company_name": f"C{i}", "website_url": f"https://c{i}.example", "focus_areas": ["products"]}
+                     for i in range(6)]
+        results = await skill.research_companies(companies + [{"bogus": 1}], max_concurrency=2)
+
+        assert peak == 2
+        assert [r["output"]["website_content"] for r in results[:6]] == [c["website_url"] for c in companies]
+        assert results[6]["success"] is False
+
+    async def test_contact_fetch_only_when_team_in_focus(self):
+        calls = []
+
+        async def execute(action, **kwargs):
+            calls.append(action)
+            return {"success": True, "output": "x"}
+
+        skill = self._skill(execute)
+        await skill.research_company("Acme", website_url="https://acme.example", focus_areas=["funding"])
+        await skill.research_company("Acme", website_url="https://acme.example", focus_areas=["team"])
+
+        assert calls == ["scrape_url", "scrape_url", "extract_contact_info"]
+
+
+class TestSharedBrowserPool:
+    async def test_contexts_share_one_browser_and_are_closed(self):
+        from unittest.mock import MagicMock
+        from app.tools.web import browser_pool
+
+        contexts = []
+
+        async def new_context(**options):
+            ctx = AsyncMock()
+            ctx.options = options
+            contexts.append(ctx)
+            return ctx
+
+        browser = MagicMock()
+        browser.is_connected.return_value = True
+        browser.new_context = new_context
+        browser.close = AsyncMock()
+        pw = MagicMock()
+        pw.chromium.launch = AsyncMock(return_value=browser)
+        pw.stop = AsyncMock()
+        starter = MagicMock()
+        starter.start = AsyncMock(return_value=pw)
+
+        with patch("playwright.async_api.async_playwright", return_value=starter):
+            async with browser_pool.browser_context({}) as first:
+                pass
+            async with browser_pool.browser_context({}, user_agent="UA") as second:
+                assert second.options == {"user_agent": "UA"}
+            await browser_pool.close_browser_pool()
+
+        assert pw.chromium.launch.await_count == 1
+        assert first is not second
+        first.close.assert_awaited_once()
+        second.close.assert_awaited_once()
+        browser.close.assert_awaited_once()
+        pw.stop.assert_awaited_once()
+
+
+class TestSearchQueryEncoding:
+    async def test_search_web_encodes_reserved_characters(self):
+        from app.skills.available.web_research import WebResearchSkill
+
+        with patch("app.tools.web.scraping_ops.ScrapingOps"), patch("app.tools.web.browser_ops.BrowserOps"):
+            skill = WebResearchSkill({})
+        skill._browser.execute = AsyncMock(return_value={"success": True, "output": "results"})
+
+        await skill.search_web("AT&T #loyalty café", max_results=5)
+
+        url = skill._browser.execute.await_args.kwargs["url"]
+        assert url == "https://www.google.com/search?q=AT%26T+%23loyalty+caf%C3%A9&num=5"
+
+
+class TestLinkedinProspectingLogging:
+    async def test_search_logs_result_count(self, caplog):
+        import logging
+        from app.skills.available.linkedin_prospecting import LinkedinProspectingSkill
+
+        with patch("app.tools.web.linkedin_ops.LinkedInOps"):
+            skill = LinkedinProspectingSkill({})
+        skill._ops.execute = AsyncMock(return_value={
+            "success": True, "output": {"results": [{}] * 7, "count": 7, "query": "fintech"},
+        })
+
+        with caplog.at_level(logging.INFO, logger="mezzofy.skills.linkedin_prospecting"):
+            await skill.search_linkedin("fintech", "people")
+
+        record = caplog.records[-1]
+        assert record.getMessage().endswith("results=7")
+        assert record.results == 7
+
+
+class TestLinkedInBatchExtract:
+    def _ops(self, open_contexts, peak):
+        import asyncio
+        from contextlib import asynccontextmanager
+        from unittest.mock import MagicMock
+        from app.tools.web.linkedin_ops import LinkedInOps
+
+        ops = LinkedInOps({"tools": {"linkedin": {"session_cookie": "cookie", "rate_limit_per_session": 3}}})
+        open_tabs = 0
+
+        async def new_page():
+            nonlocal open_tabs
+            open_tabs += 1
+            peak[0] = max(peak[0], open_tabs)
+            page = MagicMock()
+            page.wait_for_timeout = AsyncMock()
+
+            async def goto(*args, **kwargs):
+                await asyncio.sleep(0.01)
+
+            async def query_selector(selector):
+                el = MagicMock()
+                el.inner_text = AsyncMock(return_value=f"{selector[:4]}")
+                return el
+
+            async def close():
+                nonlocal open_tabs
+                open_tabs -= 1
+
+            page.goto = goto
+            page.query_selector = query_selector
+            page.close = close
+            return page
+
+        @asynccontextmanager
+        async def session():
+            context = MagicMock()
+            context.new_page = new_page
+            open_contexts.append(context)
+            yield context
+
+        ops._session = session
+        return ops
+
+    async def test_one_session_bounded_tabs_and_rate_limit(self):
+        from app.tools.web import linkedin_ops
+
+        contexts, peak = [], [0]
+        ops = self._ops(contexts, peak)
+        urls = [f"https://www.linkedin.com/in/p{i}/" for i in range(4)] + ["https://example.com/x"]
+
+        with patch.object(linkedin_ops, "_session_counter", 0):
+            result = await ops.execute("linkedin_extract_batch", profile_urls=urls, max_concurrency=2)
+
+        assert result["success"] is True
+        profiles = result["output"]["profiles"]
+        assert len(contexts) == 1
+        assert peak[0] == 2
+        assert [p["url"] for p in profiles] == urls
+        assert result["output"]["extracted"] == 3          # rate limit of 3 page loads
+        assert "rate limit" in profiles[3]["error"]
+        assert "Invalid LinkedIn profile URL" in profiles[4]["error"]
+
+    async def test_skill_extract_profile_passes_profile_url(self):
+        from app.skills.available.linkedin_prospecting import LinkedinProspectingSkill
+
+        with patch("app.tools.web.linkedin_ops.LinkedInOps"):
+            skill = LinkedinProspectingSkill({})
+        skill._ops.execute = AsyncMock(return_value={"success": True, "output": {}})
+
+        await skill.extract_profile("https://www.linkedin.com/in/a/")
+        await skill.extract_profiles(["https://www.linkedin.com/in/a/"])
+
+        first, second = skill._ops.execute.await_args_list
+        assert first.kwargs == {"profile_url": "https://www.linkedin.com/in/a/"}
+        assert second.args == ("linkedin_extract_batch",)
+        assert second.kwargs["profile_urls"] == ["https://www.linkedin.com/in/a/"]
@@ -372,6 +372,13 @@ class TestRBACEnforcement:
         assert "*" in get_role_permissions("admin")
         assert has_permission("admin", "any_permission") is True
 
+    def test_role_permission_set_matches_permission_list(self):
+        from app.core.rbac import get_role_permission_set, get_role_permissions
+        perm_set = get_role_permission_set("sales_rep")
+        assert isinstance(perm_set, frozenset)
+        assert perm_set == frozenset(get_role_permissions("sales_rep"))
+        assert get_role_permission_set("no_such_role") == frozenset()
+
     def test_rbac_has_permission_function(self):
         from app.core.rbac import has_permission
         assert has_permission("finance_manager", "finance_read") is True
@@ -452,3 +459,50 @@ class TestWebhookSecurity:
         assert response.status_code == 401
 
 
+# ── Rate limiting (Redis outage fallback) ─────────────────────────────────────
+
+class TestRateLimitFallback:
+    """When Redis is unreachable the process-local window still enforces limits."""
+
+    async def test_redis_down_still_returns_429_after_limit(self):
+        from fastapi import HTTPException
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        from app.core import rate_limiter
+
+        broken = MagicMock()
+        broken.__aenter__ = AsyncMock(side_effect=RedisConnectionError("redis down"))
+        user_id = f"user-{uuid.uuid4()}"
+
+        with patch.object(rate_limiter, "_get_redis", return_value=broken):
+            for _ in range(rate_limiter.USER_LIMIT):
+                assert await rate_limiter.check_rate_limit(MagicMock(), user_id=user_id) is True
+            with pytest.raises(HTTPException) as exc_info:
+                await rate_limiter.check_rate_limit(MagicMock(), user_id=user_id)
+
+        assert exc_info.value.status_code == 429
+
+
+class TestSharedRedisClient:
+    """Request-path Redis users borrow one pooled client instead of building one per call."""
+
+    async def test_rate_limiter_and_otp_reuse_one_client(self):
+        from app.core import otp, rate_limiter
+        from app.core.redis_client import close_redis_clients
+
+        client = MagicMock()
+        client.aclose = AsyncMock()
+        with patch("redis.asyncio.from_url", return_value=client) as from_url:
+            async with rate_limiter._get_redis() as r1:
+                pass
+            async with otp._get_redis() as r2:
+                pass
+            async with rate_limiter._get_redis() as r3:
+                pass
+
+            assert r1 is r2 is r3 is client
+            from_url.assert_called_once()
+            client.aclose.assert_not_called()   # leaving `async with` must not close it
+
+            await close_redis_clients()
+            client.aclose.assert_awaited_once()
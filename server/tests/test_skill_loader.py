@@ -0,0 +1,104 @@
+"""
+SkillLoader unit tests.
+
+Covers:
+  1. load_all() registers skills from YAML without importing their modules
+  2. get() imports and instantiates a skill once, then reuses the instance
+  3. a skill whose class fails to construct is dropped and get() returns None
+  4. skill YAML is re-parsed only when its mtime changes
+  5. _to_class_name() maps every skill file to the class it defines
+  6. skill_registry.get() serves cached instances until reload()
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class TestSkillLoaderLazy:
+    def test_load_all_does_not_import_skill_modules(self):
+        from app.skills.skill_loader import SkillLoader
+
+        loader = SkillLoader()
+        with patch("importlib.import_module") as import_module:
+            loader.load_all({})
+
+        import_module.assert_not_called()
+        assert "web_research" in loader.list_skills()
+        assert loader._skills["web_research"]["instance"] is None
+
+    def test_get_instantiates_once(self):
+        from app.skills.skill_loader import SkillLoader
+
+        loader = SkillLoader()
+        loader.load_all({"tools": {}})
+
+        first = loader.get("cron_validation")
+        second = loader.get("cron_validation")
+
+        assert type(first["instance"]).__name__ == "CronValidationSkill"
+        assert second["instance"] is first["instance"]
+        assert "app.skills.available.cron_validation" in sys.modules
+
+    def test_failed_construction_drops_skill(self):
+        from app.skills.skill_loader import SkillLoader
+
+        loader = SkillLoader()
+        loader.load_all({})
+        with patch(
+            "app.skills.available.cron_validation.CronValidationSkill",
+            side_effect=RuntimeError("boom"),
+        ):
+            assert loader.get("cron_validation") is None
+
+        assert "cron_validation" not in loader.list_skills()
+
+
+class TestSkillYamlCache:
+    def test_unchanged_yaml_parsed_once(self, tmp_path):
+        import os
+        from app.skills import skill_loader
+
+        path = tmp_path / "demo.yaml"
+        path.write_text("name: demo\nversion: 1\n", encoding="utf-8")
+
+        with patch("yaml.load", wraps=skill_loader.yaml.load) as load:
+            first = skill_loader._read_skill_yaml(path)
+            assert skill_loader._read_skill_yaml(path) is first
+            assert load.call_count == 1
+
+            path.write_text("name: demo\nversion: 2\n", encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert skill_loader._read_skill_yaml(path)["version"] == 2
+            assert load.call_count == 2
+
+
+class TestClassNames:
+    def test_every_skill_module_defines_its_class(self):
+        import importlib
+        from app.skills.skill_loader import _AVAILABLE_DIR, SkillLoader
+
+        for yaml_path in _AVAILABLE_DIR.glob("*.yaml"):
+            module = importlib.import_module(f"app.skills.available.{yaml_path.stem}")
+            assert hasattr(module, SkillLoader._to_class_name(yaml_path.stem)), yaml_path.stem
+
+
+class TestSkillRegistryCache:
+    def test_get_caches_instance_until_reload(self):
+        from app.skills import skill_registry
+
+        skill_registry.reload()
+        try:
+            first = skill_registry.get("cron_validation")
+            with patch.object(skill_registry.SkillLoader, "get", side_effect=AssertionError("not cached")):
+                assert skill_registry.get("cron_validation") is first
+
+            skill_registry.reload()
+            assert skill_registry.get("cron_validation") is not first
+            assert skill_registry.get("no_such_skill") is None
+        finally:
+            skill_registry.reload()
@@ -0,0 +1,138 @@
+"""
+Worker event loop unit tests.
+
+Covers:
+  1. run_async() runs every coroutine on the same long-lived loop
+  2. exceptions raised by the coroutine propagate to the caller
+  3. a caller that stops waiting (timeout / soft time limit) cancels the coroutine
+  4. run_async() refuses to run on the loop's own thread
+  5. stop_worker_loop() cancels pending tasks so their cleanup runs, then
+     closes the shared browser and the Graph $batch client
+  6. Celery task bodies no longer dispose the DB pool before running
+"""
+
+import asyncio
+import concurrent.futures
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def worker_loop():
+    from app.tasks import worker_loop
+
+    worker_loop.stop_worker_loop()
+    yield worker_loop
+    worker_loop.stop_worker_loop()
+
+
+class TestRunAsync:
+    def test_reuses_one_loop(self, worker_loop):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = worker_loop.run_async(current_loop())
+        second = worker_loop.run_async(current_loop())
+
+        assert first is second is worker_loop._WORKER_LOOP
+        assert first.is_running()
+
+    def test_exception_propagates(self, worker_loop):
+        async def boom():
+            raise ValueError("bad payload")
+
+        with pytest.raises(ValueError, match="bad payload"):
+            worker_loop.run_async(boom())
+
+    def test_timeout_cancels_coroutine(self, worker_loop):
+        cancelled = concurrent.futures.Future()
+
+        async def slow():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set_result(True)
+                raise
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            worker_loop.run_async(slow(), timeout=0.05)
+
+        assert cancelled.result(timeout=2) is True
+
+    def test_rejects_call_from_loop_thread(self, worker_loop):
+        async def nested():
+            async def inner():
+                return 1
+
+            worker_loop.run_async(inner())
+
+        with pytest.raises(RuntimeError, match="worker event loop"):
+            worker_loop.run_async(nested())
+
+
+class TestStopWorkerLoop:
+    def test_pending_tasks_run_cleanup(self, worker_loop):
+        cleaned = []
+
+        async def background():
+            try:
+                await asyncio.sleep(60)
+            finally:
+                cleaned.append(True)
+
+        async def spawn():
+            asyncio.get_running_loop().create_task(background())
+            await asyncio.sleep(0)
+
+        worker_loop.run_async(spawn())
+        loop = worker_loop._WORKER_LOOP
+        worker_loop.stop_worker_loop()
+
+        assert cleaned == [True]
+        assert loop.is_closed()
+        assert worker_loop._WORKER_LOOP is None
+
+    def test_closes_worker_browser(self, worker_loop):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from app.tools.web import browser_pool
+
+        state = browser_pool._LoopBrowser(1)
+        state.browser = MagicMock(close=AsyncMock())
+        state.playwright = MagicMock(stop=AsyncMock())
+
+        async def register():
+            browser_pool._pools[asyncio.get_running_loop()] = state
+
+        worker_loop.run_async(register())
+        worker_loop.stop_worker_loop()
+
+        state.browser.close.assert_awaited_once()
+        state.playwright.stop.assert_awaited_once()
+
+    def test_closes_worker_batch_http_client(self, worker_loop):
+        async def open_client():
+            from app.tools.communication.outlook_ops import _get_batch_http_client
+            return _get_batch_http_client()
+
+        client = worker_loop.run_async(open_client())
+        worker_loop.stop_worker_loop()
+
+        assert client.is_closed
+
+
+class TestTaskBodies:
+    def test_health_check_uses_worker_loop_without_pool_dispose(self):
+        from unittest.mock import patch
+
+        from app.tasks import tasks
+
+        with patch("app.core.database.engine") as engine, \
+             patch.object(tasks, "run_async") as run_async:
+            tasks.health_check.run()
+
+        engine.sync_engine.dispose.assert_not_called()
+        run_async.assert_called_once()
+        run_async.call_args.args[0].close()